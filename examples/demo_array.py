@@ -4,7 +4,7 @@ Demonstrates basic operations on Array with visualization.
 """
 
 from src.data_structures.array import Array
-from src.visualization.ds_visualizer import DataStructureVisualizer
+from src.visualization import get_ds_visualizer
 
 
 def main():
@@ -15,28 +15,22 @@ def main():
     arr = Array([10, 20, 30])
     print(f"Initial array: {arr.to_list()}")
 
-    # Create visualizer
-    visualizer = DataStructureVisualizer()
-    arr.attach_visualizer(visualizer)
-
-    # Visualize initial state
-    print("\nVisualizing initial array...")
-    visualizer.visualize(arr)
-    visualizer.show()
+    # Collect snapshots and render them together at the end
+    visualizer = get_ds_visualizer()
+    visualizer.reset()
+    snapshots = [arr.get_state()]
 
     # Append operation
     print("\nAppending 40...")
     arr.append(40)
     print(f"Array after append: {arr.to_list()}")
-    visualizer.visualize(arr)
-    visualizer.show()
+    snapshots.append(arr.get_state())
 
     # Insert operation
     print("\nInserting 25 at index 2...")
     arr.insert(2, 25)
     print(f"Array after insert: {arr.to_list()}")
-    visualizer.visualize(arr)
-    visualizer.show()
+    snapshots.append(arr.get_state())
 
     # Search operation
     print("\nSearching for 25...")
@@ -48,12 +42,13 @@ def main():
     value = arr.delete(1)
     print(f"Deleted value: {value}")
     print(f"Array after delete: {arr.to_list()}")
-    visualizer.visualize(arr)
-    visualizer.show()
+    snapshots.append(arr.get_state())
+
+    print("\nVisualizing array operations...")
+    visualizer.show_batch(snapshots)
 
     print("\n=== Demo Complete ===")
 
 
 if __name__ == '__main__':
     main()
-
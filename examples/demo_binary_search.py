@@ -29,8 +29,8 @@ def main():
 
     steps = searcher.execute(arr, target, visualize=True)
 
-    # Check result
-    found_index = arr.search(target)
+    # Reuse the index the search already found
+    found_index = searcher.get_found_index()
     if found_index != -1:
         print(f"\nFound {target} at index: {found_index}")
     else:
@@ -7,16 +7,18 @@ from src.data_structures.array import Array
 from src.algorithms.sorting.bubble_sort import BubbleSort
 from src.algorithms.sorting.insertion_sort import InsertionSort
 from src.algorithms.sorting.selection_sort import SelectionSort
-from src.visualization.comparison_viewer import ComparisonViewer
 
 
 def main():
     """Demonstrate algorithm comparison."""
+    # The viewer pulls in matplotlib, so load it only when the demo runs
+    from src.visualization.comparison_viewer import ComparisonViewer
+
     print("=== Algorithm Comparison Demo ===\n")
 
     # Create test data
     input_data = [64, 34, 25, 12, 22, 11, 90]
-    arr = Array(input_data.copy())
+    arr = Array(input_data)
 
     print(f"Input: {input_data}\n")
 
@@ -26,7 +26,7 @@ def main():
 
     for key in keys:
         steps = pg.insert(key, f"value_{key}")
-        print(f"  Inserted {key}:{pg.hash_table.get(key)}")
+        print(f"  Inserted {key}:{steps[-1]['value']}")
         print(f"    Size: {len(pg.hash_table)}, Load Factor: {pg.hash_table.get_load_factor():.2f}")
 
     # Visualize final state
@@ -43,7 +43,7 @@ def main():
     print("-" * 60)
     for key in ["apple", "banana", "nonexistent"]:
         steps = pg.get(key)
-        value = pg.hash_table.get(key)
+        value = steps[-1]["value"]
         if value:
             print(f"  Found {key}: {value}")
         else:
@@ -5,12 +5,14 @@ Demonstrates play/pause/step controls for algorithm visualizations.
 
 from src.data_structures.array import Array
 from src.algorithms.sorting.bubble_sort import BubbleSort
-from src.visualization.interactive_controls import InteractiveControls
-from src.visualization.algo_visualizer import AlgorithmVisualizer
+from src.visualization import get_algo_visualizer
 
 
 def main():
     """Demonstrate interactive controls."""
+    # The controls build matplotlib widgets, so load them only when the demo runs
+    from src.visualization.interactive_controls import InteractiveControls
+
     print("=== Interactive Controls Demo ===\n")
 
     # Create array and run algorithm
@@ -23,7 +25,8 @@ def main():
     print(f"Total steps: {len(steps)}")
 
     # Create visualizer
-    visualizer = AlgorithmVisualizer()
+    visualizer = get_algo_visualizer()
+    visualizer.reset()
 
     # Show with interactive controls
     print("\nLaunching interactive visualization...")
@@ -4,7 +4,7 @@ Demonstrates basic operations on Linked List with visualization.
 """
 
 from src.data_structures.linked_list import LinkedList
-from src.visualization.ds_visualizer import DataStructureVisualizer
+from src.visualization import get_ds_visualizer
 
 
 def main():
@@ -15,28 +15,22 @@ def main():
     ll = LinkedList([1, 2, 3])
     print(f"Initial linked list: {ll.to_list()}")
 
-    # Create visualizer
-    visualizer = DataStructureVisualizer()
-    ll.attach_visualizer(visualizer)
-
-    # Visualize initial state
-    print("\nVisualizing initial linked list...")
-    visualizer.visualize(ll)
-    visualizer.show()
+    # Collect snapshots and render them together at the end
+    visualizer = get_ds_visualizer()
+    visualizer.reset()
+    snapshots = [ll.get_state()]
 
     # Append operation
     print("\nAppending 4...")
     ll.append(4)
     print(f"Linked list after append: {ll.to_list()}")
-    visualizer.visualize(ll)
-    visualizer.show()
+    snapshots.append(ll.get_state())
 
     # Insert operation
     print("\nInserting 10 at index 2...")
     ll.insert(2, 10)
     print(f"Linked list after insert: {ll.to_list()}")
-    visualizer.visualize(ll)
-    visualizer.show()
+    snapshots.append(ll.get_state())
 
     # Search operation
     print("\nSearching for 10...")
@@ -48,12 +42,13 @@ def main():
     value = ll.delete(1)
     print(f"Deleted value: {value}")
     print(f"Linked list after delete: {ll.to_list()}")
-    visualizer.visualize(ll)
-    visualizer.show()
+    snapshots.append(ll.get_state())
+
+    print("\nVisualizing linked list operations...")
+    visualizer.show_batch(snapshots)
 
     print("\n=== Demo Complete ===")
 
 
 if __name__ == '__main__':
     main()
-
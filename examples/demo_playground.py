@@ -6,8 +6,6 @@ Demonstrates the visual learning playground features.
 from src.playground.sorting_playground import SortingPlayground
 from src.playground.searching_playground import SearchingPlayground
 from src.playground.input_builder import InputBuilder
-from src.visualization.comparison_viewer import ComparisonViewer
-from src.data_structures.array import Array
 
 
 def main():
@@ -24,8 +22,8 @@ def main():
     print(f"Input: {input_data}")
 
     # Run algorithm
-    steps = pg.run_algorithm('bubble_sort')
-    print(f"Bubble Sort - Total steps: {len(steps)}")
+    stats = pg.count_steps('bubble_sort')
+    print(f"Bubble Sort - Total steps: {stats['total_steps']}")
 
     # Compare algorithms
     print("\nComparing algorithms...")
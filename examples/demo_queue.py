@@ -4,7 +4,7 @@ Demonstrates FIFO operations on Queue with visualization.
 """
 
 from src.data_structures.queue import Queue
-from src.visualization.ds_visualizer import DataStructureVisualizer
+from src.visualization import get_ds_visualizer
 
 
 def main():
@@ -15,9 +15,10 @@ def main():
     queue = Queue()
     print("Initial queue: Empty")
 
-    # Create visualizer
-    visualizer = DataStructureVisualizer()
-    queue.attach_visualizer(visualizer)
+    # Collect snapshots and render them together at the end
+    visualizer = get_ds_visualizer()
+    visualizer.reset()
+    snapshots = []
 
     # Enqueue operations
     print("\nEnqueuing elements: 10, 20, 30")
@@ -25,8 +26,7 @@ def main():
     queue.enqueue(20)
     queue.enqueue(30)
     print(f"Queue after enqueues: {queue.to_list()}")
-    visualizer.visualize(queue)
-    visualizer.show()
+    snapshots.append(queue.get_state())
 
     # Peek operation
     print(f"\nPeeking at front: {queue.peek()}")
@@ -38,12 +38,13 @@ def main():
         print(f"  Dequeued: {value}")
         print(f"  Queue: {queue.to_list()}")
         if not queue.is_empty():
-            visualizer.visualize(queue)
-            visualizer.show()
+            snapshots.append(queue.get_state())
+
+    print("\nVisualizing queue operations...")
+    visualizer.show_batch(snapshots)
 
     print("\n=== Demo Complete ===")
 
 
 if __name__ == '__main__':
     main()
-
@@ -4,7 +4,7 @@ Demonstrates LIFO operations on Stack with visualization.
 """
 
 from src.data_structures.stack import Stack
-from src.visualization.ds_visualizer import DataStructureVisualizer
+from src.visualization import get_ds_visualizer
 
 
 def main():
@@ -15,9 +15,10 @@ def main():
     stack = Stack()
     print("Initial stack: Empty")
 
-    # Create visualizer
-    visualizer = DataStructureVisualizer()
-    stack.attach_visualizer(visualizer)
+    # Collect snapshots and render them together at the end
+    visualizer = get_ds_visualizer()
+    visualizer.reset()
+    snapshots = []
 
     # Push operations
     print("\nPushing elements: 10, 20, 30")
@@ -25,8 +26,7 @@ def main():
     stack.push(20)
     stack.push(30)
     print(f"Stack after pushes: {stack.to_list()}")
-    visualizer.visualize(stack)
-    visualizer.show()
+    snapshots.append(stack.get_state())
 
     # Peek operation
     print(f"\nPeeking at top: {stack.peek()}")
@@ -38,12 +38,13 @@ def main():
         print(f"  Popped: {value}")
         print(f"  Stack: {stack.to_list()}")
         if not stack.is_empty():
-            visualizer.visualize(stack)
-            visualizer.show()
+            snapshots.append(stack.get_state())
+
+    print("\nVisualizing stack operations...")
+    visualizer.show_batch(snapshots)
 
     print("\n=== Demo Complete ===")
 
 
 if __name__ == '__main__':
     main()
-
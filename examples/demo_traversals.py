@@ -62,16 +62,14 @@ def main():
 
     # BFS
     print("\nBFS Traversal from A:")
+    print(f"  Order: {pg_graph.bfs_order('A')}")
     steps_bfs = pg_graph.run_bfs("A")
-    traversal_order = [step.get("current_vertex") for step in steps_bfs if step.get("current_vertex")]
-    print(f"  Order: {traversal_order}")
     pg_graph.visualize(steps_bfs, interactive=True)
 
     # DFS
     print("\nDFS Traversal from A:")
+    print(f"  Order: {pg_graph.dfs_order('A')}")
     steps_dfs = pg_graph.run_dfs("A")
-    traversal_order = [step.get("current_vertex") for step in steps_dfs if step.get("current_vertex")]
-    print(f"  Order: {traversal_order}")
     pg_graph.visualize(steps_dfs, interactive=True)
 
 
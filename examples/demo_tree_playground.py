@@ -30,9 +30,13 @@ def main():
     # Demonstrate traversals
     print("\n2. Tree Traversals")
     print("-" * 60)
-    for traversal_type in ["inorder", "preorder", "postorder", "levelorder"]:
-        traversal = getattr(pg_bst.tree, f"{traversal_type}_traversal")()
-        print(f"{traversal_type.title()}: {traversal}")
+    traversals = {
+        "inorder": pg_bst.tree.inorder_traversal,
+        "preorder": pg_bst.tree.preorder_traversal,
+        "postorder": pg_bst.tree.postorder_traversal,
+    }
+    for traversal_type, traverse in traversals.items():
+        print(f"{traversal_type.title()}: {traverse()}")
 
     # Demonstrate search
     print("\n3. Search Operation")
@@ -0,0 +1,176 @@
+"""
+Step-free graph traversal kernels over CSR adjacency arrays.
+
+The kernels work on integer vertex indices as produced by ``Graph.to_csr``
+and return only the traversal order. Visited flags live in a ``bytearray``
+so the hot loop does no hashing.
+"""
+
+from typing import Any, Callable, List, Optional, Sequence
+
+
+def bfs_csr(indptr: Sequence[int], indices: Sequence[int], source: int) -> List[int]:
+    """
+    Breadth-first traversal order from a source vertex.
+
+    Args:
+        indptr: CSR row pointer (length V + 1)
+        indices: CSR column indices (neighbor vertex indices)
+        source: Index of the start vertex
+
+    Returns:
+        Vertex indices in the order BFS visits them
+    """
+    visited = bytearray(len(indptr) - 1)
+    visited[source] = 1
+
+    # The traversal order doubles as the FIFO queue
+    order = [source]
+    append = order.append
+    head = 0
+    while head < len(order):
+        u = order[head]
+        head += 1
+        for v in indices[indptr[u]:indptr[u + 1]]:
+            if not visited[v]:
+                visited[v] = 1
+                append(v)
+
+    return order
+
+
+def dfs_csr(indptr: Sequence[int], indices: Sequence[int], source: int) -> List[int]:
+    """
+    Depth-first traversal order from a source vertex.
+
+    Uses the same explicit-stack strategy as the DFS algorithm: neighbors are
+    pushed in reverse so they are visited left to right.
+
+    Args:
+        indptr: CSR row pointer (length V + 1)
+        indices: CSR column indices (neighbor vertex indices)
+        source: Index of the start vertex
+
+    Returns:
+        Vertex indices in the order DFS visits them
+    """
+    visited = bytearray(len(indptr) - 1)
+    order = []
+    stack = [source]
+    append, push, pop = order.append, stack.append, stack.pop
+
+    while stack:
+        u = pop()
+        if visited[u]:
+            continue
+        visited[u] = 1
+        append(u)
+
+        for e in range(indptr[u + 1] - 1, indptr[u] - 1, -1):
+            v = indices[e]
+            if not visited[v]:
+                push(v)
+
+    return order
+
+
+def csr_traversal(graph, start_vertex: Any,
+                  kernel: Callable[[Sequence[int], Sequence[int], int], List[int]]
+                  ) -> Optional[List[Any]]:
+    """
+    Run a CSR kernel on a Graph and map the order back to vertex labels.
+
+    Args:
+        graph: Graph to traverse (its cached CSR lookup is used)
+        start_vertex: Starting vertex
+        kernel: ``bfs_csr`` or ``dfs_csr``
+
+    Returns:
+        Vertices in visiting order, or None if start_vertex is not in the graph
+    """
+    indptr, indices, labels, index_of, is_identity = graph.csr_lookup()
+    source = index_of.get(start_vertex)
+    if source is None:
+        return None
+
+    order = kernel(indptr, indices, source)
+
+    # Vertices that are their own indices need no mapping back
+    if is_identity:
+        return order
+    return [labels[i] for i in order]
+
+
+# Frontier size from which a BFS level is expanded with NumPy instead of a
+# Python loop
+FRONTIER_THRESHOLD = 1024
+
+
+def bfs_csr_levels(indptr: Sequence[int], indices: Sequence[int], source: int,
+                   frontier_threshold: int = FRONTIER_THRESHOLD) -> List[int]:
+    """
+    Level-synchronous breadth-first traversal order from a source vertex.
+
+    Each BFS level (frontier) is expanded as a whole. Small frontiers use a
+    plain loop; frontiers of at least ``frontier_threshold`` vertices gather
+    all their neighbors at once with vectorized NumPy operations and keep the
+    first occurrence of each unvisited one. The order is identical to
+    ``bfs_csr``.
+
+    Args:
+        indptr: CSR row pointer (length V + 1)
+        indices: CSR column indices (neighbor vertex indices)
+        source: Index of the start vertex
+        frontier_threshold: Minimum frontier size for the vectorized expansion
+
+    Returns:
+        Vertex indices in the order BFS visits them
+    """
+    visited = bytearray(len(indptr) - 1)
+    visited[source] = 1
+
+    order = [source]
+    frontier = [source]
+    arrays = None
+
+    while frontier:
+        if len(frontier) >= frontier_threshold:
+            if arrays is None:
+                import numpy as np
+
+                # NumPy views share memory with the loop's data structures
+                arrays = (
+                    np.asarray(indptr, dtype=np.int64),
+                    np.asarray(indices, dtype=np.int64),
+                    np.frombuffer(visited, dtype=np.uint8),
+                )
+            indptr_arr, indices_arr, visited_arr = arrays
+
+            # Gather the neighbor lists of the whole frontier, in order
+            rows = np.asarray(frontier, dtype=np.int64)
+            starts = indptr_arr[rows]
+            lengths = indptr_arr[rows + 1] - starts
+            ends = np.cumsum(lengths)
+            positions = np.arange(ends[-1] if len(ends) else 0)
+            positions += np.repeat(starts - (ends - lengths), lengths)
+            neighbors = indices_arr[positions]
+
+            # Keep the first occurrence of every unvisited neighbor
+            neighbors = neighbors[visited_arr[neighbors] == 0]
+            _, first = np.unique(neighbors, return_index=True)
+            next_frontier = neighbors[np.sort(first)]
+            visited_arr[next_frontier] = 1
+            next_frontier = next_frontier.tolist()
+        else:
+            next_frontier = []
+            append = next_frontier.append
+            for u in frontier:
+                for v in indices[indptr[u]:indptr[u + 1]]:
+                    if not visited[v]:
+                        visited[v] = 1
+                        append(v)
+
+        order.extend(next_frontier)
+        frontier = next_frontier
+
+    return order
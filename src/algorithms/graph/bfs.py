@@ -2,9 +2,11 @@
 Breadth-First Search (BFS) algorithm implementation with step tracking.
 """
 
-from typing import List, Dict, Any, Optional, Set
+from typing import List, Dict, Any, Iterator, Optional, Set
 from ...visualization.base import BaseAlgorithm
+from ...visualization.step_views import SliceView
 from ...data_structures.graph import Graph
+from ._kernels import bfs_csr_levels, csr_traversal
 
 
 class BFS(BaseAlgorithm):
@@ -30,76 +32,112 @@ class BFS(BaseAlgorithm):
         # Get start vertex from instance variable
         start_vertex = getattr(self, '_start_vertex', None)
 
-        if start_vertex is None or not isinstance(data_structure, Graph):
+        if start_vertex is None:
             return
 
         graph = data_structure
         step_number = 0
+        # Without step recording only the final step is built
+        record = self._record_steps
+
+        if not record:
+            # Nothing to show along the way: run the step-free kernel over
+            # the graph's cached CSR view and report just the result. The
+            # recorded run takes one step to start, two per processed vertex,
+            # one per discovery after the start vertex and one to finish.
+            order = csr_traversal(graph, start_vertex, bfs_csr_levels)
+            if order is not None:
+                yield self._complete_step(graph, start_vertex, order,
+                                          3 * len(order) + 1)
+                return
 
         # Initialize
-        visited: Set[Any] = set()
-        queue: List[Any] = [start_vertex]
-        visited.add(start_vertex)
-        traversal_order: List[Any] = []
+        # Graphs numbered 0..V-1 track visited vertices in a byte map
+        integer_ids = (graph.is_integer_indexed() and type(start_vertex) is int
+                       and 0 <= start_vertex < len(graph))
+        if integer_ids:
+            visited = bytearray(len(graph))
+            visited[start_vertex] = 1
+        else:
+            visited: Set[Any] = {start_vertex}
+
+        # Vertices are enqueued exactly once, in discovery order, so a single
+        # append-only list holds all the state: discovered[:head] is the
+        # traversal order and discovered[head:] is the queue. Steps take O(1)
+        # snapshots of it instead of copying the containers.
+        discovered: List[Any] = [start_vertex]
+        head = 0
+        discover, neighbors_of = discovered.append, graph.neighbors_view
 
         step_number += 1
-        yield {
-            'algorithm': self._name,
-            'step_number': step_number,
-            'description': f'Starting BFS from vertex {start_vertex}',
-            'data_structure': graph,
-            'start_vertex': start_vertex,
-            'current_vertex': start_vertex,
-            'visited': list(visited.copy()),
-            'queue': queue.copy(),
-            'traversal_order': traversal_order.copy(),
-            'phase': 'initialization'
-        }
-
-        while queue:
-            # Dequeue a vertex
-            current = queue.pop(0)
-            traversal_order.append(current)
-
-            step_number += 1
+        if record:
             yield {
                 'algorithm': self._name,
                 'step_number': step_number,
-                'description': f'Processing vertex {current}',
+                'description': f'Starting BFS from vertex {start_vertex}',
                 'data_structure': graph,
                 'start_vertex': start_vertex,
-                'current_vertex': current,
-                'visited': list(visited.copy()),
-                'queue': queue.copy(),
-                'traversal_order': traversal_order.copy(),
-                'phase': 'processing'
+                'current_vertex': start_vertex,
+                'visited': SliceView(discovered),
+                'queue': SliceView(discovered, head),
+                'traversal_order': SliceView(discovered, 0, head),
+                'phase': 'initialization'
             }
 
+        while head < len(discovered):
+            # Dequeue a vertex
+            current = discovered[head]
+            head += 1
+
+            step_number += 1
+            if record:
+                yield {
+                    'algorithm': self._name,
+                    'step_number': step_number,
+                    'description': f'Processing vertex {current}',
+                    'data_structure': graph,
+                    'start_vertex': start_vertex,
+                    'current_vertex': current,
+                    'visited': SliceView(discovered),
+                    'queue': SliceView(discovered, head),
+                    'traversal_order': SliceView(discovered, 0, head),
+                    'phase': 'processing'
+                }
+
             # Get neighbors
-            neighbors = graph.get_neighbors(current)
+            neighbor_vertices = neighbors_of(current)
 
             step_number += 1
-            yield {
-                'algorithm': self._name,
-                'step_number': step_number,
-                'description': f'Exploring neighbors of {current}: {[n[0] for n in neighbors]}',
-                'data_structure': graph,
-                'start_vertex': start_vertex,
-                'current_vertex': current,
-                'visited': list(visited.copy()),
-                'queue': queue.copy(),
-                'traversal_order': traversal_order.copy(),
-                'neighbors': [n[0] for n in neighbors],
-                'phase': 'exploring'
-            }
+            if record:
+                neighbors = list(neighbor_vertices)
+                yield {
+                    'algorithm': self._name,
+                    'step_number': step_number,
+                    'description': f'Exploring neighbors of {current}: {neighbors}',
+                    'data_structure': graph,
+                    'start_vertex': start_vertex,
+                    'current_vertex': current,
+                    'visited': SliceView(discovered),
+                    'queue': SliceView(discovered, head),
+                    'traversal_order': SliceView(discovered, 0, head),
+                    'neighbors': neighbors,
+                    'phase': 'exploring'
+                }
 
             # Visit unvisited neighbors
-            for neighbor, weight in neighbors:
-                if neighbor not in visited:
+            for neighbor in neighbor_vertices:
+                if integer_ids:
+                    if visited[neighbor]:
+                        continue
+                    visited[neighbor] = 1
+                elif neighbor in visited:
+                    continue
+                else:
                     visited.add(neighbor)
-                    queue.append(neighbor)
+                discover(neighbor)
 
-                    step_number += 1
+                step_number += 1
+                if record:
                     yield {
                         'algorithm': self._name,
                         'step_number': step_number,
@@ -107,29 +145,46 @@ class BFS(BaseAlgorithm):
                         'data_structure': graph,
                         'start_vertex': start_vertex,
                         'current_vertex': current,
-                        'visited': list(visited.copy()),
-                        'queue': queue.copy(),
-                        'traversal_order': traversal_order.copy(),
+                        'visited': SliceView(discovered),
+                        'queue': SliceView(discovered, head),
+                        'traversal_order': SliceView(discovered, 0, head),
                         'discovered_vertex': neighbor,
                         'phase': 'discovery'
                     }
 
         # Final step
         step_number += 1
-        yield {
+        yield self._complete_step(graph, start_vertex, discovered, step_number)
+
+    def _complete_step(self, graph: Graph, start_vertex: Any, order: List[Any],
+                       step_number: int) -> Dict[str, Any]:
+        """
+        Build the final step of a traversal.
+
+        Args:
+            graph: The traversed graph
+            start_vertex: The starting vertex
+            order: Vertices in visiting order
+            step_number: Number of this step
+
+        Returns:
+            Dictionary containing step information
+        """
+        return {
             'algorithm': self._name,
             'step_number': step_number,
-            'description': f'BFS complete. Traversal order: {traversal_order}',
+            'description': f'BFS complete. Traversal order: {order}',
             'data_structure': graph,
             'start_vertex': start_vertex,
             'current_vertex': None,
-            'visited': list(visited.copy()),
+            'visited': SliceView(order),
             'queue': [],
-            'traversal_order': traversal_order.copy(),
+            'traversal_order': SliceView(order),
             'phase': 'complete'
         }
 
-    def execute(self, data_structure, start_vertex: Any, visualize: bool = True) -> List[Dict[str, Any]]:
+    def execute(self, data_structure, start_vertex: Any, visualize: bool = True,
+                record_steps: bool = True) -> List[Dict[str, Any]]:
         """
         Execute BFS from a start vertex.
 
@@ -137,10 +192,40 @@ class BFS(BaseAlgorithm):
             data_structure: The graph to traverse
             start_vertex: The starting vertex
             visualize: Whether to visualize during execution
+            record_steps: Whether to record intermediate steps (only the
+                final step is returned when False)
 
         Returns:
             List of execution steps
+
+        Raises:
+            TypeError: If data_structure is not a Graph
+        """
+        if not isinstance(data_structure, Graph):
+            raise TypeError(f"BFS requires a Graph, got {type(data_structure).__name__}")
+        self._start_vertex = start_vertex
+        return super().execute(data_structure, visualize, record_steps)
+
+    def execute_iter(self, data_structure, start_vertex: Any, visualize: bool = True,
+                     record_steps: bool = True) -> Iterator[Dict[str, Any]]:
+        """
+        Execute BFS from a start vertex, yielding steps without storing them.
+
+        Args:
+            data_structure: The graph to traverse
+            start_vertex: The starting vertex
+            visualize: Whether to visualize during execution
+            record_steps: Whether to record intermediate steps (only the
+                final step is yielded when False)
+
+        Returns:
+            Iterator over execution steps
+
+        Raises:
+            TypeError: If data_structure is not a Graph
         """
+        if not isinstance(data_structure, Graph):
+            raise TypeError(f"BFS requires a Graph, got {type(data_structure).__name__}")
         self._start_vertex = start_vertex
-        return super().execute(data_structure, visualize)
+        return super().execute_iter(data_structure, visualize, record_steps)
 
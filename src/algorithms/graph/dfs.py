@@ -2,8 +2,9 @@
 Depth-First Search (DFS) algorithm implementation with step tracking.
 """
 
-from typing import List, Dict, Any, Optional, Set
+from typing import List, Dict, Any, Iterator, Optional, Set
 from ...visualization.base import BaseAlgorithm
+from ...visualization.step_views import ChainView, SliceView, chain_push
 from ...data_structures.graph import Graph
 
 
@@ -30,134 +31,172 @@ class DFS(BaseAlgorithm):
         # Get start vertex from instance variable
         start_vertex = getattr(self, '_start_vertex', None)
 
-        if start_vertex is None or not isinstance(data_structure, Graph):
+        if start_vertex is None:
             return
 
         graph = data_structure
         step_number = 0
+        # Without step recording only the final step is built
+        record = self._record_steps
 
         # Initialize
-        visited: Set[Any] = set()
-        stack: List[Any] = [start_vertex]
+        # Graphs numbered 0..V-1 track visited vertices in a byte map
+        integer_ids = (graph.is_integer_indexed() and type(start_vertex) is int
+                       and 0 <= start_vertex < len(graph))
+        visited = bytearray(len(graph)) if integer_ids else set()
+
+        # Each vertex is visited and appended to the traversal order together,
+        # so one append-only list backs both. The stack and path are persistent
+        # linked stacks. Steps take O(1) snapshots instead of copies. The path
+        # only feeds the steps, so it is not tracked when they are skipped.
         traversal_order: List[Any] = []
-        path: List[Any] = []
+        stack = chain_push(None, start_vertex)
+        path = None
+        visit, neighbors_of = traversal_order.append, graph.neighbors_view
 
         step_number += 1
-        yield {
-            'algorithm': self._name,
-            'step_number': step_number,
-            'description': f'Starting DFS from vertex {start_vertex}',
-            'data_structure': graph,
-            'start_vertex': start_vertex,
-            'current_vertex': start_vertex,
-            'visited': list(visited.copy()),
-            'stack': stack.copy(),
-            'traversal_order': traversal_order.copy(),
-            'path': path.copy(),
-            'phase': 'initialization'
-        }
+        if record:
+            yield {
+                'algorithm': self._name,
+                'step_number': step_number,
+                'description': f'Starting DFS from vertex {start_vertex}',
+                'data_structure': graph,
+                'start_vertex': start_vertex,
+                'current_vertex': start_vertex,
+                'visited': SliceView(traversal_order),
+                'stack': ChainView(stack),
+                'traversal_order': SliceView(traversal_order),
+                'path': ChainView(path),
+                'phase': 'initialization'
+            }
 
         while stack:
             # Pop a vertex from stack
-            current = stack.pop()
-            path.append(current)
+            current, stack = stack[0], stack[1]
+            if record:
+                path = chain_push(path, current)
 
-            if current not in visited:
-                visited.add(current)
-                traversal_order.append(current)
+            if not (visited[current] if integer_ids else current in visited):
+                if integer_ids:
+                    visited[current] = 1
+                else:
+                    visited.add(current)
+                visit(current)
 
                 step_number += 1
-                yield {
-                    'algorithm': self._name,
-                    'step_number': step_number,
-                    'description': f'Visiting vertex {current}',
-                    'data_structure': graph,
-                    'start_vertex': start_vertex,
-                    'current_vertex': current,
-                    'visited': list(visited.copy()),
-                    'stack': stack.copy(),
-                    'traversal_order': traversal_order.copy(),
-                    'path': path.copy(),
-                    'phase': 'visiting'
-                }
+                if record:
+                    yield {
+                        'algorithm': self._name,
+                        'step_number': step_number,
+                        'description': f'Visiting vertex {current}',
+                        'data_structure': graph,
+                        'start_vertex': start_vertex,
+                        'current_vertex': current,
+                        'visited': SliceView(traversal_order),
+                        'stack': ChainView(stack),
+                        'traversal_order': SliceView(traversal_order),
+                        'path': ChainView(path),
+                        'phase': 'visiting'
+                    }
 
                 # Get neighbors
-                neighbors = graph.get_neighbors(current)
+                neighbor_vertices = neighbors_of(current)
 
                 step_number += 1
-                yield {
-                    'algorithm': self._name,
-                    'step_number': step_number,
-                    'description': f'Exploring neighbors of {current}: {[n[0] for n in neighbors]}',
-                    'data_structure': graph,
-                    'start_vertex': start_vertex,
-                    'current_vertex': current,
-                    'visited': list(visited.copy()),
-                    'stack': stack.copy(),
-                    'traversal_order': traversal_order.copy(),
-                    'path': path.copy(),
-                    'neighbors': [n[0] for n in neighbors],
-                    'phase': 'exploring'
-                }
+                if record:
+                    neighbors = list(neighbor_vertices)
+                    yield {
+                        'algorithm': self._name,
+                        'step_number': step_number,
+                        'description': f'Exploring neighbors of {current}: {neighbors}',
+                        'data_structure': graph,
+                        'start_vertex': start_vertex,
+                        'current_vertex': current,
+                        'visited': SliceView(traversal_order),
+                        'stack': ChainView(stack),
+                        'traversal_order': SliceView(traversal_order),
+                        'path': ChainView(path),
+                        'neighbors': neighbors,
+                        'phase': 'exploring'
+                    }
 
                 # Push unvisited neighbors onto stack
-                for neighbor, weight in reversed(neighbors):  # Reverse to maintain left-to-right order
-                    if neighbor not in visited:
-                        stack.append(neighbor)
+                for neighbor in reversed(neighbor_vertices):  # Reverse to maintain left-to-right order
+                    if not (visited[neighbor] if integer_ids else neighbor in visited):
+                        stack = chain_push(stack, neighbor)
 
                         step_number += 1
-                        yield {
-                            'algorithm': self._name,
-                            'step_number': step_number,
-                            'description': f'Pushing unvisited neighbor {neighbor} onto stack',
-                            'data_structure': graph,
-                            'start_vertex': start_vertex,
-                            'current_vertex': current,
-                            'visited': list(visited.copy()),
-                            'stack': stack.copy(),
-                            'traversal_order': traversal_order.copy(),
-                            'path': path.copy(),
-                            'discovered_vertex': neighbor,
-                            'phase': 'discovery'
-                        }
+                        if record:
+                            yield {
+                                'algorithm': self._name,
+                                'step_number': step_number,
+                                'description': f'Pushing unvisited neighbor {neighbor} onto stack',
+                                'data_structure': graph,
+                                'start_vertex': start_vertex,
+                                'current_vertex': current,
+                                'visited': SliceView(traversal_order),
+                                'stack': ChainView(stack),
+                                'traversal_order': SliceView(traversal_order),
+                                'path': ChainView(path),
+                                'discovered_vertex': neighbor,
+                                'phase': 'discovery'
+                            }
             else:
                 # Backtracking
                 step_number += 1
-                yield {
-                    'algorithm': self._name,
-                    'step_number': step_number,
-                    'description': f'Backtracking from {current} (already visited)',
-                    'data_structure': graph,
-                    'start_vertex': start_vertex,
-                    'current_vertex': current,
-                    'visited': list(visited.copy()),
-                    'stack': stack.copy(),
-                    'traversal_order': traversal_order.copy(),
-                    'path': path.copy(),
-                    'phase': 'backtracking'
-                }
+                if record:
+                    yield {
+                        'algorithm': self._name,
+                        'step_number': step_number,
+                        'description': f'Backtracking from {current} (already visited)',
+                        'data_structure': graph,
+                        'start_vertex': start_vertex,
+                        'current_vertex': current,
+                        'visited': SliceView(traversal_order),
+                        'stack': ChainView(stack),
+                        'traversal_order': SliceView(traversal_order),
+                        'path': ChainView(path),
+                        'phase': 'backtracking'
+                    }
 
                 # Remove from path when backtracking
-                if path and path[-1] == current:
-                    path.pop()
+                if path and path[0] == current:
+                    path = path[1]
 
         # Final step
         step_number += 1
-        yield {
+        yield self._complete_step(graph, start_vertex, traversal_order, step_number)
+
+    def _complete_step(self, graph: Graph, start_vertex: Any, order: List[Any],
+                       step_number: int) -> Dict[str, Any]:
+        """
+        Build the final step of a traversal.
+
+        Args:
+            graph: The traversed graph
+            start_vertex: The starting vertex
+            order: Vertices in visiting order
+            step_number: Number of this step
+
+        Returns:
+            Dictionary containing step information
+        """
+        return {
             'algorithm': self._name,
             'step_number': step_number,
-            'description': f'DFS complete. Traversal order: {traversal_order}',
+            'description': f'DFS complete. Traversal order: {order}',
             'data_structure': graph,
             'start_vertex': start_vertex,
             'current_vertex': None,
-            'visited': list(visited.copy()),
+            'visited': SliceView(order),
             'stack': [],
-            'traversal_order': traversal_order.copy(),
+            'traversal_order': SliceView(order),
             'path': [],
             'phase': 'complete'
         }
 
-    def execute(self, data_structure, start_vertex: Any, visualize: bool = True) -> List[Dict[str, Any]]:
+    def execute(self, data_structure, start_vertex: Any, visualize: bool = True,
+                record_steps: bool = True) -> List[Dict[str, Any]]:
         """
         Execute DFS from a start vertex.
 
@@ -165,10 +204,40 @@ class DFS(BaseAlgorithm):
             data_structure: The graph to traverse
             start_vertex: The starting vertex
             visualize: Whether to visualize during execution
+            record_steps: Whether to record intermediate steps (only the
+                final step is returned when False)
 
         Returns:
             List of execution steps
+
+        Raises:
+            TypeError: If data_structure is not a Graph
+        """
+        if not isinstance(data_structure, Graph):
+            raise TypeError(f"DFS requires a Graph, got {type(data_structure).__name__}")
+        self._start_vertex = start_vertex
+        return super().execute(data_structure, visualize, record_steps)
+
+    def execute_iter(self, data_structure, start_vertex: Any, visualize: bool = True,
+                     record_steps: bool = True) -> Iterator[Dict[str, Any]]:
+        """
+        Execute DFS from a start vertex, yielding steps without storing them.
+
+        Args:
+            data_structure: The graph to traverse
+            start_vertex: The starting vertex
+            visualize: Whether to visualize during execution
+            record_steps: Whether to record intermediate steps (only the
+                final step is yielded when False)
+
+        Returns:
+            Iterator over execution steps
+
+        Raises:
+            TypeError: If data_structure is not a Graph
         """
+        if not isinstance(data_structure, Graph):
+            raise TypeError(f"DFS requires a Graph, got {type(data_structure).__name__}")
         self._start_vertex = start_vertex
-        return super().execute(data_structure, visualize)
+        return super().execute_iter(data_structure, visualize, record_steps)
 
@@ -2,7 +2,7 @@
 Binary Search algorithm implementation with step tracking.
 """
 
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List
 
 from ...visualization.base import BaseAlgorithm
 
@@ -17,6 +17,7 @@ class BinarySearch(BaseAlgorithm):
         """Initialize the binary search algorithm."""
         super().__init__()
         self._name = "Binary Search"
+        self._found_index = -1
 
     def _run(self, data_structure):
         """
@@ -30,12 +31,15 @@ class BinarySearch(BaseAlgorithm):
         """
         # Get target from instance variable
         target = getattr(self, "_target", None)
+        self._found_index = -1
 
         if target is None:
             return
 
         arr = data_structure
         step_number = 0
+        # Without step recording only the final step is built
+        record = self._record_steps
 
         left = 0
         right = len(arr) - 1
@@ -43,93 +47,100 @@ class BinarySearch(BaseAlgorithm):
         step_number += 1
 
         # Yield step: initialization
-        yield {
-            "algorithm": self._name,
-            "step_number": step_number,
-            "description": f"Initializing search for {target}",
-            "data_structure": arr,
-            "target": target,
-            "current_index": -1,
-            "found_index": -1,
-            "left": left,
-            "right": right,
-            "mid": -1,
-        }
-
-        while left <= right:
-            mid = (left + right) // 2
-
-            step_number += 1
-
-            # Yield step: checking middle element
+        if record:
             yield {
                 "algorithm": self._name,
                 "step_number": step_number,
-                "description": f"Checking middle element at index {mid}: {arr[mid]}. "
-                f"Search range: [{left}..{right}]. "
-                f"Binary search divides the search space in half each iteration, giving O(log n) time complexity.",
+                "description": f"Initializing search for {target}",
                 "data_structure": arr,
                 "target": target,
-                "current_index": mid,
+                "current_index": -1,
                 "found_index": -1,
                 "left": left,
                 "right": right,
-                "mid": mid,
+                "mid": -1,
             }
 
-            if arr[mid] == target:
-                # Found!
-                step_number += 1
+        while left <= right:
+            mid = (left + right) // 2
+            # Read the middle element once; each arr[mid] is a checked access
+            value = arr[mid]
+
+            step_number += 1
+
+            # Yield step: checking middle element
+            if record:
                 yield {
                     "algorithm": self._name,
                     "step_number": step_number,
-                    "description": f"Found {target} at index {mid}! "
-                    f"Binary search successfully located the target in {step_number} steps. "
-                    f"This demonstrates the efficiency of divide-and-conquer approach.",
+                    "description": f"Checking middle element at index {mid}: {value}. "
+                    f"Search range: [{left}..{right}]. "
+                    f"Binary search divides the search space in half each iteration, giving O(log n) time complexity.",
                     "data_structure": arr,
                     "target": target,
                     "current_index": mid,
-                    "found_index": mid,
+                    "found_index": -1,
                     "left": left,
                     "right": right,
                     "mid": mid,
                 }
-                return
-            elif arr[mid] < target:
-                # Target is in right half
+
+            if value == target:
+                # Found!
+                self._found_index = mid
                 step_number += 1
                 yield {
                     "algorithm": self._name,
                     "step_number": step_number,
-                    "description": f"{arr[mid]} < {target}, so target must be in the right half. "
-                    f"Updating search range to [{mid + 1}..{right}]. "
-                    f"We eliminate the left half since the array is sorted.",
+                    "description": f"Found {target} at index {mid}! "
+                    f"Binary search successfully located the target in {step_number} steps. "
+                    f"This demonstrates the efficiency of divide-and-conquer approach.",
                     "data_structure": arr,
                     "target": target,
                     "current_index": mid,
-                    "found_index": -1,
-                    "left": mid + 1,
+                    "found_index": mid,
+                    "left": left,
                     "right": right,
                     "mid": mid,
                 }
+                return
+
+            step_number += 1
+            if value < target:
+                # Target is in right half
+                if record:
+                    yield {
+                        "algorithm": self._name,
+                        "step_number": step_number,
+                        "description": f"{value} < {target}, so target must be in the right half. "
+                        f"Updating search range to [{mid + 1}..{right}]. "
+                        f"We eliminate the left half since the array is sorted.",
+                        "data_structure": arr,
+                        "target": target,
+                        "current_index": mid,
+                        "found_index": -1,
+                        "left": mid + 1,
+                        "right": right,
+                        "mid": mid,
+                    }
                 left = mid + 1
             else:
                 # Target is in left half
-                step_number += 1
-                yield {
-                    "algorithm": self._name,
-                    "step_number": step_number,
-                    "description": f"{arr[mid]} > {target}, so target must be in the left half. "
-                    f"Updating search range to [{left}..{mid - 1}]. "
-                    f"We eliminate the right half since the array is sorted.",
-                    "data_structure": arr,
-                    "target": target,
-                    "current_index": mid,
-                    "found_index": -1,
-                    "left": left,
-                    "right": mid - 1,
-                    "mid": mid,
-                }
+                if record:
+                    yield {
+                        "algorithm": self._name,
+                        "step_number": step_number,
+                        "description": f"{value} > {target}, so target must be in the left half. "
+                        f"Updating search range to [{left}..{mid - 1}]. "
+                        f"We eliminate the right half since the array is sorted.",
+                        "data_structure": arr,
+                        "target": target,
+                        "current_index": mid,
+                        "found_index": -1,
+                        "left": left,
+                        "right": mid - 1,
+                        "mid": mid,
+                    }
                 right = mid - 1
 
         # Not found
@@ -148,7 +159,11 @@ class BinarySearch(BaseAlgorithm):
         }
 
     def execute(
-        self, data_structure, target: Any, visualize: bool = True
+        self,
+        data_structure,
+        target: Any,
+        visualize: bool = True,
+        record_steps: bool = True,
     ) -> List[Dict[str, Any]]:
         """
         Execute binary search for a target value.
@@ -157,9 +172,43 @@ class BinarySearch(BaseAlgorithm):
             data_structure: The array to search in (must be sorted)
             target: The value to search for
             visualize: Whether to visualize during execution
+            record_steps: Whether to record intermediate steps (only the
+                final step is returned when False)
 
         Returns:
             List of execution steps
         """
         self._target = target
-        return super().execute(data_structure, visualize)
+        return super().execute(data_structure, visualize, record_steps)
+
+    def execute_iter(
+        self,
+        data_structure,
+        target: Any,
+        visualize: bool = True,
+        record_steps: bool = True,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Execute binary search for a target value, yielding steps without storing them.
+
+        Args:
+            data_structure: The array to search in (must be sorted)
+            target: The value to search for
+            visualize: Whether to visualize during execution
+            record_steps: Whether to record intermediate steps (only the
+                final step is yielded when False)
+
+        Returns:
+            Iterator over execution steps
+        """
+        self._target = target
+        return super().execute_iter(data_structure, visualize, record_steps)
+
+    def get_found_index(self) -> int:
+        """
+        Get the result of the last search.
+
+        Returns:
+            Index where the target was found, or -1 if it was not found
+        """
+        return self._found_index
@@ -2,7 +2,7 @@
 Exponential Search algorithm implementation with step tracking.
 """
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator
 from ...visualization.base import BaseAlgorithm
 from ...data_structures.array import Array
 
@@ -38,24 +38,27 @@ class ExponentialSearch(BaseAlgorithm):
         arr = data_structure
         step_number = 0
         n = len(arr)
+        # Without step recording only the final step is built
+        record = self._record_steps
 
         step_number += 1
 
         # Yield step: initialization
-        yield {
-            'algorithm': self._name,
-            'step_number': step_number,
-            'description': f'Initializing exponential search for {target}',
-            'data_structure': arr,
-            'target': target,
-            'current_index': -1,
-            'found_index': -1,
-            'left': 0,
-            'right': n - 1,
-            'range_start': 0,
-            'range_end': -1,
-            'phase': 'exponential_range_finding'
-        }
+        if record:
+            yield {
+                'algorithm': self._name,
+                'step_number': step_number,
+                'description': f'Initializing exponential search for {target}',
+                'data_structure': arr,
+                'target': target,
+                'current_index': -1,
+                'found_index': -1,
+                'left': 0,
+                'right': n - 1,
+                'range_start': 0,
+                'range_end': -1,
+                'phase': 'exponential_range_finding'
+            }
 
         # If target is at first position
         if arr[0] == target:
@@ -77,25 +80,31 @@ class ExponentialSearch(BaseAlgorithm):
             return
 
         # Find range by doubling index
+        # Each element is read once; arr[i] is a checked access
         i = 1
-        while i < n and arr[i] <= target:
+        while i < n:
+            value = arr[i]
+            if not value <= target:
+                break
+
             step_number += 1
-            yield {
-                'algorithm': self._name,
-                'step_number': step_number,
-                'description': f'Checking index {i}: {arr[i]}, expanding range exponentially',
-                'data_structure': arr,
-                'target': target,
-                'current_index': i,
-                'found_index': -1,
-                'left': 0,
-                'right': min(i * 2 - 1, n - 1),
-                'range_start': i // 2,
-                'range_end': min(i * 2 - 1, n - 1),
-                'phase': 'exponential_range_finding'
-            }
+            if record:
+                yield {
+                    'algorithm': self._name,
+                    'step_number': step_number,
+                    'description': f'Checking index {i}: {value}, expanding range exponentially',
+                    'data_structure': arr,
+                    'target': target,
+                    'current_index': i,
+                    'found_index': -1,
+                    'left': 0,
+                    'right': min(i * 2 - 1, n - 1),
+                    'range_start': i // 2,
+                    'range_end': min(i * 2 - 1, n - 1),
+                    'phase': 'exponential_range_finding'
+                }
 
-            if arr[i] == target:
+            if value == target:
                 step_number += 1
                 yield {
                     'algorithm': self._name,
@@ -120,97 +129,102 @@ class ExponentialSearch(BaseAlgorithm):
         range_end = min(i, n - 1)
 
         step_number += 1
-        yield {
-            'algorithm': self._name,
-            'step_number': step_number,
-            'description': f'Range found: [{range_start}..{range_end}], switching to binary search',
-            'data_structure': arr,
-            'target': target,
-            'current_index': -1,
-            'found_index': -1,
-            'left': range_start,
-            'right': range_end,
-            'range_start': range_start,
-            'range_end': range_end,
-            'phase': 'binary_search'
-        }
-
-        # Perform binary search in the found range
-        left = range_start
-        right = range_end
-
-        while left <= right:
-            mid = (left + right) // 2
-
-            step_number += 1
+        if record:
             yield {
                 'algorithm': self._name,
                 'step_number': step_number,
-                'description': f'Binary search: checking middle element at index {mid}: {arr[mid]}',
+                'description': f'Range found: [{range_start}..{range_end}], switching to binary search',
                 'data_structure': arr,
                 'target': target,
-                'current_index': mid,
+                'current_index': -1,
                 'found_index': -1,
-                'left': left,
-                'right': right,
+                'left': range_start,
+                'right': range_end,
                 'range_start': range_start,
                 'range_end': range_end,
                 'phase': 'binary_search'
             }
 
-            if arr[mid] == target:
-                # Found!
-                step_number += 1
+        # Perform binary search in the found range
+        left = range_start
+        right = range_end
+
+        while left <= right:
+            mid = (left + right) // 2
+            value = arr[mid]
+
+            step_number += 1
+            if record:
                 yield {
                     'algorithm': self._name,
                     'step_number': step_number,
-                    'description': f'Found {target} at index {mid}',
+                    'description': f'Binary search: checking middle element at index {mid}: {value}',
                     'data_structure': arr,
                     'target': target,
                     'current_index': mid,
-                    'found_index': mid,
+                    'found_index': -1,
                     'left': left,
                     'right': right,
                     'range_start': range_start,
                     'range_end': range_end,
-                    'phase': 'found'
+                    'phase': 'binary_search'
                 }
-                return
-            elif arr[mid] < target:
-                # Target is in right half
+
+            if value == target:
+                # Found!
                 step_number += 1
                 yield {
                     'algorithm': self._name,
                     'step_number': step_number,
-                    'description': f'{arr[mid]} < {target}, searching right half',
+                    'description': f'Found {target} at index {mid}',
                     'data_structure': arr,
                     'target': target,
                     'current_index': mid,
-                    'found_index': -1,
-                    'left': mid + 1,
+                    'found_index': mid,
+                    'left': left,
                     'right': right,
                     'range_start': range_start,
                     'range_end': range_end,
-                    'phase': 'binary_search'
+                    'phase': 'found'
                 }
+                return
+
+            step_number += 1
+            if value < target:
+                # Target is in right half
+                if record:
+                    yield {
+                        'algorithm': self._name,
+                        'step_number': step_number,
+                        'description': f'{value} < {target}, searching right half',
+                        'data_structure': arr,
+                        'target': target,
+                        'current_index': mid,
+                        'found_index': -1,
+                        'left': mid + 1,
+                        'right': right,
+                        'range_start': range_start,
+                        'range_end': range_end,
+                        'phase': 'binary_search'
+                    }
                 left = mid + 1
             else:
                 # Target is in left half
-                step_number += 1
-                yield {
-                    'algorithm': self._name,
-                    'step_number': step_number,
-                    'description': f'{arr[mid]} > {target}, searching left half',
-                    'data_structure': arr,
-                    'target': target,
-                    'current_index': mid,
-                    'found_index': -1,
-                    'left': left,
-                    'right': mid - 1,
-                    'range_start': range_start,
-                    'range_end': range_end,
-                    'phase': 'binary_search'
-                }
+                if record:
+                    yield {
+                        'algorithm': self._name,
+                        'step_number': step_number,
+                        'description': f'{value} > {target}, searching left half',
+                        'data_structure': arr,
+                        'target': target,
+                        'current_index': mid,
+                        'found_index': -1,
+                        'left': left,
+                        'right': mid - 1,
+                        'range_start': range_start,
+                        'range_end': range_end,
+                        'phase': 'binary_search'
+                    }
                 right = mid - 1
 
         # Not found
@@ -230,7 +244,8 @@ class ExponentialSearch(BaseAlgorithm):
             'phase': 'not_found'
         }
 
-    def execute(self, data_structure, target: Any, visualize: bool = True) -> List[Dict[str, Any]]:
+    def execute(self, data_structure, target: Any, visualize: bool = True,
+                record_steps: bool = True) -> List[Dict[str, Any]]:
         """
         Execute exponential search for a target value.
 
@@ -238,10 +253,30 @@ class ExponentialSearch(BaseAlgorithm):
             data_structure: The array to search in (must be sorted)
             target: The value to search for
             visualize: Whether to visualize during execution
+            record_steps: Whether to record intermediate steps (only the
+                final step is returned when False)
 
         Returns:
             List of execution steps
         """
         self._target = target
-        return super().execute(data_structure, visualize)
+        return super().execute(data_structure, visualize, record_steps)
+
+    def execute_iter(self, data_structure, target: Any, visualize: bool = True,
+                     record_steps: bool = True) -> Iterator[Dict[str, Any]]:
+        """
+        Execute exponential search for a target value, yielding steps without storing them.
+
+        Args:
+            data_structure: The array to search in (must be sorted)
+            target: The value to search for
+            visualize: Whether to visualize during execution
+            record_steps: Whether to record intermediate steps (only the
+                final step is yielded when False)
+
+        Returns:
+            Iterator over execution steps
+        """
+        self._target = target
+        return super().execute_iter(data_structure, visualize, record_steps)
 
@@ -2,7 +2,8 @@
 Linear Search algorithm implementation with step tracking.
 """
 
-from typing import List, Dict, Any
+from operator import indexOf
+from typing import List, Dict, Any, Iterator
 from ...visualization.base import BaseAlgorithm
 from ...data_structures.array import Array
 
@@ -45,6 +46,32 @@ class LinearSearch(BaseAlgorithm):
         arr = data_structure
         step_number = 0
 
+        if not self._record_steps:
+            # Nothing to show along the way: let C code do the scan and
+            # report just the final step
+            index = self._find_index(arr, target)
+            if index >= 0:
+                yield {
+                    'algorithm': self._name,
+                    'step_number': index + 2,
+                    'description': f'Found {target} at index {index}',
+                    'data_structure': arr,
+                    'target': target,
+                    'current_index': index,
+                    'found_index': index
+                }
+            else:
+                yield {
+                    'algorithm': self._name,
+                    'step_number': len(arr) + 1,
+                    'description': f'{target} not found in array',
+                    'data_structure': arr,
+                    'target': target,
+                    'current_index': -1,
+                    'found_index': -1
+                }
+            return
+
         for i in range(len(arr)):
             step_number += 1
 
@@ -85,7 +112,32 @@ class LinearSearch(BaseAlgorithm):
             'found_index': -1
         }
 
-    def execute(self, data_structure, target: Any, visualize: bool = True) -> List[Dict[str, Any]]:
+    @staticmethod
+    def _find_index(arr, target: Any) -> int:
+        """
+        Find the first index of a target without building steps.
+
+        Args:
+            arr: Array, list or NumPy array to search in
+            target: The value to search for
+
+        Returns:
+            Index of the first match, or -1 if the target is absent
+        """
+        if hasattr(arr, "tolist"):
+            # NumPy arrays compare every element in one vectorized pass
+            mask = arr == target
+            if getattr(mask, "ndim", 0) == 1:
+                return int(mask.argmax()) if mask.any() else -1
+
+        try:
+            # Same equality test as the step loop, run at C speed
+            return indexOf(arr, target)
+        except ValueError:
+            return -1
+
+    def execute(self, data_structure, target: Any, visualize: bool = True,
+                record_steps: bool = True) -> List[Dict[str, Any]]:
         """
         Execute linear search for a target value.
 
@@ -93,10 +145,30 @@ class LinearSearch(BaseAlgorithm):
             data_structure: The array to search in
             target: The value to search for
             visualize: Whether to visualize during execution
+            record_steps: Whether to record intermediate steps (only the
+                final step is returned when False)
 
         Returns:
             List of execution steps
         """
         self._target = target
-        return super().execute(data_structure, visualize)
+        return super().execute(data_structure, visualize, record_steps)
+
+    def execute_iter(self, data_structure, target: Any, visualize: bool = True,
+                     record_steps: bool = True) -> Iterator[Dict[str, Any]]:
+        """
+        Execute linear search for a target value, yielding steps without storing them.
+
+        Args:
+            data_structure: The array to search in
+            target: The value to search for
+            visualize: Whether to visualize during execution
+            record_steps: Whether to record intermediate steps (only the
+                final step is yielded when False)
+
+        Returns:
+            Iterator over execution steps
+        """
+        self._target = target
+        return super().execute_iter(data_structure, visualize, record_steps)
 
@@ -2,7 +2,7 @@
 Ternary Search algorithm implementation with step tracking.
 """
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator
 from ...visualization.base import BaseAlgorithm
 from ...data_structures.array import Array
 
@@ -37,6 +37,8 @@ class TernarySearch(BaseAlgorithm):
 
         arr = data_structure
         step_number = 0
+        # Without step recording only the final step is built
+        record = self._record_steps
 
         left = 0
         right = len(arr) - 1
@@ -44,88 +46,57 @@ class TernarySearch(BaseAlgorithm):
         step_number += 1
 
         # Yield step: initialization
-        yield {
-            'algorithm': self._name,
-            'step_number': step_number,
-            'description': f'Initializing ternary search for {target}',
-            'data_structure': arr,
-            'target': target,
-            'current_index': -1,
-            'found_index': -1,
-            'left': left,
-            'right': right,
-            'mid1': -1,
-            'mid2': -1
-        }
-
-        while left <= right:
-            # Divide the search space into three parts
-            mid1 = left + (right - left) // 3
-            mid2 = right - (right - left) // 3
-
-            step_number += 1
-
-            # Yield step: checking mid1
+        if record:
             yield {
                 'algorithm': self._name,
                 'step_number': step_number,
-                'description': f'Checking first third at index {mid1}: {arr[mid1]}',
+                'description': f'Initializing ternary search for {target}',
                 'data_structure': arr,
                 'target': target,
-                'current_index': mid1,
+                'current_index': -1,
                 'found_index': -1,
                 'left': left,
                 'right': right,
-                'mid1': mid1,
-                'mid2': mid2
+                'mid1': -1,
+                'mid2': -1
             }
 
-            if arr[mid1] == target:
-                # Found at mid1!
-                step_number += 1
+        while left <= right:
+            # Divide the search space into three parts
+            mid1 = left + (right - left) // 3
+            mid2 = right - (right - left) // 3
+            # Each probe is read once; arr[i] is a checked access
+            value1 = arr[mid1]
+
+            step_number += 1
+
+            # Yield step: checking mid1
+            if record:
                 yield {
                     'algorithm': self._name,
                     'step_number': step_number,
-                    'description': f'Found {target} at index {mid1}',
+                    'description': f'Checking first third at index {mid1}: {value1}',
                     'data_structure': arr,
                     'target': target,
                     'current_index': mid1,
-                    'found_index': mid1,
+                    'found_index': -1,
                     'left': left,
                     'right': right,
                     'mid1': mid1,
                     'mid2': mid2
                 }
-                return
-
-            step_number += 1
 
-            # Yield step: checking mid2
-            yield {
-                'algorithm': self._name,
-                'step_number': step_number,
-                'description': f'Checking second third at index {mid2}: {arr[mid2]}',
-                'data_structure': arr,
-                'target': target,
-                'current_index': mid2,
-                'found_index': -1,
-                'left': left,
-                'right': right,
-                'mid1': mid1,
-                'mid2': mid2
-            }
-
-            if arr[mid2] == target:
-                # Found at mid2!
+            if value1 == target:
+                # Found at mid1!
                 step_number += 1
                 yield {
                     'algorithm': self._name,
                     'step_number': step_number,
-                    'description': f'Found {target} at index {mid2}',
+                    'description': f'Found {target} at index {mid1}',
                     'data_structure': arr,
                     'target': target,
-                    'current_index': mid2,
-                    'found_index': mid2,
+                    'current_index': mid1,
+                    'found_index': mid1,
                     'left': left,
                     'right': right,
                     'mid1': mid1,
@@ -133,57 +104,95 @@ class TernarySearch(BaseAlgorithm):
                 }
                 return
 
-            # Determine which third to search
-            if target < arr[mid1]:
-                # Target is in first third
-                step_number += 1
+            value2 = arr[mid2]
+            step_number += 1
+
+            # Yield step: checking mid2
+            if record:
                 yield {
                     'algorithm': self._name,
                     'step_number': step_number,
-                    'description': f'{target} < {arr[mid1]}, searching first third',
+                    'description': f'Checking second third at index {mid2}: {value2}',
                     'data_structure': arr,
                     'target': target,
-                    'current_index': mid1,
+                    'current_index': mid2,
                     'found_index': -1,
                     'left': left,
-                    'right': mid1 - 1,
+                    'right': right,
                     'mid1': mid1,
                     'mid2': mid2
                 }
-                right = mid1 - 1
-            elif target > arr[mid2]:
-                # Target is in third third
+
+            if value2 == target:
+                # Found at mid2!
                 step_number += 1
                 yield {
                     'algorithm': self._name,
                     'step_number': step_number,
-                    'description': f'{target} > {arr[mid2]}, searching third third',
+                    'description': f'Found {target} at index {mid2}',
                     'data_structure': arr,
                     'target': target,
                     'current_index': mid2,
-                    'found_index': -1,
-                    'left': mid2 + 1,
+                    'found_index': mid2,
+                    'left': left,
                     'right': right,
                     'mid1': mid1,
                     'mid2': mid2
                 }
+                return
+
+            # Determine which third to search
+            step_number += 1
+            if target < value1:
+                # Target is in first third
+                if record:
+                    yield {
+                        'algorithm': self._name,
+                        'step_number': step_number,
+                        'description': f'{target} < {value1}, searching first third',
+                        'data_structure': arr,
+                        'target': target,
+                        'current_index': mid1,
+                        'found_index': -1,
+                        'left': left,
+                        'right': mid1 - 1,
+                        'mid1': mid1,
+                        'mid2': mid2
+                    }
+                right = mid1 - 1
+            elif target > value2:
+                # Target is in third third
+                if record:
+                    yield {
+                        'algorithm': self._name,
+                        'step_number': step_number,
+                        'description': f'{target} > {value2}, searching third third',
+                        'data_structure': arr,
+                        'target': target,
+                        'current_index': mid2,
+                        'found_index': -1,
+                        'left': mid2 + 1,
+                        'right': right,
+                        'mid1': mid1,
+                        'mid2': mid2
+                    }
                 left = mid2 + 1
             else:
                 # Target is in middle third
-                step_number += 1
-                yield {
-                    'algorithm': self._name,
-                    'step_number': step_number,
-                    'description': f'{arr[mid1]} < {target} < {arr[mid2]}, searching middle third',
-                    'data_structure': arr,
-                    'target': target,
-                    'current_index': -1,
-                    'found_index': -1,
-                    'left': mid1 + 1,
-                    'right': mid2 - 1,
-                    'mid1': mid1,
-                    'mid2': mid2
-                }
+                if record:
+                    yield {
+                        'algorithm': self._name,
+                        'step_number': step_number,
+                        'description': f'{value1} < {target} < {value2}, searching middle third',
+                        'data_structure': arr,
+                        'target': target,
+                        'current_index': -1,
+                        'found_index': -1,
+                        'left': mid1 + 1,
+                        'right': mid2 - 1,
+                        'mid1': mid1,
+                        'mid2': mid2
+                    }
                 left = mid1 + 1
                 right = mid2 - 1
 
@@ -203,7 +212,8 @@ class TernarySearch(BaseAlgorithm):
             'mid2': -1
         }
 
-    def execute(self, data_structure, target: Any, visualize: bool = True) -> List[Dict[str, Any]]:
+    def execute(self, data_structure, target: Any, visualize: bool = True,
+                record_steps: bool = True) -> List[Dict[str, Any]]:
         """
         Execute ternary search for a target value.
 
@@ -211,10 +221,30 @@ class TernarySearch(BaseAlgorithm):
             data_structure: The array to search in (must be sorted)
             target: The value to search for
             visualize: Whether to visualize during execution
+            record_steps: Whether to record intermediate steps (only the
+                final step is returned when False)
 
         Returns:
             List of execution steps
         """
         self._target = target
-        return super().execute(data_structure, visualize)
+        return super().execute(data_structure, visualize, record_steps)
+
+    def execute_iter(self, data_structure, target: Any, visualize: bool = True,
+                     record_steps: bool = True) -> Iterator[Dict[str, Any]]:
+        """
+        Execute ternary search for a target value, yielding steps without storing them.
+
+        Args:
+            data_structure: The array to search in (must be sorted)
+            target: The value to search for
+            visualize: Whether to visualize during execution
+            record_steps: Whether to record intermediate steps (only the
+                final step is yielded when False)
+
+        Returns:
+            Iterator over execution steps
+        """
+        self._target = target
+        return super().execute_iter(data_structure, visualize, record_steps)
 
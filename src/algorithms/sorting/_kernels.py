@@ -0,0 +1,542 @@
+"""
+Step-free sorting kernels.
+
+These kernels sort a Python list in place without building step dictionaries
+or array snapshots. Each one returns the number of steps the corresponding
+visualized algorithm would have produced, so callers that only need the
+sorted result and a step count can skip the step-recording machinery.
+"""
+
+from bisect import bisect_left, bisect_right
+from typing import Any, Iterator, List, Sequence, Tuple
+
+
+def bubble_sort_kernel(data: List[Any]) -> int:
+    """
+    Sort a list in place using bubble sort.
+
+    Each pass carries the largest value seen so far in a local instead of
+    reading both neighbours from the list at every comparison, which halves
+    the list reads.
+
+    Args:
+        data: List to sort
+
+    Returns:
+        Number of steps BubbleSort would yield for the same input
+    """
+    n = len(data)
+    steps = 0
+
+    for i in range(n - 1):
+        end = n - i
+        swaps = 0
+        bigger = data[0]
+
+        for j in range(1, end):
+            value = data[j]
+            if bigger > value:
+                data[j - 1] = value
+                data[j] = bigger
+                swaps += 1
+            else:
+                bigger = value
+
+        # One step per comparison, plus one per swap
+        steps += end - 1 + swaps
+
+        if not swaps:
+            break
+
+    # Final "sorted" step
+    return steps + 1
+
+
+def insertion_sort_kernel(data: List[Any]) -> int:
+    """
+    Sort a list in place using insertion sort.
+
+    The insertion point is found by binary search over the sorted prefix and
+    the larger elements are moved with one slice assignment. ``bisect_right``
+    stops at the same position as InsertionSort's leftward scan, so the
+    result and the step count are unchanged.
+
+    Args:
+        data: List to sort
+
+    Returns:
+        Number of steps InsertionSort would yield for the same input
+    """
+    steps = 0
+
+    for i in range(1, len(data)):
+        key = data[i]
+        position = bisect_right(data, key, 0, i)
+
+        if position < i:
+            data[position + 1:i + 1] = data[position:i]
+            data[position] = key
+
+        # Selecting and inserted steps, plus a comparing and a shifting step
+        # per element moved
+        steps += 2 + 2 * (i - position)
+
+    # Final "sorted" step
+    return steps + 1
+
+
+def selection_sort_kernel(data: List[Any]) -> int:
+    """
+    Sort a list in place using selection sort.
+
+    Args:
+        data: List to sort
+
+    Returns:
+        Number of steps SelectionSort would yield for the same input
+    """
+    n = len(data)
+    steps = 0
+
+    for i in range(n):
+        min_idx = i
+
+        # Starting a new pass
+        steps += 1
+
+        for j in range(i + 1, n):
+            steps += 1
+            if data[j] < data[min_idx]:
+                min_idx = j
+
+        if min_idx != i:
+            data[i], data[min_idx] = data[min_idx], data[i]
+            steps += 1
+
+        # Element in place
+        steps += 1
+
+    # Final "sorted" step
+    return steps + 1
+
+
+def heap_sort_kernel(data: List[Any]) -> int:
+    """
+    Sort a list in place using heap sort.
+
+    Args:
+        data: List to sort
+
+    Returns:
+        Number of steps HeapSort would yield for the same input
+    """
+    n = len(data)
+
+    def sift_down(heap_size: int, root: int) -> int:
+        """Restore the max-heap property below root; return the steps taken."""
+        steps = 0
+        while True:
+            largest = root
+            left = 2 * root + 1
+            right = left + 1
+
+            # One step per child compared
+            if left < heap_size:
+                steps += 1
+                if data[left] > data[largest]:
+                    largest = left
+            if right < heap_size:
+                steps += 1
+                if data[right] > data[largest]:
+                    largest = right
+
+            # Swap or "heap property satisfied" step
+            steps += 1
+            if largest == root:
+                return steps
+            data[root], data[largest] = data[largest], data[root]
+            root = largest
+
+    # "Building max heap" and "Max heap built" steps
+    steps = 2
+    for i in range(n // 2 - 1, -1, -1):
+        steps += sift_down(n, i)
+
+    for i in range(n - 1, 0, -1):
+        data[0], data[i] = data[i], data[0]
+        # Moving the root to its sorted position
+        steps += 1
+        steps += sift_down(i, 0)
+
+    # Final "sorted" step
+    return steps + 1
+
+
+def median_of_three(data: Sequence[Any], low: int, high: int) -> int:
+    """
+    Index of the median of the first, middle and last elements of a range.
+
+    Ties resolve to ``high``, so a range whose candidates are equal needs no
+    pivot move.
+
+    Args:
+        data: Sequence holding the range
+        low: First index of the range
+        high: Last index of the range
+
+    Returns:
+        One of low, (low + high) // 2 and high
+    """
+    mid = (low + high) // 2
+    first, middle, last = data[low], data[mid], data[high]
+    if first < middle:
+        if middle < last:
+            return mid
+        return high if first < last else low
+    if first < last:
+        return low
+    return mid if last < middle else high
+
+
+def quick_sort_depth_limit(n: int) -> int:
+    """
+    Partitioning depth after which QuickSort falls back to heap sort.
+
+    Args:
+        n: Number of elements being sorted
+
+    Returns:
+        2 * floor(log2 n) + 1, as in introsort
+    """
+    return 2 * (max(n, 1).bit_length() - 1) + 1
+
+
+def heap_sort_swaps(data: List[Any], low: int, high: int) -> Iterator[Tuple[str, int, int]]:
+    """
+    Heap sort data[low..high], one swap at a time.
+
+    Each swap is yielded before it is made, and the caller makes it
+    (directly or through a timeline) before asking for the next one: the
+    sift reads the data as the swaps leave it.
+
+    Args:
+        data: List holding the range
+        low: First index of the range
+        high: Last index of the range
+
+    Yields:
+        ("sift", parent, child) for swaps that restore the max-heap and
+        ("extract", low, end) for moving the maximum behind the heap
+    """
+
+    def sift_down(root: int, size: int) -> Iterator[Tuple[str, int, int]]:
+        while True:
+            largest = root
+            left = 2 * root + 1
+            right = left + 1
+            if left < size and data[low + left] > data[low + largest]:
+                largest = left
+            if right < size and data[low + right] > data[low + largest]:
+                largest = right
+            if largest == root:
+                return
+            yield "sift", low + root, low + largest
+            root = largest
+
+    size = high - low + 1
+    for root in range(size // 2 - 1, -1, -1):
+        yield from sift_down(root, size)
+
+    for end in range(size - 1, 0, -1):
+        yield "extract", low, low + end
+        yield from sift_down(0, end)
+
+
+def quick_sort_kernel(data: List[Any], verbose: bool = True) -> int:
+    """
+    Sort a list in place using quick sort (Lomuto partition, median-of-three
+    pivot).
+
+    Ranges wait on an explicit stack instead of the call stack. As in
+    introsort, ranges partitioned ``quick_sort_depth_limit`` times are heap
+    sorted instead.
+
+    Args:
+        data: List to sort
+        verbose: Count the steps for elements a partition leaves in place,
+            as ``QuickSort(verbose=...)`` does
+
+    Returns:
+        Number of steps QuickSort would yield for the same input
+    """
+    steps = 0
+    ranges = [(0, len(data) - 1, quick_sort_depth_limit(len(data)))]
+    push, pop = ranges.append, ranges.pop
+
+    while ranges:
+        low, high, depth_limit = pop()
+        if low >= high:
+            continue
+
+        if depth_limit == 0:
+            # "Depth limit reached" step, then one step per swap
+            steps += 1
+            for _, i, j in heap_sort_swaps(data, low, high):
+                data[i], data[j] = data[j], data[i]
+                steps += 1
+            continue
+
+        if high - low >= 2:
+            median = median_of_three(data, low, high)
+            if median != high:
+                data[median], data[high] = data[high], data[median]
+                # Moving the median into the pivot slot
+                steps += 1
+
+        pivot = data[high]
+        i = low - 1
+        for j in range(low, high):
+            if data[j] <= pivot:
+                i += 1
+                if i != j:
+                    data[i], data[j] = data[j], data[i]
+                    # Swapping step
+                    steps += 1
+                elif verbose:
+                    # "Already in correct position" step
+                    steps += 1
+        data[i + 1], data[high] = data[high], data[i + 1]
+
+        # Selecting the pivot, one step per comparison, placing the pivot
+        steps += high - low + 2
+
+        push((i + 2, high, depth_limit - 1))
+        push((low, i, depth_limit - 1))
+
+    # Final "sorted" step
+    return steps + 1
+
+
+def merge_sort_kernel(data: List[Any]) -> int:
+    """
+    Sort a list in place using top-down merge sort.
+
+    Instead of slicing both halves into temporary lists before every merge,
+    the sort ping-pongs between ``data`` and a single scratch copy made up
+    front: each level merges the halves sorted into one buffer into the
+    other, so a merge reads and writes the buffers directly.
+
+    Args:
+        data: List to sort
+
+    Returns:
+        Number of steps MergeSort would yield for the same input
+    """
+    steps = 0
+
+    def sort(source: List[Any], target: List[Any], left: int, right: int) -> None:
+        """Sort source[left..right] into target; both start out equal there."""
+        nonlocal steps
+        if left >= right:
+            return
+        mid = (left + right) // 2
+
+        # The halves are sorted into source, using target as scratch
+        sort(target, source, left, mid)
+        sort(target, source, mid + 1, right)
+
+        i, j, k = left, mid + 1, left
+        while i <= mid and j <= right:
+            if source[i] <= source[j]:
+                target[k] = source[i]
+                i += 1
+            else:
+                target[k] = source[j]
+                j += 1
+            k += 1
+        compared = k - left
+
+        # One half is used up: move the rest of the other one
+        if i <= mid:
+            target[k:right + 1] = source[i:mid + 1]
+        else:
+            target[k:right + 1] = source[j:right + 1]
+
+        # Dividing, merging and completed steps, two steps per comparison
+        # and one per element copied after it
+        steps += 3 + (right - left + 1) + compared
+
+    sort(data.copy(), data, 0, len(data) - 1)
+
+    # Final "sorted" step
+    return steps + 1
+
+
+def find_runs(data: Sequence[Any]) -> List[Tuple[int, int, bool]]:
+    """
+    Split a sequence into its maximal natural runs.
+
+    A run is either non-decreasing or strictly decreasing; reversing a
+    strictly decreasing run never reorders equal elements, so sorting by
+    runs stays stable.
+
+    Args:
+        data: Sequence to scan
+
+    Returns:
+        (start, end, descending) for each run from left to right, with end
+        inclusive
+    """
+    runs = []
+    n = len(data)
+    start = 0
+
+    while start < n:
+        end = start
+        if end + 1 < n and data[end + 1] < data[end]:
+            while end + 1 < n and data[end + 1] < data[end]:
+                end += 1
+            runs.append((start, end, True))
+        else:
+            while end + 1 < n and not data[end + 1] < data[end]:
+                end += 1
+            runs.append((start, end, False))
+        start = end + 1
+
+    return runs
+
+
+def run_merges(runs: Sequence[Tuple[int, int, bool]]) -> Iterator[Tuple[int, int, int]]:
+    """
+    Order in which timsort would merge adjacent runs.
+
+    Runs are pushed onto a stack that is collapsed whenever a run is not
+    longer than the next one, or than the next two together, which keeps
+    merges balanced. The order depends only on the run lengths.
+
+    Args:
+        runs: Runs as returned by ``find_runs``
+
+    Yields:
+        (left, mid, right) for each merge of data[left..mid] with
+        data[mid+1..right]
+    """
+    # (start, length) of the runs waiting to be merged
+    stack = []
+
+    def merge_at(i: int) -> Tuple[int, int, int]:
+        """Merge runs i and i + 1 of the stack."""
+        start, length = stack[i]
+        next_length = stack[i + 1][1]
+        stack[i] = (start, length + next_length)
+        del stack[i + 1]
+        return start, start + length - 1, start + length + next_length - 1
+
+    for start, end, _ in runs:
+        stack.append((start, end - start + 1))
+
+        while len(stack) > 1:
+            i = len(stack) - 2
+            if (i > 0 and stack[i - 1][1] <= stack[i][1] + stack[i + 1][1]) or (
+                i > 1 and stack[i - 2][1] <= stack[i - 1][1] + stack[i][1]
+            ):
+                if stack[i - 1][1] < stack[i + 1][1]:
+                    i -= 1
+            elif stack[i][1] > stack[i + 1][1]:
+                break
+            yield merge_at(i)
+
+    while len(stack) > 1:
+        i = len(stack) - 2
+        if i > 0 and stack[i - 1][1] < stack[i + 1][1]:
+            i -= 1
+        yield merge_at(i)
+
+
+# Number of times in a row one run must win a natural merge before the rest
+# of its winning elements are found by binary search, as in timsort
+MIN_GALLOP = 7
+
+
+def natural_merge_sort_kernel(data: List[Any]) -> int:
+    """
+    Sort a list in place by merging its natural runs, as timsort does.
+
+    Once one run has won ``MIN_GALLOP`` comparisons in a row, the merge
+    gallops: it binary-searches how many more of that run's elements come
+    next and moves them in one go.
+
+    Args:
+        data: List to sort
+
+    Returns:
+        Number of steps MergeSort(natural_runs=True) would yield for the
+        same input
+    """
+    runs = find_runs(data)
+    for start, end, descending in runs:
+        if descending:
+            data[start:end + 1] = data[start:end + 1][::-1]
+
+    # One "found run" step per run
+    steps = len(runs)
+
+    for left, mid, right in run_merges(runs):
+        # Only the left run is copied out; the right one is read in place
+        buffer = data[left:mid + 1]
+        size = len(buffer)
+        i, j, k = 0, mid + 1, left
+        while i < size and j <= right:
+            # Take from the left run while it wins, up to MIN_GALLOP times
+            wins = 0
+            while buffer[i] <= data[j]:
+                data[k] = buffer[i]
+                i += 1
+                k += 1
+                wins += 1
+                if i == size or wins == MIN_GALLOP:
+                    break
+            # Comparing and placed steps
+            steps += 2 * wins
+            if i == size:
+                break
+            if wins == MIN_GALLOP:
+                # Left elements not greater than data[j] all go first
+                end = bisect_right(buffer, data[j], i)
+                if end > i:
+                    data[k:k + end - i] = buffer[i:end]
+                    k += end - i
+                    i = end
+                    # Galloping step
+                    steps += 1
+                continue
+
+            # Then from the right run while it wins
+            wins = 0
+            while not buffer[i] <= data[j]:
+                data[k] = data[j]
+                j += 1
+                k += 1
+                wins += 1
+                if j > right or wins == MIN_GALLOP:
+                    break
+            steps += 2 * wins
+            if wins == MIN_GALLOP and j <= right:
+                # Right elements less than buffer[i] all go first
+                end = bisect_left(data, buffer[i], j, right + 1)
+                if end > j:
+                    data[k:k + end - j] = data[j:end]
+                    k += end - j
+                    j = end
+                    steps += 1
+
+        # Whatever is left of the right run is already in place
+        if i < size:
+            data[k:right + 1] = buffer[i:]
+
+        # Merging and completed steps, one step per element copied after the
+        # comparisons
+        steps += 2 + (right - k + 1)
+
+    # Final "sorted" step
+    return steps + 1
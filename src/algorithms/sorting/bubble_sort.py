@@ -2,8 +2,12 @@
 Bubble Sort algorithm implementation with step tracking.
 """
 
+from typing import Any, Dict
+
 from ...data_structures.array import Array
 from ...visualization.base import BaseAlgorithm
+from ...visualization.step_views import ArrayTimeline
+from ._kernels import bubble_sort_kernel
 
 
 class BubbleSort(BaseAlgorithm):
@@ -33,8 +37,22 @@ class BubbleSort(BaseAlgorithm):
         # Convert to list for easier manipulation
         data = arr.to_list()
 
+        if not self._record_steps:
+            # Nothing to show along the way: sort with the step-free kernel
+            # and report just the final step
+            step_number = bubble_sort_kernel(data)
+            arr.batch_set(data)
+            yield self._complete_step(Array(data), n, step_number)
+            return
+
+        # Writes go through the timeline so steps can take O(1) snapshots
+        # instead of copies
+        timeline = ArrayTimeline(data)
+
         for i in range(n):
             swapped = False
+            # Built once per pass and shared by its steps, which only read it
+            sorted_indices = list(range(n - i, n))
 
             for j in range(0, n - i - 1):
                 step_number += 1
@@ -46,16 +64,16 @@ class BubbleSort(BaseAlgorithm):
                     "description": f"Comparing elements at indices {j} and {j + 1}: {data[j]} vs {data[j + 1]}. "
                     f"Outer loop iteration {i + 1}/{n}, inner loop iteration {j + 1}/{n - i - 1}. "
                     f"Bubble sort compares adjacent elements and swaps if they're in wrong order.",
-                    "data_structure": Array(data.copy()),
+                    "data_structure": timeline.snapshot(),
                     "comparing": [j, j + 1],
                     "swapping": [],
-                    "sorted": list(range(n - i, n)),
+                    "sorted": sorted_indices,
                     "current": [j],
                 }
 
                 if data[j] > data[j + 1]:
                     # Swap elements
-                    data[j], data[j + 1] = data[j + 1], data[j]
+                    timeline.swap(j, j + 1)
                     swapped = True
 
                     step_number += 1
@@ -67,30 +85,43 @@ class BubbleSort(BaseAlgorithm):
                         "description": f"Swapping elements at indices {j} and {j + 1}: {data[j + 1]} and {data[j]}. "
                         f"Since {data[j + 1]} < {data[j]}, they are in wrong order and need to be swapped. "
                         f"This moves the smaller element towards the beginning of the array.",
-                        "data_structure": Array(data.copy()),
+                        "data_structure": timeline.snapshot(),
                         "comparing": [j, j + 1],
                         "swapping": [j, j + 1],
-                        "sorted": list(range(n - i, n)),
+                        "sorted": sorted_indices,
                         "current": [j],
                     }
 
-            # Update the original data structure
-            for k in range(n):
-                arr.set(k, data[k])
-
             if not swapped:
                 # Array is sorted, no more swaps needed
                 break
 
+        # Update the original data structure once, now that it is sorted
+        arr.batch_set(data)
+
         # Final step: sorted
         step_number += 1
-        yield {
+        yield self._complete_step(timeline.snapshot(), n, step_number)
+
+    def _complete_step(self, data_structure, n: int, step_number: int) -> Dict[str, Any]:
+        """
+        Build the final step of the sort.
+
+        Args:
+            data_structure: Array holding the sorted data
+            n: Number of elements
+            step_number: Number of this step
+
+        Returns:
+            Dictionary containing step information
+        """
+        return {
             "algorithm": self._name,
             "step_number": step_number,
             "description": f"Array is now sorted! Completed in {step_number} steps. "
             f"Bubble sort works by repeatedly swapping adjacent elements until no more swaps are needed. "
             f"Time complexity: O(n²) in worst case, O(n) if already sorted (with early termination).",
-            "data_structure": Array(data.copy()),
+            "data_structure": data_structure,
             "comparing": [],
             "swapping": [],
             "sorted": list(range(n)),
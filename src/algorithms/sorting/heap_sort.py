@@ -2,8 +2,12 @@
 Heap Sort algorithm implementation with step tracking.
 """
 
+from typing import Any, Dict
+
 from ...data_structures.array import Array
 from ...visualization.base import BaseAlgorithm
+from ...visualization.step_views import ArrayTimeline
+from ._kernels import heap_sort_kernel
 
 
 class HeapSort(BaseAlgorithm):
@@ -16,6 +20,7 @@ class HeapSort(BaseAlgorithm):
         super().__init__()
         self._name = "Heap Sort"
         self._step_number = 0
+        self._timeline = None
 
     def _run(self, data_structure):
         """
@@ -34,24 +39,32 @@ class HeapSort(BaseAlgorithm):
         # Convert to list for easier manipulation
         data = arr.to_list()
 
+        if not self._record_steps:
+            # Nothing to show along the way: sort with the step-free kernel
+            # and report just the final step
+            self._step_number = heap_sort_kernel(data)
+            arr.batch_set(data)
+            yield self._complete_step(Array(data), n)
+            return
+
+        # Writes go through the timeline so steps can take O(1) snapshots
+        # instead of copies
+        self._timeline = ArrayTimeline(data)
+
         # Build max heap
-        yield from self._build_heap(data, n, arr)
+        yield from self._build_heap(data, n)
 
         # Extract elements from heap one by one
         for i in range(n - 1, 0, -1):
             # Move root to end
-            data[0], data[i] = data[i], data[0]
-
-            # Update the original array
-            arr.set(0, data[0])
-            arr.set(i, data[i])
+            self._timeline.swap(0, i)
 
             self._step_number += 1
             yield {
                 "algorithm": self._name,
                 "step_number": self._step_number,
                 "description": f"Moving root {data[i]} to sorted position {i}",
-                "data_structure": Array(data.copy()),
+                "data_structure": self._timeline.snapshot(),
                 "comparing": [],
                 "swapping": [0, i],
                 "sorted": list(range(i, n)),
@@ -60,15 +73,31 @@ class HeapSort(BaseAlgorithm):
             }
 
             # Heapify root element
-            yield from self._heapify(data, i, 0, arr)
+            yield from self._heapify(data, i, 0)
+
+        # Update the original data structure once, now that it is sorted
+        arr.batch_set(data)
 
         # Final step: sorted
         self._step_number += 1
-        yield {
+        yield self._complete_step(self._timeline.snapshot(), n)
+
+    def _complete_step(self, data_structure, n: int) -> Dict[str, Any]:
+        """
+        Build the final step of the sort.
+
+        Args:
+            data_structure: Array holding the sorted data
+            n: Number of elements
+
+        Returns:
+            Dictionary containing step information
+        """
+        return {
             "algorithm": self._name,
             "step_number": self._step_number,
             "description": "Array is now sorted",
-            "data_structure": Array(data.copy()),
+            "data_structure": data_structure,
             "comparing": [],
             "swapping": [],
             "sorted": list(range(n)),
@@ -76,14 +105,13 @@ class HeapSort(BaseAlgorithm):
             "heap": None,
         }
 
-    def _build_heap(self, data, n, arr):
+    def _build_heap(self, data, n):
         """
         Build a max heap from the array.
 
         Args:
             data: List to heapify
             n: Size of the heap
-            arr: Original Array object for updates
 
         Yields:
             Step dictionaries
@@ -93,7 +121,7 @@ class HeapSort(BaseAlgorithm):
             "algorithm": self._name,
             "step_number": self._step_number,
             "description": "Building max heap",
-            "data_structure": Array(data.copy()),
+            "data_structure": self._timeline.snapshot(),
             "comparing": [],
             "swapping": [],
             "sorted": [],
@@ -103,14 +131,14 @@ class HeapSort(BaseAlgorithm):
 
         # Start from the last non-leaf node and heapify each
         for i in range(n // 2 - 1, -1, -1):
-            yield from self._heapify(data, n, i, arr)
+            yield from self._heapify(data, n, i)
 
         self._step_number += 1
         yield {
             "algorithm": self._name,
             "step_number": self._step_number,
             "description": "Max heap built successfully",
-            "data_structure": Array(data.copy()),
+            "data_structure": self._timeline.snapshot(),
             "comparing": [],
             "swapping": [],
             "sorted": [],
@@ -118,97 +146,98 @@ class HeapSort(BaseAlgorithm):
             "heap": {"size": n, "heap_indices": list(range(n))},
         }
 
-    def _heapify(self, data, heap_size, root_idx, arr):
+    def _heapify(self, data, heap_size, root_idx):
         """
-        Heapify a subtree rooted at root_idx.
+        Heapify a subtree rooted at root_idx by sifting the root down.
 
         Args:
             data: List containing the heap
             heap_size: Size of the heap
             root_idx: Root index of the subtree
-            arr: Original Array object for updates
 
         Yields:
             Step dictionaries
         """
-        largest = root_idx
-        left = 2 * root_idx + 1
-        right = 2 * root_idx + 2
-
-        comparing_indices = []
-
-        # Check if left child exists and is greater than root
-        if left < heap_size:
-            comparing_indices = [root_idx, left]
-            self._step_number += 1
-            yield {
-                "algorithm": self._name,
-                "step_number": self._step_number,
-                "description": f"Comparing root {data[root_idx]} with left child {data[left]}",
-                "data_structure": Array(data.copy()),
-                "comparing": comparing_indices,
-                "swapping": [],
-                "sorted": [],
-                "current": [root_idx],
-                "heap": {"size": heap_size, "heap_indices": list(range(heap_size)), "root": root_idx, "left": left, "right": right},
-            }
-
-            if data[left] > data[largest]:
-                largest = left
-
-        # Check if right child exists and is greater than largest so far
-        if right < heap_size:
-            comparing_indices = [largest, right]
-            self._step_number += 1
-            yield {
-                "algorithm": self._name,
-                "step_number": self._step_number,
-                "description": f"Comparing {data[largest]} with right child {data[right]}",
-                "data_structure": Array(data.copy()),
-                "comparing": comparing_indices,
-                "swapping": [],
-                "sorted": [],
-                "current": [largest],
-                "heap": {"size": heap_size, "heap_indices": list(range(heap_size)), "root": root_idx, "left": left, "right": right},
-            }
-
-            if data[right] > data[largest]:
-                largest = right
-
-        # If largest is not root, swap and continue heapifying
-        if largest != root_idx:
-            data[root_idx], data[largest] = data[largest], data[root_idx]
-
-            # Update the original array
-            arr.set(root_idx, data[root_idx])
-            arr.set(largest, data[largest])
-
-            self._step_number += 1
-            yield {
-                "algorithm": self._name,
-                "step_number": self._step_number,
-                "description": f"Swapping {data[root_idx]} and {data[largest]} to maintain heap property",
-                "data_structure": Array(data.copy()),
-                "comparing": [],
-                "swapping": [root_idx, largest],
-                "sorted": [],
-                "current": [root_idx, largest],
-                "heap": {"size": heap_size, "heap_indices": list(range(heap_size)), "root": root_idx, "left": left, "right": right},
-            }
-
-            # Recursively heapify the affected subtree
-            yield from self._heapify(data, heap_size, largest, arr)
-        else:
-            self._step_number += 1
-            yield {
-                "algorithm": self._name,
-                "step_number": self._step_number,
-                "description": f"Heap property satisfied at index {root_idx}",
-                "data_structure": Array(data.copy()),
-                "comparing": [],
-                "swapping": [],
-                "sorted": [],
-                "current": [root_idx],
-                "heap": {"size": heap_size, "heap_indices": list(range(heap_size)), "root": root_idx},
-            }
-
+        # The heap size is fixed for the whole sift, so its steps share one list
+        heap_indices = list(range(heap_size))
+
+        # Sift down iteratively: one generator for the whole path instead of
+        # one per level
+        while True:
+            largest = root_idx
+            left = 2 * root_idx + 1
+            right = 2 * root_idx + 2
+
+            comparing_indices = []
+
+            # Check if left child exists and is greater than root
+            if left < heap_size:
+                comparing_indices = [root_idx, left]
+                self._step_number += 1
+                yield {
+                    "algorithm": self._name,
+                    "step_number": self._step_number,
+                    "description": f"Comparing root {data[root_idx]} with left child {data[left]}",
+                    "data_structure": self._timeline.snapshot(),
+                    "comparing": comparing_indices,
+                    "swapping": [],
+                    "sorted": [],
+                    "current": [root_idx],
+                    "heap": {"size": heap_size, "heap_indices": heap_indices, "root": root_idx, "left": left, "right": right},
+                }
+
+                if data[left] > data[largest]:
+                    largest = left
+
+            # Check if right child exists and is greater than largest so far
+            if right < heap_size:
+                comparing_indices = [largest, right]
+                self._step_number += 1
+                yield {
+                    "algorithm": self._name,
+                    "step_number": self._step_number,
+                    "description": f"Comparing {data[largest]} with right child {data[right]}",
+                    "data_structure": self._timeline.snapshot(),
+                    "comparing": comparing_indices,
+                    "swapping": [],
+                    "sorted": [],
+                    "current": [largest],
+                    "heap": {"size": heap_size, "heap_indices": heap_indices, "root": root_idx, "left": left, "right": right},
+                }
+
+                if data[right] > data[largest]:
+                    largest = right
+
+            # If largest is not root, swap and continue heapifying
+            if largest != root_idx:
+                self._timeline.swap(root_idx, largest)
+
+                self._step_number += 1
+                yield {
+                    "algorithm": self._name,
+                    "step_number": self._step_number,
+                    "description": f"Swapping {data[root_idx]} and {data[largest]} to maintain heap property",
+                    "data_structure": self._timeline.snapshot(),
+                    "comparing": [],
+                    "swapping": [root_idx, largest],
+                    "sorted": [],
+                    "current": [root_idx, largest],
+                    "heap": {"size": heap_size, "heap_indices": heap_indices, "root": root_idx, "left": left, "right": right},
+                }
+
+                # Continue sifting down from the affected subtree
+                root_idx = largest
+            else:
+                self._step_number += 1
+                yield {
+                    "algorithm": self._name,
+                    "step_number": self._step_number,
+                    "description": f"Heap property satisfied at index {root_idx}",
+                    "data_structure": self._timeline.snapshot(),
+                    "comparing": [],
+                    "swapping": [],
+                    "sorted": [],
+                    "current": [root_idx],
+                    "heap": {"size": heap_size, "heap_indices": heap_indices, "root": root_idx},
+                }
+                return
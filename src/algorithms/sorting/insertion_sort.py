@@ -2,8 +2,12 @@
 Insertion Sort algorithm implementation with step tracking.
 """
 
+from typing import Any, Dict
+
 from ...data_structures.array import Array
 from ...visualization.base import BaseAlgorithm
+from ...visualization.step_views import ArrayTimeline
+from ._kernels import insertion_sort_kernel
 
 
 class InsertionSort(BaseAlgorithm):
@@ -33,6 +37,18 @@ class InsertionSort(BaseAlgorithm):
         # Convert to list for easier manipulation
         data = arr.to_list()
 
+        if not self._record_steps:
+            # Nothing to show along the way: sort with the step-free kernel
+            # and report just the final step
+            step_number = insertion_sort_kernel(data)
+            arr.batch_set(data)
+            yield self._complete_step(Array(data), n, step_number)
+            return
+
+        # Writes go through the timeline so steps can take O(1) snapshots
+        # instead of copies
+        timeline = ArrayTimeline(data)
+
         # First element is considered sorted
         sorted_indices = [0]
 
@@ -48,10 +64,10 @@ class InsertionSort(BaseAlgorithm):
                 "algorithm": self._name,
                 "step_number": step_number,
                 "description": f"Selecting element {key} at index {i} to insert",
-                "data_structure": Array(data.copy()),
+                "data_structure": timeline.snapshot(),
                 "comparing": [],
                 "swapping": [],
-                "sorted": sorted_indices.copy(),
+                "sorted": sorted_indices,
                 "current": [i],
             }
 
@@ -64,10 +80,10 @@ class InsertionSort(BaseAlgorithm):
                     "algorithm": self._name,
                     "step_number": step_number,
                     "description": f"Comparing {data[j]} with {key}",
-                    "data_structure": Array(data.copy()),
+                    "data_structure": timeline.snapshot(),
                     "comparing": [j, key_position],
                     "swapping": [],
-                    "sorted": sorted_indices.copy(),
+                    "sorted": sorted_indices,
                     "current": [j, key_position],
                 }
 
@@ -75,31 +91,31 @@ class InsertionSort(BaseAlgorithm):
                 # Store the value being shifted BEFORE the shift
                 shifted_value = data[j]
                 # Perform the shift
-                data[j + 1] = data[j]
+                timeline.set(j + 1, data[j])
                 # Update key position (the slot where key will go moves left)
                 key_position = j
 
                 step_number += 1
 
                 # Yield step: shifting element (show updated state AFTER shift)
-                # IMPORTANT: Use data.copy() AFTER the shift to show updated array
+                # IMPORTANT: Snapshot AFTER the shift to show updated array
                 yield {
                     "algorithm": self._name,
                     "step_number": step_number,
                     "description": f"Shifting {shifted_value} from index {j} to {j + 1}",
-                    "data_structure": Array(data.copy()),  # Copy AFTER shift - shows updated array
+                    "data_structure": timeline.snapshot(),  # Snapshot AFTER shift - shows updated array
                     "comparing": [],
                     "swapping": [j, j + 1],  # Highlight both positions involved in shift
-                    "sorted": sorted_indices.copy(),
+                    "sorted": sorted_indices,
                     "current": [j + 1],  # Show where element was shifted to
                 }
 
                 j -= 1
 
             # Insert key at correct position
-            data[j + 1] = key
+            timeline.set(j + 1, key)
 
-            # Update sorted indices
+            # Update sorted indices (a new list: earlier steps keep theirs)
             sorted_indices = list(range(i + 1))
 
             step_number += 1
@@ -109,24 +125,37 @@ class InsertionSort(BaseAlgorithm):
                 "algorithm": self._name,
                 "step_number": step_number,
                 "description": f"Inserted {key} at position {j + 1}",
-                "data_structure": Array(data.copy()),
+                "data_structure": timeline.snapshot(),
                 "comparing": [],
                 "swapping": [],
-                "sorted": sorted_indices.copy(),
+                "sorted": sorted_indices,
                 "current": [j + 1],
             }
 
-            # Update the original data structure
-            for k in range(n):
-                arr.set(k, data[k])
+        # Update the original data structure once, now that it is sorted
+        arr.batch_set(data)
 
         # Final step: sorted
         step_number += 1
-        yield {
+        yield self._complete_step(timeline.snapshot(), n, step_number)
+
+    def _complete_step(self, data_structure, n: int, step_number: int) -> Dict[str, Any]:
+        """
+        Build the final step of the sort.
+
+        Args:
+            data_structure: Array holding the sorted data
+            n: Number of elements
+            step_number: Number of this step
+
+        Returns:
+            Dictionary containing step information
+        """
+        return {
             "algorithm": self._name,
             "step_number": step_number,
             "description": "Array is now sorted",
-            "data_structure": Array(data.copy()),
+            "data_structure": data_structure,
             "comparing": [],
             "swapping": [],
             "sorted": list(range(n)),
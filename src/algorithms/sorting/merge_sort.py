@@ -2,8 +2,19 @@
 Merge Sort algorithm implementation with step tracking.
 """
 
+from bisect import bisect_left, bisect_right
+from typing import Any, Dict
+
 from ...data_structures.array import Array
 from ...visualization.base import BaseAlgorithm
+from ...visualization.step_views import ArrayTimeline, SliceView
+from ._kernels import (
+    MIN_GALLOP,
+    find_runs,
+    merge_sort_kernel,
+    natural_merge_sort_kernel,
+    run_merges,
+)
 
 
 class MergeSort(BaseAlgorithm):
@@ -11,11 +22,22 @@ class MergeSort(BaseAlgorithm):
     Merge Sort algorithm with visualization support.
     """
 
-    def __init__(self):
-        """Initialize the merge sort algorithm."""
+    def __init__(self, natural_runs: bool = False):
+        """
+        Initialize the merge sort algorithm.
+
+        Args:
+            natural_runs: Merge the ascending and descending runs already
+                present in the input, as timsort does, instead of halving
+                ranges down to single elements. Sorted or nearly sorted
+                input then takes O(n) work and few steps.
+        """
         super().__init__()
         self._name = "Merge Sort"
+        self._natural_runs = natural_runs
         self._step_number = 0
+        self._timeline = None
+        self._indices = None
 
     def _run(self, data_structure):
         """
@@ -37,16 +59,50 @@ class MergeSort(BaseAlgorithm):
         # Track the current range being processed
         self._current_range = (0, n - 1)
 
-        # Call recursive merge sort
-        yield from self._merge_sort(data, 0, n - 1, arr)
+        if not self._record_steps:
+            # Nothing to show along the way: sort with the step-free kernel
+            # and report just the final step
+            kernel = natural_merge_sort_kernel if self._natural_runs else merge_sort_kernel
+            self._step_number = kernel(data)
+            arr.batch_set(data)
+            yield self._complete_step(Array(data), n)
+            return
+
+        # Writes go through the timeline so steps can take O(1) snapshots
+        # instead of copies
+        self._timeline = ArrayTimeline(data)
+        # Index ranges in steps are views of this list rather than new lists
+        self._indices = list(range(n))
+
+        if self._natural_runs:
+            yield from self._natural_merge_sort(data)
+        else:
+            # Call recursive merge sort
+            yield from self._merge_sort(data, 0, n - 1)
+
+        # Update the original data structure once, now that it is sorted
+        arr.batch_set(data)
 
         # Final step: sorted
         self._step_number += 1
-        yield {
+        yield self._complete_step(self._timeline.snapshot(), n)
+
+    def _complete_step(self, data_structure, n: int) -> Dict[str, Any]:
+        """
+        Build the final step of the sort.
+
+        Args:
+            data_structure: Array holding the sorted data
+            n: Number of elements
+
+        Returns:
+            Dictionary containing step information
+        """
+        return {
             "algorithm": self._name,
             "step_number": self._step_number,
             "description": "Array is now sorted",
-            "data_structure": Array(data.copy()),
+            "data_structure": data_structure,
             "comparing": [],
             "swapping": [],
             "sorted": list(range(n)),
@@ -56,7 +112,7 @@ class MergeSort(BaseAlgorithm):
             "right_range": None,
         }
 
-    def _merge_sort(self, data, left, right, arr):
+    def _merge_sort(self, data, left, right):
         """
         Recursive merge sort function.
 
@@ -64,7 +120,6 @@ class MergeSort(BaseAlgorithm):
             data: List to sort
             left: Left index
             right: Right index
-            arr: Original Array object for updates
 
         Yields:
             Step dictionaries
@@ -77,26 +132,68 @@ class MergeSort(BaseAlgorithm):
                 "algorithm": self._name,
                 "step_number": self._step_number,
                 "description": f"Dividing array from index {left} to {right} at {mid}",
-                "data_structure": Array(data.copy()),
+                "data_structure": self._timeline.snapshot(),
                 "comparing": [],
                 "swapping": [],
                 "sorted": [],
-                "current": list(range(left, right + 1)),
+                "current": SliceView(self._indices, left, right + 1),
                 "merge": None,
                 "left_range": (left, mid),
                 "right_range": (mid + 1, right),
             }
 
             # Sort left half
-            yield from self._merge_sort(data, left, mid, arr)
+            yield from self._merge_sort(data, left, mid)
 
             # Sort right half
-            yield from self._merge_sort(data, mid + 1, right, arr)
+            yield from self._merge_sort(data, mid + 1, right)
 
             # Merge the sorted halves
-            yield from self._merge(data, left, mid, right, arr)
+            yield from self._merge(data, left, mid, right)
 
-    def _merge(self, data, left, mid, right, arr):
+    def _natural_merge_sort(self, data):
+        """
+        Merge sort over the natural runs of the data.
+
+        Descending runs are reversed in place, then adjacent runs are merged
+        in the order timsort would merge them.
+
+        Args:
+            data: List to sort
+
+        Yields:
+            Step dictionaries
+        """
+        runs = find_runs(data)
+
+        for start, end, descending in runs:
+            if descending:
+                for offset in range((end - start + 1) // 2):
+                    self._timeline.swap(start + offset, end - offset)
+
+                description = f"Found descending run [{start}..{end}], reversed it"
+            else:
+                description = f"Found ascending run [{start}..{end}]"
+
+            self._step_number += 1
+            yield {
+                "algorithm": self._name,
+                "step_number": self._step_number,
+                "description": description,
+                "data_structure": self._timeline.snapshot(),
+                "comparing": [],
+                "swapping": [],
+                "sorted": [],
+                "current": SliceView(self._indices, start, end + 1),
+                "merge": None,
+                "left_range": (start, end),
+                "right_range": None,
+            }
+
+        for left, mid, right in run_merges(runs):
+            yield from self._merge(data, left, mid, right, gallop=True)
+
+    def _merge(self, data, left, mid, right, gallop=False):
         """
         Merge two sorted subarrays.
 
@@ -105,7 +202,8 @@ class MergeSort(BaseAlgorithm):
             left: Left index
             mid: Middle index
             right: Right index
-            arr: Original Array object for updates
+            gallop: Once one half has won MIN_GALLOP comparisons in a row,
+                move the rest of its winning elements in a single step
 
         Yields:
             Step dictionaries
@@ -116,6 +214,7 @@ class MergeSort(BaseAlgorithm):
 
         i = j = 0
         k = left
+        left_wins = right_wins = 0
 
         comparing_indices = []
 
@@ -124,11 +223,11 @@ class MergeSort(BaseAlgorithm):
             "algorithm": self._name,
             "step_number": self._step_number,
             "description": f"Merging sorted halves [{left}..{mid}] and [{mid+1}..{right}]",
-            "data_structure": Array(data.copy()),
+            "data_structure": self._timeline.snapshot(),
             "comparing": [],
             "swapping": [],
             "sorted": [],
-            "current": list(range(left, right + 1)),
+            "current": SliceView(self._indices, left, right + 1),
             "merge": {"left": left, "mid": mid, "right": right},
             "left_range": (left, mid),
             "right_range": (mid + 1, right),
@@ -136,6 +235,42 @@ class MergeSort(BaseAlgorithm):
 
         # Merge the two arrays
         while i < len(left_arr) and j < len(right_arr):
+            if gallop and max(left_wins, right_wins) >= MIN_GALLOP:
+                # Binary-search how many more elements the winning half
+                # places before the other half's next element
+                if left_wins:
+                    half, source, start = "left", left_arr, i
+                    end = bisect_right(left_arr, right_arr[j], i)
+                    i = end
+                else:
+                    half, source, start = "right", right_arr, j
+                    end = bisect_left(right_arr, left_arr[i], j)
+                    j = end
+                left_wins = right_wins = 0
+
+                if end > start:
+                    count = end - start
+                    for offset in range(count):
+                        self._timeline.set(k + offset, source[start + offset])
+
+                    self._step_number += 1
+                    yield {
+                        "algorithm": self._name,
+                        "step_number": self._step_number,
+                        "description": f"Galloping: moved {count} elements of the {half} half to [{k}..{k + count - 1}]",
+                        "data_structure": self._timeline.snapshot(),
+                        "comparing": [],
+                        "swapping": [],
+                        "sorted": SliceView(self._indices, left, k + count),
+                        "current": SliceView(self._indices, k, k + count),
+                        "merge": {"left": left, "mid": mid, "right": right},
+                        "left_range": (left, mid),
+                        "right_range": (mid + 1, right),
+                    }
+
+                    k += count
+                    continue
+
             comparing_indices = [left + i, mid + 1 + j]
 
             self._step_number += 1
@@ -143,7 +278,7 @@ class MergeSort(BaseAlgorithm):
                 "algorithm": self._name,
                 "step_number": self._step_number,
                 "description": f"Comparing {left_arr[i]} and {right_arr[j]}",
-                "data_structure": Array(data.copy()),
+                "data_structure": self._timeline.snapshot(),
                 "comparing": comparing_indices,
                 "swapping": [],
                 "sorted": [],
@@ -154,24 +289,25 @@ class MergeSort(BaseAlgorithm):
             }
 
             if left_arr[i] <= right_arr[j]:
-                data[k] = left_arr[i]
+                self._timeline.set(k, left_arr[i])
                 i += 1
+                left_wins += 1
+                right_wins = 0
             else:
-                data[k] = right_arr[j]
+                self._timeline.set(k, right_arr[j])
                 j += 1
-
-            # Update the original array
-            arr.set(k, data[k])
+                right_wins += 1
+                left_wins = 0
 
             self._step_number += 1
             yield {
                 "algorithm": self._name,
                 "step_number": self._step_number,
                 "description": f"Placed {data[k]} at position {k}",
-                "data_structure": Array(data.copy()),
+                "data_structure": self._timeline.snapshot(),
                 "comparing": [],
                 "swapping": [],
-                "sorted": list(range(left, k + 1)),
+                "sorted": SliceView(self._indices, left, k + 1),
                 "current": [k],
                 "merge": {"left": left, "mid": mid, "right": right},
                 "left_range": (left, mid),
@@ -182,18 +318,17 @@ class MergeSort(BaseAlgorithm):
 
         # Copy remaining elements from left_arr
         while i < len(left_arr):
-            data[k] = left_arr[i]
-            arr.set(k, data[k])
+            self._timeline.set(k, left_arr[i])
 
             self._step_number += 1
             yield {
                 "algorithm": self._name,
                 "step_number": self._step_number,
                 "description": f"Copying remaining element {left_arr[i]} from left half",
-                "data_structure": Array(data.copy()),
+                "data_structure": self._timeline.snapshot(),
                 "comparing": [],
                 "swapping": [],
-                "sorted": list(range(left, k + 1)),
+                "sorted": SliceView(self._indices, left, k + 1),
                 "current": [k],
                 "merge": {"left": left, "mid": mid, "right": right},
                 "left_range": (left, mid),
@@ -205,18 +340,17 @@ class MergeSort(BaseAlgorithm):
 
         # Copy remaining elements from right_arr
         while j < len(right_arr):
-            data[k] = right_arr[j]
-            arr.set(k, data[k])
+            self._timeline.set(k, right_arr[j])
 
             self._step_number += 1
             yield {
                 "algorithm": self._name,
                 "step_number": self._step_number,
                 "description": f"Copying remaining element {right_arr[j]} from right half",
-                "data_structure": Array(data.copy()),
+                "data_structure": self._timeline.snapshot(),
                 "comparing": [],
                 "swapping": [],
-                "sorted": list(range(left, k + 1)),
+                "sorted": SliceView(self._indices, left, k + 1),
                 "current": [k],
                 "merge": {"left": left, "mid": mid, "right": right},
                 "left_range": (left, mid),
@@ -232,10 +366,10 @@ class MergeSort(BaseAlgorithm):
             "algorithm": self._name,
             "step_number": self._step_number,
             "description": f"Completed merging range [{left}..{right}]",
-            "data_structure": Array(data.copy()),
+            "data_structure": self._timeline.snapshot(),
             "comparing": [],
             "swapping": [],
-            "sorted": list(range(left, right + 1)),
+            "sorted": SliceView(self._indices, left, right + 1),
             "current": [],
             "merge": None,
             "left_range": None,
@@ -2,8 +2,12 @@
 Quick Sort algorithm implementation with step tracking.
 """
 
+from typing import Any, Dict
+
 from ...data_structures.array import Array
 from ...visualization.base import BaseAlgorithm
+from ...visualization.step_views import ArrayTimeline, SliceView
+from ._kernels import heap_sort_swaps, median_of_three, quick_sort_depth_limit, quick_sort_kernel
 
 
 class QuickSort(BaseAlgorithm):
@@ -11,11 +15,22 @@ class QuickSort(BaseAlgorithm):
     Quick Sort algorithm with visualization support.
     """
 
-    def __init__(self):
-        """Initialize the quick sort algorithm."""
+    def __init__(self, verbose: bool = True):
+        """
+        Initialize the quick sort algorithm.
+
+        Args:
+            verbose: Yield a step when a partition leaves an element where
+                it is. Those steps change nothing. Turning them off drops
+                about 2% of the steps on random input and about 30% on
+                nearly sorted input.
+        """
         super().__init__()
         self._name = "Quick Sort"
+        self._verbose = verbose
         self._step_number = 0
+        self._timeline = None
+        self._indices = None
 
     def _run(self, data_structure):
         """
@@ -34,16 +49,46 @@ class QuickSort(BaseAlgorithm):
         # Convert to list for easier manipulation
         data = arr.to_list()
 
+        if not self._record_steps:
+            # Nothing to show along the way: sort with the step-free kernel
+            # and report just the final step
+            self._step_number = quick_sort_kernel(data, self._verbose)
+            arr.batch_set(data)
+            yield self._complete_step(Array(data), n)
+            return
+
+        # Writes go through the timeline so steps can take O(1) snapshots
+        # instead of copies
+        self._timeline = ArrayTimeline(data)
+        # Index ranges in steps are views of this list rather than new lists
+        self._indices = list(range(n))
+
         # Call recursive quick sort
-        yield from self._quick_sort(data, 0, n - 1, arr)
+        yield from self._quick_sort(data, 0, n - 1, quick_sort_depth_limit(n))
+
+        # Update the original data structure once, now that it is sorted
+        arr.batch_set(data)
 
         # Final step: sorted
         self._step_number += 1
-        yield {
+        yield self._complete_step(self._timeline.snapshot(), n)
+
+    def _complete_step(self, data_structure, n: int) -> Dict[str, Any]:
+        """
+        Build the final step of the sort.
+
+        Args:
+            data_structure: Array holding the sorted data
+            n: Number of elements
+
+        Returns:
+            Dictionary containing step information
+        """
+        return {
             "algorithm": self._name,
             "step_number": self._step_number,
             "description": "Array is now sorted",
-            "data_structure": Array(data.copy()),
+            "data_structure": data_structure,
             "comparing": [],
             "swapping": [],
             "sorted": list(range(n)),
@@ -52,7 +97,7 @@ class QuickSort(BaseAlgorithm):
             "partition": None,
         }
 
-    def _quick_sort(self, data, low, high, arr):
+    def _quick_sort(self, data, low, high, depth_limit):
         """
         Recursive quick sort function.
 
@@ -60,20 +105,73 @@ class QuickSort(BaseAlgorithm):
             data: List to sort
             low: Starting index
             high: Ending index
-            arr: Original Array object for updates
+            depth_limit: Partitions left before the range is heap sorted
+                instead (introsort), which bounds the recursion depth
 
         Yields:
             Step dictionaries
         """
         if low < high:
+            if depth_limit == 0:
+                yield from self._heap_sort_range(data, low, high)
+                return
+
             # Partition the array and get pivot index
-            pivot_idx = yield from self._partition(data, low, high, arr)
+            pivot_idx = yield from self._partition(data, low, high)
 
             # Sort elements before and after partition
-            yield from self._quick_sort(data, low, pivot_idx - 1, arr)
-            yield from self._quick_sort(data, pivot_idx + 1, high, arr)
+            yield from self._quick_sort(data, low, pivot_idx - 1, depth_limit - 1)
+            yield from self._quick_sort(data, pivot_idx + 1, high, depth_limit - 1)
+
+    def _heap_sort_range(self, data, low, high):
+        """
+        Heap sort a range that has hit the partitioning depth limit.
+
+        Args:
+            data: List to sort
+            low: Starting index
+            high: Ending index
+
+        Yields:
+            Step dictionaries
+        """
+        self._step_number += 1
+        yield {
+            "algorithm": self._name,
+            "step_number": self._step_number,
+            "description": f"Depth limit reached: heap sorting range [{low}..{high}]",
+            "data_structure": self._timeline.snapshot(),
+            "comparing": [],
+            "swapping": [],
+            "sorted": [],
+            "current": SliceView(self._indices, low, high + 1),
+            "pivot": None,
+            "partition": {"low": low, "high": high},
+        }
+
+        for kind, i, j in heap_sort_swaps(data, low, high):
+            if kind == "sift":
+                description = f"Swapping {data[j]} above {data[i]} to restore the heap"
+            else:
+                description = f"Moving heap maximum {data[i]} to position {j}"
 
-    def _partition(self, data, low, high, arr):
+            self._timeline.swap(i, j)
+
+            self._step_number += 1
+            yield {
+                "algorithm": self._name,
+                "step_number": self._step_number,
+                "description": description,
+                "data_structure": self._timeline.snapshot(),
+                "comparing": [],
+                "swapping": [i, j],
+                "sorted": [j] if kind == "extract" else [],
+                "current": [i, j],
+                "pivot": None,
+                "partition": {"low": low, "high": high},
+            }
+
+    def _partition(self, data, low, high):
         """
         Partition the array around a pivot element.
 
@@ -81,12 +179,32 @@ class QuickSort(BaseAlgorithm):
             data: List to partition
             low: Starting index
             high: Ending index
-            arr: Original Array object for updates
 
         Yields:
             Step dictionaries
         """
-        # Choose rightmost element as pivot
+        if high - low >= 2:
+            # Median-of-three: move the median of the first, middle and last
+            # elements into the pivot slot, so sorted input still splits evenly
+            median = median_of_three(data, low, high)
+            if median != high:
+                self._timeline.swap(median, high)
+
+                self._step_number += 1
+                yield {
+                    "algorithm": self._name,
+                    "step_number": self._step_number,
+                    "description": f"Moving median of three {data[high]} from index {median} to {high} as pivot",
+                    "data_structure": self._timeline.snapshot(),
+                    "comparing": [],
+                    "swapping": [median, high],
+                    "sorted": [],
+                    "current": [low, (low + high) // 2, high],
+                    "pivot": high,
+                    "partition": {"low": low, "high": high},
+                }
+
+        # The rightmost element is the pivot
         pivot = data[high]
         pivot_index = high
 
@@ -95,11 +213,11 @@ class QuickSort(BaseAlgorithm):
             "algorithm": self._name,
             "step_number": self._step_number,
             "description": f"Selecting pivot: {pivot} at index {high}",
-            "data_structure": Array(data.copy()),
+            "data_structure": self._timeline.snapshot(),
             "comparing": [],
             "swapping": [],
             "sorted": [],
-            "current": list(range(low, high + 1)),
+            "current": SliceView(self._indices, low, high + 1),
             "pivot": pivot_index,
             "partition": {"low": low, "high": high},
         }
@@ -113,7 +231,7 @@ class QuickSort(BaseAlgorithm):
                 "algorithm": self._name,
                 "step_number": self._step_number,
                 "description": f"Comparing {data[j]} with pivot {pivot}",
-                "data_structure": Array(data.copy()),
+                "data_structure": self._timeline.snapshot(),
                 "comparing": [j, pivot_index],
                 "swapping": [],
                 "sorted": [],
@@ -128,18 +246,14 @@ class QuickSort(BaseAlgorithm):
 
                 if i != j:
                     # Swap elements
-                    data[i], data[j] = data[j], data[i]
-
-                    # Update the original array
-                    arr.set(i, data[i])
-                    arr.set(j, data[j])
+                    self._timeline.swap(i, j)
 
                     self._step_number += 1
                     yield {
                         "algorithm": self._name,
                         "step_number": self._step_number,
                         "description": f"Swapping {data[i]} and {data[j]}",
-                        "data_structure": Array(data.copy()),
+                        "data_structure": self._timeline.snapshot(),
                         "comparing": [i, j],
                         "swapping": [i, j],
                         "sorted": [],
@@ -147,14 +261,14 @@ class QuickSort(BaseAlgorithm):
                         "pivot": pivot_index,
                         "partition": {"low": low, "high": high, "i": i},
                     }
-                else:
+                elif self._verbose:
                     # Element is already in correct position relative to pivot
                     self._step_number += 1
                     yield {
                         "algorithm": self._name,
                         "step_number": self._step_number,
                         "description": f"{data[j]} is already in correct position",
-                        "data_structure": Array(data.copy()),
+                        "data_structure": self._timeline.snapshot(),
                         "comparing": [],
                         "swapping": [],
                         "sorted": [],
@@ -165,18 +279,14 @@ class QuickSort(BaseAlgorithm):
 
         # Place pivot in correct position
         if i + 1 != high:
-            data[i + 1], data[high] = data[high], data[i + 1]
-
-            # Update the original array
-            arr.set(i + 1, data[i + 1])
-            arr.set(high, data[high])
+            self._timeline.swap(i + 1, high)
 
             self._step_number += 1
             yield {
                 "algorithm": self._name,
                 "step_number": self._step_number,
                 "description": f"Placing pivot {pivot} at final position {i + 1}",
-                "data_structure": Array(data.copy()),
+                "data_structure": self._timeline.snapshot(),
                 "comparing": [],
                 "swapping": [i + 1, high],
                 "sorted": [i + 1],
@@ -191,7 +301,7 @@ class QuickSort(BaseAlgorithm):
                 "algorithm": self._name,
                 "step_number": self._step_number,
                 "description": f"Pivot {pivot} is already in correct position",
-                "data_structure": Array(data.copy()),
+                "data_structure": self._timeline.snapshot(),
                 "comparing": [],
                 "swapping": [],
                 "sorted": [high],
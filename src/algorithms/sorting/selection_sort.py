@@ -2,8 +2,12 @@
 Selection Sort algorithm implementation with step tracking.
 """
 
+from typing import Any, Dict
+
 from ...data_structures.array import Array
 from ...visualization.base import BaseAlgorithm
+from ...visualization.step_views import ArrayTimeline, SliceView
+from ._kernels import selection_sort_kernel
 
 
 class SelectionSort(BaseAlgorithm):
@@ -33,6 +37,19 @@ class SelectionSort(BaseAlgorithm):
         # Convert to list for easier manipulation
         data = arr.to_list()
 
+        if not self._record_steps:
+            # Nothing to show along the way: sort with the step-free kernel
+            # and report just the final step
+            step_number = selection_sort_kernel(data)
+            arr.batch_set(data)
+            yield self._complete_step(Array(data), n, step_number)
+            return
+
+        # Writes go through the timeline so steps can take O(1) snapshots
+        # instead of copies
+        timeline = ArrayTimeline(data)
+
+        # Only ever appended to, so steps can hold views of it
         sorted_indices = []
 
         for i in range(n):
@@ -46,10 +63,10 @@ class SelectionSort(BaseAlgorithm):
                 "algorithm": self._name,
                 "step_number": step_number,
                 "description": f"Finding minimum element starting from index {i}",
-                "data_structure": Array(data.copy()),
+                "data_structure": timeline.snapshot(),
                 "comparing": [],
                 "swapping": [],
-                "sorted": sorted_indices.copy(),
+                "sorted": SliceView(sorted_indices),
                 "current": [i],
             }
 
@@ -61,10 +78,10 @@ class SelectionSort(BaseAlgorithm):
                     "algorithm": self._name,
                     "step_number": step_number,
                     "description": f"Comparing {data[j]} with current minimum {data[min_idx]}",
-                    "data_structure": Array(data.copy()),
+                    "data_structure": timeline.snapshot(),
                     "comparing": [j, min_idx],
                     "swapping": [],
-                    "sorted": sorted_indices.copy(),
+                    "sorted": SliceView(sorted_indices),
                     "current": [j, min_idx],
                 }
 
@@ -80,21 +97,17 @@ class SelectionSort(BaseAlgorithm):
                     "algorithm": self._name,
                     "step_number": step_number,
                     "description": f"Swapping {data[i]} with minimum {data[min_idx]}",
-                    "data_structure": Array(data.copy()),
+                    "data_structure": timeline.snapshot(),
                     "comparing": [],
                     "swapping": [i, min_idx],
-                    "sorted": sorted_indices.copy(),
+                    "sorted": SliceView(sorted_indices),
                     "current": [i, min_idx],
                 }
 
-                data[i], data[min_idx] = data[min_idx], data[i]
+                timeline.swap(i, min_idx)
 
             sorted_indices.append(i)
 
-            # Update the original data structure
-            for k in range(n):
-                arr.set(k, data[k])
-
             step_number += 1
 
             # Yield step: element in place
@@ -102,20 +115,37 @@ class SelectionSort(BaseAlgorithm):
                 "algorithm": self._name,
                 "step_number": step_number,
                 "description": f"Element {data[i]} is now in its correct position",
-                "data_structure": Array(data.copy()),
+                "data_structure": timeline.snapshot(),
                 "comparing": [],
                 "swapping": [],
-                "sorted": sorted_indices.copy(),
+                "sorted": SliceView(sorted_indices),
                 "current": [i],
             }
 
+        # Update the original data structure once, now that it is sorted
+        arr.batch_set(data)
+
         # Final step: sorted
         step_number += 1
-        yield {
+        yield self._complete_step(timeline.snapshot(), n, step_number)
+
+    def _complete_step(self, data_structure, n: int, step_number: int) -> Dict[str, Any]:
+        """
+        Build the final step of the sort.
+
+        Args:
+            data_structure: Array holding the sorted data
+            n: Number of elements
+            step_number: Number of this step
+
+        Returns:
+            Dictionary containing step information
+        """
+        return {
             "algorithm": self._name,
             "step_number": step_number,
             "description": "Array is now sorted",
-            "data_structure": Array(data.copy()),
+            "data_structure": data_structure,
             "comparing": [],
             "swapping": [],
             "sorted": list(range(n)),
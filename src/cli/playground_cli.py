@@ -6,10 +6,26 @@ from pathlib import Path
 
 import click
 
-from ..playground.searching_playground import SearchingPlayground
-from ..playground.sorting_playground import SortingPlayground
-from ..templates.algorithm_templates import AlgorithmTemplates
-from ..testing.implementation_tester import ImplementationTester
+# Playgrounds, templates and the tester are imported by the commands that use
+# them: they pull in matplotlib and NumPy, which --help and template do not need
+
+
+def _parse_int_csv(text):
+    """
+    Parse comma-separated integers.
+
+    int() ignores surrounding whitespace, so the items need no stripping.
+
+    Args:
+        text: Input such as "5, 3, 8"
+
+    Returns:
+        List of integers
+
+    Raises:
+        ValueError: If an item is not an integer
+    """
+    return list(map(int, text.split(",")))
 
 
 @click.group()
@@ -68,11 +84,13 @@ def playground(
 ):
     """Launch an interactive playground."""
     if playground_type == "sorting":
+        from ..playground.sorting_playground import SortingPlayground
+
         pg = SortingPlayground()
 
         # Set input
         if input:
-            input_data = [int(x.strip()) for x in input.split(",")]
+            input_data = _parse_int_csv(input)
         else:
             generators = pg.get_input_generators()
             input_data = generators[type](size)
@@ -90,19 +108,20 @@ def playground(
             pg.visualize(steps, interactive=True)
         else:
             # Interactive mode
-            print("\nAvailable algorithms:", ", ".join(pg.get_available_algorithms()))
-            algo = click.prompt(
-                "Select algorithm", type=click.Choice(pg.get_available_algorithms())
-            )
+            algorithms = pg.get_available_algorithms()
+            print("\nAvailable algorithms:", ", ".join(algorithms))
+            algo = click.prompt("Select algorithm", type=click.Choice(algorithms))
             steps = pg.run_algorithm(algo)
             pg.visualize(steps, interactive=True)
 
     elif playground_type == "searching":
+        from ..playground.searching_playground import SearchingPlayground
+
         pg = SearchingPlayground()
 
         # Set input (must be sorted for binary search)
         if input:
-            input_data = [int(x.strip()) for x in input.split(",")]
+            input_data = _parse_int_csv(input)
         else:
             from ..playground.base import InputGenerator
 
@@ -123,10 +142,9 @@ def playground(
             steps = pg.run_algorithm(algorithm)
             pg.visualize(steps, interactive=True)
         else:
-            print("\nAvailable algorithms:", ", ".join(pg.get_available_algorithms()))
-            algo = click.prompt(
-                "Select algorithm", type=click.Choice(pg.get_available_algorithms())
-            )
+            algorithms = pg.get_available_algorithms()
+            print("\nAvailable algorithms:", ", ".join(algorithms))
+            algo = click.prompt("Select algorithm", type=click.Choice(algorithms))
             steps = pg.run_algorithm(algo)
             pg.visualize(steps, interactive=True)
 
@@ -138,12 +156,11 @@ def playground(
 
         # Set input
         if input:
-            input_data = [x.strip() for x in input.split(",")]
             # Try to convert to integers if possible
             try:
-                input_data = [int(x) for x in input_data]
+                input_data = _parse_int_csv(input)
             except ValueError:
-                pass
+                input_data = [x.strip() for x in input.split(",")]
         else:
             import random
 
@@ -161,30 +178,17 @@ def playground(
             return
 
         if algorithm:
-            # Run operation
-            if algorithm == "traverse":
-                traversal_type = traversal or "inorder"
-                steps = pg.traverse(traversal_type)
-            elif algorithm == "insert":
-                value = click.prompt("Enter value to insert", type=int)
-                steps = pg.insert(value)
-            elif algorithm == "delete":
-                value = click.prompt("Enter value to delete", type=int)
-                steps = pg.delete(value)
-            elif algorithm == "search":
-                value = click.prompt("Enter value to search", type=int)
-                steps = pg.search(value)
-            else:
-                click.echo(f"Unknown operation: {algorithm}")
-                return
-            pg.visualize(steps, interactive=True)
+            op = algorithm
         else:
             # Interactive mode
-            print("\nAvailable operations:", ", ".join(pg.get_available_algorithms()))
-            op = click.prompt(
-                "Select operation", type=click.Choice(pg.get_available_algorithms())
-            )
-            if op == "traverse":
+            operations = pg.get_available_algorithms()
+            print("\nAvailable operations:", ", ".join(operations))
+            op = click.prompt("Select operation", type=click.Choice(operations))
+
+        # Run operation
+        if op == "traverse":
+            traversal_type = traversal
+            if traversal_type is None and not algorithm:
                 traversal_type = click.prompt(
                     "Traversal type",
                     type=click.Choice(
@@ -192,17 +196,14 @@ def playground(
                     ),
                     default="inorder",
                 )
-                steps = pg.traverse(traversal_type)
-            elif op == "insert":
-                value = click.prompt("Enter value to insert", type=int)
-                steps = pg.insert(value)
-            elif op == "delete":
-                value = click.prompt("Enter value to delete", type=int)
-                steps = pg.delete(value)
-            elif op == "search":
-                value = click.prompt("Enter value to search", type=int)
-                steps = pg.search(value)
-            pg.visualize(steps, interactive=True)
+            steps = pg.traverse(traversal_type or "inorder")
+        elif op in ("insert", "delete", "search"):
+            value = click.prompt(f"Enter value to {op}", type=int)
+            steps = getattr(pg, op)(value)
+        else:
+            click.echo(f"Unknown operation: {op}")
+            return
+        pg.visualize(steps, interactive=True)
 
     elif playground_type == "graph":
         from ..playground.graph_playground import GraphPlayground
@@ -239,10 +240,9 @@ def playground(
             pg.visualize(steps, interactive=True)
         else:
             # Interactive mode
-            print("\nAvailable algorithms:", ", ".join(pg.get_available_algorithms()))
-            algo = click.prompt(
-                "Select algorithm", type=click.Choice(pg.get_available_algorithms())
-            )
+            algorithms = pg.get_available_algorithms()
+            print("\nAvailable algorithms:", ", ".join(algorithms))
+            algo = click.prompt("Select algorithm", type=click.Choice(algorithms))
             start = start_vertex or click.prompt(
                 "Enter start vertex", default=vertices[0]
             )
@@ -265,33 +265,26 @@ def playground(
 
             input_data = [f"key{i}" for i in range(1, size + 1)]
 
-        pg.set_input(input_data, show_initialization=not skip_init)
+        if skip_init:
+            # No construction steps will be shown, so load the keys in one batch
+            pg.hash_table.batch_insert(input_data, input_data)
+        else:
+            pg.set_input(input_data)
         print(f"Hash Table Capacity: {pg.hash_table.get_capacity()}")
         print(f"Input keys: {input_data}")
 
+        if algorithm == "insert" and input_data:
+            # One animation for all keys instead of a figure per key
+            inserted = []
+            for key in input_data:
+                inserted.extend(pg.insert(key, f"value_{key}"))
+            # Number copies sequentially, leaving the returned steps as they are
+            steps = [dict(step, step_number=n) for n, step in enumerate(inserted, 1)]
+            pg.visualize(steps, interactive=False)
+            return
+
         if algorithm:
-            # Run operation
-            if algorithm == "insert":
-                if input_data:
-                    for key in input_data:
-                        steps = pg.insert(key, f"value_{key}")
-                        pg.visualize(steps, interactive=False)
-                else:
-                    key = click.prompt("Enter key to insert")
-                    value = click.prompt("Enter value", default=key)
-                    steps = pg.insert(key, value)
-                    pg.visualize(steps, interactive=True)
-            elif algorithm == "get":
-                key = click.prompt("Enter key to get")
-                steps = pg.get(key)
-                pg.visualize(steps, interactive=True)
-            elif algorithm == "delete":
-                key = click.prompt("Enter key to delete")
-                steps = pg.delete(key)
-                pg.visualize(steps, interactive=True)
-            else:
-                click.echo(f"Unknown operation: {algorithm}")
-                return
+            op = algorithm
         else:
             # Interactive mode - input already set with initialization visualization
             print("\nHash Table Stats:")
@@ -299,21 +292,22 @@ def playground(
             print(f"  Capacity: {pg.hash_table.get_capacity()}")
             print(f"  Load Factor: {pg.hash_table.get_load_factor():.2f}")
 
-            print("\nAvailable operations:", ", ".join(pg.get_available_algorithms()))
-            op = click.prompt(
-                "Select operation", type=click.Choice(pg.get_available_algorithms())
-            )
-            if op == "insert":
-                key = click.prompt("Enter key to insert")
-                value = click.prompt("Enter value", default=key)
-                steps = pg.insert(key, value)
-            elif op == "get":
-                key = click.prompt("Enter key to get")
-                steps = pg.get(key)
-            elif op == "delete":
-                key = click.prompt("Enter key to delete")
-                steps = pg.delete(key)
-            pg.visualize(steps, interactive=True)
+            operations = pg.get_available_algorithms()
+            print("\nAvailable operations:", ", ".join(operations))
+            op = click.prompt("Select operation", type=click.Choice(operations))
+
+        # Run operation
+        if op == "insert":
+            key = click.prompt("Enter key to insert")
+            value = click.prompt("Enter value", default=key)
+            steps = pg.insert(key, value)
+        elif op in ("get", "delete"):
+            key = click.prompt(f"Enter key to {op}")
+            steps = getattr(pg, op)(key)
+        else:
+            click.echo(f"Unknown operation: {op}")
+            return
+        pg.visualize(steps, interactive=True)
 
 
 @cli.command()
@@ -329,9 +323,13 @@ def playground(
 def demo(algorithm_name, size, type):
     """Run a quick demonstration of an algorithm."""
     if "sort" in algorithm_name.lower():
+        from ..playground.sorting_playground import SortingPlayground
+
         pg = SortingPlayground()
         pg.demo(algorithm_name, size, type)
     elif "search" in algorithm_name.lower():
+        from ..playground.searching_playground import SearchingPlayground
+
         pg = SearchingPlayground()
         pg.demo(algorithm_name, size)
     else:
@@ -351,6 +349,7 @@ def demo(algorithm_name, size, type):
 )
 def compare(algorithm1, algorithm2, size, type):
     """Compare two algorithms side-by-side."""
+    from ..playground.sorting_playground import SortingPlayground
 
     pg = SortingPlayground()
 
@@ -372,6 +371,8 @@ def compare(algorithm1, algorithm2, size, type):
 @click.option("--target", "-t", help="Target value (for searching)")
 def test(file_path, function, input, target):
     """Test a user implementation with visualization."""
+    from ..testing.implementation_tester import ImplementationTester
+
     tester = ImplementationTester()
 
     # Read code
@@ -379,7 +380,7 @@ def test(file_path, function, input, target):
 
     # Parse input
     if input:
-        input_data = [int(x.strip()) for x in input.split(",")]
+        input_data = _parse_int_csv(input)
     else:
         input_data = [64, 34, 25, 12, 22, 11, 90]  # Default
 
@@ -420,6 +421,8 @@ def test(file_path, function, input, target):
 @click.argument("algorithm_name")
 def template(algorithm_name):
     """Get a code template for an algorithm."""
+    from ..templates.algorithm_templates import AlgorithmTemplates
+
     template = AlgorithmTemplates.get_template(algorithm_name)
     if template:
         click.echo(template)
@@ -451,22 +454,21 @@ def export(file_path, format, animation):
 @cli.command()
 def list_algorithms():
     """List all available algorithms."""
-    pg_sort = SortingPlayground()
-    pg_search = SearchingPlayground()
+    from ..playground.graph_playground import GraphPlayground
+    from ..playground.searching_playground import SearchingPlayground
+    from ..playground.sorting_playground import SortingPlayground
 
+    # Class-level lists: no playground is built, so no algorithm module loads
     click.echo("\nSorting Algorithms:")
-    for algo in pg_sort.get_available_algorithms():
+    for algo in SortingPlayground.get_available_algorithms():
         click.echo(f"  - {algo}")
 
     click.echo("\nSearching Algorithms:")
-    for algo in pg_search.get_available_algorithms():
+    for algo in SearchingPlayground.get_available_algorithms():
         click.echo(f"  - {algo}")
 
     click.echo("\nGraph Algorithms:")
-    from ..playground.graph_playground import GraphPlayground
-
-    pg_graph = GraphPlayground()
-    for algo in pg_graph.get_available_algorithms():
+    for algo in GraphPlayground.get_available_algorithms():
         click.echo(f"  - {algo}")
 
 
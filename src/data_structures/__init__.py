@@ -3,15 +3,43 @@ Data Structures Module
 Core implementations of fundamental data structures.
 """
 
-from .array import Array
-from .linked_list import LinkedList
-from .stack import Stack
-from .queue import Queue
-from .binary_tree import BinaryTree
-from .binary_search_tree import BinarySearchTree
-from .avl_tree import AVLTree
-from .graph import Graph
-from .hash_table import HashTable
-
+# Lazy imports: importing any one submodule (e.g. .array) runs this file
+# first, so eager imports here would load every data structure each time
 __all__ = ['Array', 'LinkedList', 'Stack', 'Queue', 'BinaryTree', 'BinarySearchTree', 'AVLTree', 'Graph', 'HashTable']
 
+
+def __getattr__(name):
+    """Lazy import for data structure classes."""
+    if name == 'Array':
+        from .array import Array
+        return Array
+    elif name == 'LinkedList':
+        from .linked_list import LinkedList
+        return LinkedList
+    elif name == 'Stack':
+        from .stack import Stack
+        return Stack
+    elif name == 'Queue':
+        from .queue import Queue
+        return Queue
+    elif name == 'BinaryTree':
+        from .binary_tree import BinaryTree
+        return BinaryTree
+    elif name == 'BinarySearchTree':
+        from .binary_search_tree import BinarySearchTree
+        return BinarySearchTree
+    elif name == 'AVLTree':
+        from .avl_tree import AVLTree
+        return AVLTree
+    elif name == 'Graph':
+        from .graph import Graph
+        return Graph
+    elif name == 'HashTable':
+        from .hash_table import HashTable
+        return HashTable
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+
+def __dir__():
+    """List the lazily imported classes alongside the module globals."""
+    return sorted(set(globals()) | set(__all__))
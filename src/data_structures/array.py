@@ -19,9 +19,16 @@ class Array(BaseDataStructure):
 
         Args:
             initial_data: Optional initial data to populate the array
+                (a list or a NumPy array); it is always copied
         """
         super().__init__()
-        self._data = list(initial_data) if initial_data else []
+        if initial_data is None:
+            self._data = []
+        elif hasattr(initial_data, "tolist"):
+            # NumPy arrays convert in one C-level pass to native Python values
+            self._data = initial_data.tolist()
+        else:
+            self._data = list(initial_data)
 
         # Notify visualizer of initialization
         self._notify_visualizer('init', {
@@ -149,6 +156,29 @@ class Array(BaseDataStructure):
             'new_value': value
         })
 
+    def batch_set(self, values: List[Any]) -> None:
+        """
+        Overwrite every element at once.
+
+        The copy runs in C and the visualizer is notified once for the whole
+        batch instead of once per element.
+
+        Args:
+            values: New contents, with the same length as the array
+
+        Raises:
+            ValueError: If values does not have the same length as the array
+        """
+        if len(values) != len(self._data):
+            raise ValueError(
+                f"batch_set expects {len(self._data)} values, got {len(values)}"
+            )
+        self._data[:] = values
+        self._notify_visualizer('batch_set', {
+            'data_structure': self,
+            'count': len(values)
+        })
+
     def _get_internal_state(self) -> List[Any]:
         """
         Get the internal state representation.
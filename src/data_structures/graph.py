@@ -26,6 +26,11 @@ class Graph(BaseDataStructure):
         self._adjacency_list: Dict[Any, List[Tuple[Any, Optional[float]]]] = {}
         self._directed = directed
         self._size = 0
+        # Cached read-only views, rebuilt after any mutation
+        self._version = 0
+        self._csr = None
+        self._csr_lookup = None
+        self._neighbor_views: Dict[Any, Tuple[Any, ...]] = {}
 
         # Add initial vertices
         if initial_vertices:
@@ -49,6 +54,7 @@ class Graph(BaseDataStructure):
         if vertex not in self._adjacency_list:
             self._adjacency_list[vertex] = []
             self._size += 1
+            self._invalidate_views()
             self._notify_visualizer('add_vertex', {
                 'data_structure': self,
                 'vertex': vertex
@@ -81,6 +87,7 @@ class Graph(BaseDataStructure):
         # Remove vertex
         del self._adjacency_list[vertex]
         self._size -= 1
+        self._invalidate_views()
 
         self._notify_visualizer('remove_vertex', {
             'data_structure': self,
@@ -101,6 +108,8 @@ class Graph(BaseDataStructure):
         self.add_vertex(from_vertex)
         self.add_vertex(to_vertex)
 
+        self._invalidate_views()
+
         # Add edge
         if (to_vertex, weight) not in self._adjacency_list[from_vertex]:
             self._adjacency_list[from_vertex].append((to_vertex, weight))
@@ -137,6 +146,7 @@ class Graph(BaseDataStructure):
             (v, w) for v, w in self._adjacency_list[from_vertex] if v != to_vertex
         ]
         removed = len(self._adjacency_list[from_vertex]) < original_length
+        self._invalidate_views()
 
         # If undirected, remove reverse edge
         if not self._directed and to_vertex in self._adjacency_list:
@@ -165,6 +175,74 @@ class Graph(BaseDataStructure):
         """
         return self._adjacency_list.get(vertex, []).copy()
 
+    def neighbors_view(self, vertex: Any) -> Tuple[Any, ...]:
+        """
+        Get the neighbor vertices of a vertex without copying.
+
+        Unlike ``get_neighbors`` this drops the weights and returns a cached
+        tuple, so repeated calls cost a single dict lookup until the graph
+        is mutated.
+
+        Args:
+            vertex: The vertex
+
+        Returns:
+            Tuple of neighbor vertices, in the same order as ``get_neighbors``
+        """
+        view = self._neighbor_views.get(vertex)
+        if view is None:
+            view = tuple([n for n, _ in self._adjacency_list.get(vertex, ())])
+            self._neighbor_views[vertex] = view
+        return view
+
+    def to_csr(self):
+        """
+        Get a compressed sparse row (CSR) view of the adjacency structure.
+
+        Vertices are numbered by insertion order. The neighbors of vertex
+        ``u`` are ``indices[indptr[u]:indptr[u + 1]]``, in the same order as
+        ``get_neighbors``. The view is cached until the graph is mutated.
+
+        Returns:
+            Tuple of (indptr, indices, labels): ``indptr`` and ``indices``
+            are int32 NumPy arrays and ``labels[i]`` is the vertex with index i
+        """
+        if self._csr is None:
+            import numpy as np
+
+            labels = list(self._adjacency_list.keys())
+            index_of = {vertex: i for i, vertex in enumerate(labels)}
+
+            indptr = np.zeros(len(labels) + 1, dtype=np.int32)
+            indices = []
+            for i, vertex in enumerate(labels):
+                indices.extend([index_of[n] for n in self.neighbors_view(vertex)])
+                indptr[i + 1] = len(indices)
+
+            self._csr = (indptr, np.asarray(indices, dtype=np.int32), labels)
+            # Vertices 0..V-1 added in order are their own indices
+            is_identity = all(type(v) is int and v == i for i, v in enumerate(labels))
+            self._csr_lookup = (indptr.tolist(), indices, labels, index_of, is_identity)
+
+        return self._csr
+
+    def csr_lookup(self):
+        """
+        Get the cached CSR view in the form the traversal kernels read.
+
+        The kernels index the arrays one element at a time, which is faster
+        on lists than on NumPy arrays, and look up the start vertex by label.
+        Built and cached together with ``to_csr``.
+
+        Returns:
+            Tuple of (indptr, indices, labels, index_of, is_identity): the
+            CSR arrays as lists, ``labels`` as in ``to_csr``, a dict from
+            vertex to index and whether every vertex is its own index
+        """
+        if self._csr is None:
+            self.to_csr()
+        return self._csr_lookup
+
     def has_edge(self, from_vertex: Any, to_vertex: Any) -> bool:
         """
         Check if an edge exists.
@@ -176,9 +254,7 @@ class Graph(BaseDataStructure):
         Returns:
             True if edge exists, False otherwise
         """
-        if from_vertex not in self._adjacency_list:
-            return False
-        return any(v == to_vertex for v, _ in self._adjacency_list[from_vertex])
+        return to_vertex in self.neighbors_view(from_vertex)
 
     def get_vertices(self) -> List[Any]:
         """
@@ -221,6 +297,38 @@ class Graph(BaseDataStructure):
         """
         return self._directed
 
+    def is_integer_indexed(self) -> bool:
+        """
+        Check if the vertices are exactly the integers 0 to V - 1.
+
+        Traversals use this to track visited vertices in a flat byte array
+        indexed by vertex instead of a set.
+
+        Returns:
+            True if every vertex is an int in range(len(self)), False otherwise
+        """
+        size = self._size
+        return all(type(v) is int and 0 <= v < size for v in self._adjacency_list)
+
+    def get_version(self) -> int:
+        """
+        Get the mutation counter of the graph.
+
+        The counter changes whenever a vertex or edge is added or removed, so
+        callers can tell whether results they derived from the graph are stale.
+
+        Returns:
+            Current version number
+        """
+        return self._version
+
+    def _invalidate_views(self) -> None:
+        """Drop the cached views after the graph has been mutated."""
+        self._version += 1
+        self._csr = None
+        self._csr_lookup = None
+        self._neighbor_views = {}
+
     def _get_internal_state(self) -> Dict[str, Any]:
         """
         Get the internal state representation.
@@ -56,13 +56,18 @@ class HashTable(BaseDataStructure):
         """
         return self._size / self._capacity if self._capacity > 0 else 0.0
 
-    def _resize(self) -> None:
-        """Resize the hash table when load factor exceeds threshold."""
+    def _resize(self, new_capacity: Optional[int] = None) -> None:
+        """
+        Resize the hash table when load factor exceeds threshold.
+
+        Args:
+            new_capacity: Capacity to grow to (default: double the current one)
+        """
         old_buckets = self._buckets
         old_capacity = self._capacity
 
-        # Double the capacity
-        self._capacity *= 2
+        # Double the capacity unless a target was given
+        self._capacity = new_capacity if new_capacity is not None else self._capacity * 2
         self._buckets = [[] for _ in range(self._capacity)]
         self._size = 0
 
@@ -130,6 +135,53 @@ class HashTable(BaseDataStructure):
         if self._get_load_factor() > self._load_factor_threshold:
             self._resize()
 
+    def batch_insert(self, keys: List[Any], values: List[Any]) -> None:
+        """
+        Insert or update many key-value pairs at once.
+
+        The table grows to its final capacity before inserting, so the batch
+        triggers at most one rehash instead of one per threshold crossing.
+        The visualizer is notified once for the whole batch.
+
+        Args:
+            keys: Keys to insert
+            values: Values matching ``keys`` position by position
+
+        Raises:
+            ValueError: If keys and values differ in length, or if the load
+                factor threshold is not positive, since no capacity would
+                keep the batch under it
+        """
+        if len(keys) != len(values):
+            raise ValueError(
+                f"batch_insert expects one value per key, "
+                f"got {len(keys)} keys and {len(values)} values"
+            )
+        if self._load_factor_threshold <= 0:
+            raise ValueError(
+                f"batch_insert needs a positive load factor threshold, "
+                f"got {self._load_factor_threshold}"
+            )
+
+        items = list(zip(keys, values))
+
+        # Grow once so the batch fits under the load factor threshold
+        # (assumes all keys are new; updates only make the table roomier)
+        new_capacity = self._capacity
+        while (self._size + len(items)) / new_capacity > self._load_factor_threshold:
+            new_capacity *= 2
+        if new_capacity != self._capacity:
+            self._resize(new_capacity)
+
+        for key, value in items:
+            self._set_internal(key, value, notify=False)
+
+        self._notify_visualizer('batch_insert', {
+            'data_structure': self,
+            'keys': [key for key, _ in items],
+            'count': len(items)
+        })
+
     def get(self, key: Any) -> Optional[Any]:
         """
         Get the value for a key.
@@ -3,6 +3,7 @@ Queue data structure implementation.
 A FIFO (First In First Out) data structure with visualization hooks.
 """
 
+from collections import deque
 from typing import Any, List, Optional
 
 from ..visualization.base import BaseDataStructure
@@ -10,7 +11,7 @@ from ..visualization.base import BaseDataStructure
 
 class Queue(BaseDataStructure):
     """
-    Queue implementation using a list with visualization support.
+    Queue implementation using a deque with visualization support.
     """
 
     def __init__(self, initial_data: Optional[List[Any]] = None):
@@ -21,11 +22,12 @@ class Queue(BaseDataStructure):
             initial_data: Optional initial data to populate the queue
         """
         super().__init__()
-        self._data = list(initial_data) if initial_data else []
+        # deque gives O(1) dequeue from the front (list.pop(0) is O(n))
+        self._data = deque(initial_data) if initial_data else deque()
 
         # Notify visualizer of initialization
         self._notify_visualizer(
-            "init", {"data_structure": self, "initial_data": self._data.copy()}
+            "init", {"data_structure": self, "initial_data": list(self._data)}
         )
 
     def enqueue(self, value: Any) -> None:
@@ -51,7 +53,7 @@ class Queue(BaseDataStructure):
         if self.is_empty():
             raise IndexError("Cannot dequeue from empty queue")
 
-        value = self._data.pop(0)
+        value = self._data.popleft()
         self._notify_visualizer("dequeue", {"data_structure": self, "value": value})
         return value
 
@@ -84,9 +86,9 @@ class Queue(BaseDataStructure):
         Get the internal state representation.
 
         Returns:
-            Copy of the internal data list
+            Copy of the internal data as a list
         """
-        return self._data.copy()
+        return list(self._data)
 
     def __len__(self) -> int:
         """Return the size of the queue."""
@@ -94,7 +96,7 @@ class Queue(BaseDataStructure):
 
     def __repr__(self) -> str:
         """String representation of the queue."""
-        return f"Queue({self._data})"
+        return f"Queue({list(self._data)})"
 
     def to_list(self) -> List[Any]:
         """
@@ -103,4 +105,4 @@ class Queue(BaseDataStructure):
         Returns:
             A copy of the internal data as a list
         """
-        return self._data.copy()
+        return list(self._data)
@@ -166,10 +166,11 @@ class VisualizationSharing:
                     'step_number': step.get('step_number', 0),
                     'description': step.get('description', ''),
                     'data': state.get('data', []),
-                    'comparing': step.get('comparing', []),
-                    'swapping': step.get('swapping', []),
-                    'sorted': step.get('sorted', []),
-                    'current': step.get('current', []),
+                    # Index fields may be list-like views; JSON needs lists
+                    'comparing': list(step.get('comparing', [])),
+                    'swapping': list(step.get('swapping', [])),
+                    'sorted': list(step.get('sorted', [])),
+                    'current': list(step.get('current', [])),
                 })
         return simplified
 
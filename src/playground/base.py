@@ -187,7 +187,8 @@ class Playground(ABC):
         # Default implementation - subclasses should override
         self.visualize(self._initialization_steps)
 
-    def get_available_algorithms(self) -> List[str]:
+    @classmethod
+    def get_available_algorithms(cls) -> List[str]:
         """
         Get list of available algorithms.
 
@@ -23,6 +23,8 @@ class GraphPlayground(Playground):
         from ..data_structures.graph import Graph
 
         self.graph = Graph(directed=directed)
+        # (method, start_vertex) -> (graph, graph version, traversal order)
+        self._order_cache: Dict[Any, Any] = {}
 
     def set_input(self, data: List[Any], show_initialization: bool = True) -> None:
         """
@@ -178,6 +180,51 @@ class GraphPlayground(Playground):
         steps = dfs.execute(self.graph, start_vertex, visualize=False)
         return steps
 
+    def bfs_order(self, start_vertex: Any) -> List[Any]:
+        """
+        Get the BFS traversal order without recording visualization steps.
+
+        Runs over the graph's cached CSR arrays instead of the adjacency dict.
+
+        Args:
+            start_vertex: Starting vertex
+
+        Returns:
+            Vertices in BFS visiting order (empty if start_vertex is unknown)
+        """
+        return self._csr_order(start_vertex, "bfs")
+
+    def dfs_order(self, start_vertex: Any) -> List[Any]:
+        """
+        Get the DFS traversal order without recording visualization steps.
+
+        Runs over the graph's cached CSR arrays instead of the adjacency dict.
+
+        Args:
+            start_vertex: Starting vertex
+
+        Returns:
+            Vertices in DFS visiting order (empty if start_vertex is unknown)
+        """
+        return self._csr_order(start_vertex, "dfs")
+
+    def _csr_order(self, start_vertex: Any, method: str) -> List[Any]:
+        """Run a CSR traversal kernel and map indices back to vertex labels."""
+        # Repeated queries on an unchanged graph reuse the previous result
+        key = (method, start_vertex)
+        cached = self._order_cache.get(key)
+        if cached is not None and cached[0] is self.graph and cached[1] == self.graph.get_version():
+            return list(cached[2])
+
+        from ..algorithms.graph._kernels import bfs_csr_levels, csr_traversal, dfs_csr
+
+        kernel = bfs_csr_levels if method == "bfs" else dfs_csr
+        order = csr_traversal(self.graph, start_vertex, kernel)
+        if order is None:
+            order = []
+        self._order_cache[key] = (self.graph, self.graph.get_version(), order)
+        return list(order)
+
     def visualize_initialization(self, interactive: bool = True, auto_show: bool = True) -> None:
         """
         Visualize how input data was transformed into the graph structure.
@@ -245,7 +292,8 @@ class GraphPlayground(Playground):
         else:
             raise ValueError(f"Unknown algorithm: {algorithm_name}")
 
-    def get_available_algorithms(self) -> List[str]:
+    @classmethod
+    def get_available_algorithms(cls) -> List[str]:
         """
         Get list of available algorithms.
 
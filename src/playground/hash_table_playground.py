@@ -303,7 +303,8 @@ class HashTablePlayground(Playground):
         else:
             raise ValueError(f"Unknown operation: {algorithm_name}")
 
-    def get_available_algorithms(self) -> List[str]:
+    @classmethod
+    def get_available_algorithms(cls) -> List[str]:
         """
         Get list of available operations.
 
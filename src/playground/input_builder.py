@@ -91,7 +91,7 @@ class InputBuilder:
         Returns:
             Array instance
         """
-        return Array(self.data.copy())
+        return Array(self.data)
 
     def from_string(self, input_str: str, separator: str = ',') -> None:
         """
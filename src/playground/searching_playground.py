@@ -2,7 +2,8 @@
 Searching algorithm playground for interactive exploration.
 """
 
-from typing import List, Dict, Any, Optional
+from importlib import import_module
+from typing import List, Dict, Any, Optional, Tuple
 from .base import Playground, InputGenerator
 
 
@@ -11,20 +12,22 @@ class SearchingPlayground(Playground):
     Interactive playground for exploring searching algorithms.
     """
 
+    # Search name -> (module under algorithms.searching, class name)
+    ALGORITHMS: Dict[str, Tuple[str, str]] = {
+        'linear_search': ('linear_search', 'LinearSearch'),
+        'binary_search': ('binary_search', 'BinarySearch'),
+        'ternary_search': ('ternary_search', 'TernarySearch'),
+        'exponential_search': ('exponential_search', 'ExponentialSearch'),
+    }
+
     def __init__(self):
         """Initialize searching playground."""
         super().__init__("Searching Algorithms Playground")
         # Lazy imports to avoid circular dependencies
-        from ..algorithms.searching.linear_search import LinearSearch
-        from ..algorithms.searching.binary_search import BinarySearch
-        from ..algorithms.searching.ternary_search import TernarySearch
-        from ..algorithms.searching.exponential_search import ExponentialSearch
-
         self.algorithms = {
-            'linear_search': LinearSearch,
-            'binary_search': BinarySearch,
-            'ternary_search': TernarySearch,
-            'exponential_search': ExponentialSearch,
+            name: getattr(import_module(f'..algorithms.searching.{module}', __package__),
+                          cls_name)
+            for name, (module, cls_name) in self.ALGORITHMS.items()
         }
         self.input_data: Optional[List[Any]] = None
         self.target_value: Optional[Any] = None
@@ -72,7 +75,7 @@ class SearchingPlayground(Playground):
         # Lazy import to avoid circular dependencies
         from ..data_structures.array import Array
 
-        arr = Array(self.input_data.copy())
+        arr = Array(self.input_data)
         algorithm = self.algorithms[algorithm_name]()
         steps = algorithm.execute(arr, target_val, visualize=False)
 
@@ -141,14 +144,15 @@ class SearchingPlayground(Playground):
             except Exception as e:
                 print(f"  Error: {e}")
 
-    def get_available_algorithms(self) -> List[str]:
+    @classmethod
+    def get_available_algorithms(cls) -> List[str]:
         """
         Get list of available searching algorithms.
 
         Returns:
             List of algorithm names
         """
-        return list(self.algorithms.keys())
+        return list(cls.ALGORITHMS)
 
     def demo(self, algorithm_name: str, input_size: int = 20,
              target: Optional[Any] = None) -> None:
@@ -2,7 +2,8 @@
 Sorting algorithm playground for interactive exploration.
 """
 
-from typing import List, Dict, Any, Optional
+from importlib import import_module
+from typing import List, Dict, Any, Optional, Tuple
 from .base import Playground, InputGenerator
 
 
@@ -11,24 +12,24 @@ class SortingPlayground(Playground):
     Interactive playground for exploring sorting algorithms.
     """
 
+    # Sort name -> (module under algorithms.sorting, class name)
+    ALGORITHMS: Dict[str, Tuple[str, str]] = {
+        'bubble_sort': ('bubble_sort', 'BubbleSort'),
+        'insertion_sort': ('insertion_sort', 'InsertionSort'),
+        'selection_sort': ('selection_sort', 'SelectionSort'),
+        'merge_sort': ('merge_sort', 'MergeSort'),
+        'quick_sort': ('quick_sort', 'QuickSort'),
+        'heap_sort': ('heap_sort', 'HeapSort'),
+    }
+
     def __init__(self):
         """Initialize sorting playground."""
         super().__init__("Sorting Algorithms Playground")
         # Lazy imports to avoid circular dependencies
-        from ..algorithms.sorting.bubble_sort import BubbleSort
-        from ..algorithms.sorting.insertion_sort import InsertionSort
-        from ..algorithms.sorting.selection_sort import SelectionSort
-        from ..algorithms.sorting.merge_sort import MergeSort
-        from ..algorithms.sorting.quick_sort import QuickSort
-        from ..algorithms.sorting.heap_sort import HeapSort
-
         self.algorithms = {
-            'bubble_sort': BubbleSort,
-            'insertion_sort': InsertionSort,
-            'selection_sort': SelectionSort,
-            'merge_sort': MergeSort,
-            'quick_sort': QuickSort,
-            'heap_sort': HeapSort,
+            name: getattr(import_module(f'..algorithms.sorting.{module}', __package__),
+                          cls_name)
+            for name, (module, cls_name) in self.ALGORITHMS.items()
         }
         self.input_data: Optional[List[Any]] = None
 
@@ -61,12 +62,34 @@ class SortingPlayground(Playground):
         # Lazy import to avoid circular dependencies
         from ..data_structures.array import Array
 
-        arr = Array(self.input_data.copy())
+        arr = Array(self.input_data)
         algorithm = self.algorithms[algorithm_name]()
         steps = algorithm.execute(arr, visualize=False)
 
         return steps
 
+    def count_steps(self, algorithm_name: str) -> Dict[str, int]:
+        """
+        Run a sorting algorithm and count its steps without recording them.
+
+        Args:
+            algorithm_name: Name of algorithm
+
+        Returns:
+            Dictionary with total_steps, comparisons and swaps
+        """
+        if self.input_data is None:
+            raise ValueError("Input data not set. Use set_input() first.")
+
+        if algorithm_name not in self.algorithms:
+            raise ValueError(f"Unknown algorithm: {algorithm_name}")
+
+        # Lazy import to avoid circular dependencies
+        from ..data_structures.array import Array
+
+        arr = Array(self.input_data)
+        return self.algorithms[algorithm_name]().count_steps(arr)
+
     def visualize(self, steps: List[Dict[str, Any]], interactive: bool = True) -> None:
         """
         Visualize algorithm steps.
@@ -108,7 +131,7 @@ class SortingPlayground(Playground):
         from ..data_structures.array import Array
 
         viewer = ComparisonViewer()
-        arr = Array(self.input_data.copy())
+        arr = Array(self.input_data)
 
         for name in algorithm_names:
             if name not in self.algorithms:
@@ -131,14 +154,15 @@ class SortingPlayground(Playground):
             print(f"  Swaps: {metric['swaps']}")
             print()
 
-    def get_available_algorithms(self) -> List[str]:
+    @classmethod
+    def get_available_algorithms(cls) -> List[str]:
         """
         Get list of available sorting algorithms.
 
         Returns:
             List of algorithm names
         """
-        return list(self.algorithms.keys())
+        return list(cls.ALGORITHMS)
 
     def demo(self, algorithm_name: str, input_size: int = 10,
              input_type: str = 'random') -> None:
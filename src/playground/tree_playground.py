@@ -553,7 +553,8 @@ class TreePlayground(Playground):
         else:
             raise ValueError(f"Unknown operation: {algorithm_name}")
 
-    def get_available_algorithms(self) -> List[str]:
+    @classmethod
+    def get_available_algorithms(cls) -> List[str]:
         """
         Get list of available operations.
 
@@ -593,9 +594,19 @@ class TreePlayground(Playground):
         # Demonstrate traversal
         if operation == "traverse":
             print("\nDemonstrating traversals:")
-            for trav_type in ["inorder", "preorder", "postorder", "levelorder"]:
-                traversal = getattr(self.tree, f"{trav_type}_traversal")()
-                print(f"  {trav_type}: {traversal}")
+            # Resolve the bound methods once; not every tree type has all of them
+            traversals = {
+                trav_type: getattr(self.tree, method_name, None)
+                for trav_type, method_name in [
+                    ("inorder", "inorder_traversal"),
+                    ("preorder", "preorder_traversal"),
+                    ("postorder", "postorder_traversal"),
+                    ("levelorder", "level_order_traversal"),
+                ]
+            }
+            for trav_type, traverse in traversals.items():
+                if traverse is not None:
+                    print(f"  {trav_type}: {traverse()}")
 
         # Visualize
         final_step = {
@@ -64,7 +64,7 @@ class ImplementationTester:
             func = namespace[function_name]
 
             # Create array and run algorithm
-            arr = Array(input_data.copy())
+            arr = Array(input_data)
             original_data = input_data.copy()
 
             # Execute function
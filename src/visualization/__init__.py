@@ -3,6 +3,8 @@ Visualization Module
 Visualization engine for data structures and algorithms.
 """
 
+from functools import lru_cache
+
 from .algo_visualizer import AlgorithmVisualizer
 from .base import BaseAlgorithm, BaseDataStructure, BaseVisualizer
 from .ds_visualizer import DataStructureVisualizer
@@ -15,9 +17,37 @@ __all__ = [
     "BaseAlgorithm",
     "DataStructureVisualizer",
     "AlgorithmVisualizer",
+    "get_ds_visualizer",
+    "get_algo_visualizer",
 ]
 
 
+@lru_cache(maxsize=None)
+def get_ds_visualizer() -> DataStructureVisualizer:
+    """
+    Get the shared data structure visualizer.
+
+    Call ``reset()`` on it before drawing to drop the previous figure.
+
+    Returns:
+        Cached DataStructureVisualizer instance
+    """
+    return DataStructureVisualizer()
+
+
+@lru_cache(maxsize=None)
+def get_algo_visualizer() -> AlgorithmVisualizer:
+    """
+    Get the shared algorithm visualizer.
+
+    Call ``reset()`` on it before drawing to drop the previous figure.
+
+    Returns:
+        Cached AlgorithmVisualizer instance
+    """
+    return AlgorithmVisualizer()
+
+
 def __getattr__(name):
     """Lazy import for modules that may cause circular dependencies."""
     if name == "InteractiveControls":
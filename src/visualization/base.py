@@ -3,7 +3,7 @@ Base classes for data structures, algorithms, and visualizers.
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 
 class BaseDataStructure(ABC):
@@ -85,6 +85,7 @@ class BaseAlgorithm(ABC):
         self._visualizer = None
         self._steps = []
         self._current_step = 0
+        self._record_steps = True
 
     def attach_visualizer(self, visualizer):
         """
@@ -95,27 +96,99 @@ class BaseAlgorithm(ABC):
         """
         self._visualizer = visualizer
 
-    def execute(self, data_structure, visualize: bool = True) -> List[Dict[str, Any]]:
+    def execute(
+        self, data_structure, visualize: bool = True, record_steps: bool = True
+    ) -> List[Dict[str, Any]]:
         """
         Execute the algorithm on a data structure.
 
         Args:
             data_structure: The data structure to operate on
             visualize: Whether to visualize during execution
+            record_steps: Whether to record intermediate steps. Algorithms
+                that support it skip building them when False and only
+                yield the final step.
 
         Returns:
             List of execution steps
         """
         self._steps = []
-        self._current_step = 0
 
         # Run the algorithm and collect steps
-        for step in self._run(data_structure):
+        for step in self._iter_steps(data_structure, visualize, record_steps):
             self._steps.append(step)
+
+        return self._steps
+
+    def execute_iter(
+        self, data_structure, visualize: bool = True, record_steps: bool = True
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Execute the algorithm and yield its steps as they are produced.
+
+        Unlike execute(), steps are not stored, so memory stays constant and
+        the caller can stop early (get_steps() is left empty).
+
+        Args:
+            data_structure: The data structure to operate on
+            visualize: Whether to visualize during execution
+            record_steps: Whether to record intermediate steps (see execute())
+
+        Returns:
+            Iterator over execution steps
+        """
+        self._steps = []
+        return self._iter_steps(data_structure, visualize, record_steps)
+
+    def _iter_steps(self, data_structure, visualize: bool, record_steps: bool):
+        """
+        Run the algorithm, visualizing and yielding each step.
+
+        Args:
+            data_structure: The data structure to operate on
+            visualize: Whether to visualize during execution
+            record_steps: Whether to record intermediate steps
+
+        Yields:
+            Dictionary containing step information
+        """
+        self._current_step = 0
+        self._record_steps = record_steps
+
+        for step in self._run(data_structure):
             if visualize and self._visualizer:
                 self._visualize_step(step)
+            yield step
 
-        return self._steps
+    def count_steps(self, data_structure, *args) -> Dict[str, int]:
+        """
+        Run the algorithm and count its steps without storing them.
+
+        Uses the same counting rules as ComparisonViewer.get_performance_metrics.
+        Like execute_iter(), get_steps() is left empty.
+
+        Args:
+            data_structure: The data structure to operate on
+            *args: Extra arguments the algorithm's execute() takes, such as
+                a search target or a start vertex
+
+        Returns:
+            Dictionary with total_steps, comparisons and swaps
+        """
+        total_steps = comparisons = swaps = 0
+
+        for step in self.execute_iter(data_structure, *args, visualize=False):
+            total_steps += 1
+            if step.get("comparing"):
+                comparisons += 1
+            if step.get("swapping"):
+                swaps += 1
+
+        return {
+            "total_steps": total_steps,
+            "comparisons": comparisons,
+            "swaps": swaps,
+        }
 
     def _visualize_step(self, step: Dict[str, Any]):
         """
@@ -250,3 +323,17 @@ class BaseVisualizer(ABC):
             print(
                 "matplotlib is required for visualization. Install it with: pip install matplotlib"
             )
+
+    def reset(self):
+        """
+        Release the current figure so the visualizer can be reused.
+        """
+        if self._figure is not None:
+            try:
+                import matplotlib.pyplot as plt
+
+                plt.close(self._figure)
+            except ImportError:
+                pass
+        self._figure = None
+        self._axes = None
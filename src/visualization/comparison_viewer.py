@@ -77,7 +77,7 @@ class ComparisonViewer:
         from ..data_structures.array import Array
 
         for config in algorithms_config:
-            arr = Array(input_data.copy())
+            arr = Array(input_data)
             algo = config["algorithm"]
             name = config["name"]
 
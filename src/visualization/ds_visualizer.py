@@ -40,30 +40,12 @@ class DataStructureVisualizer(BaseVisualizer):
 
         # Create figure and axis
         self._figure, self._axes = plt.subplots(figsize=(10, 6))
-        self._axes.set_xlim(-1, max(len(self._current_state.get("data", [])), 10))
-        self._axes.set_ylim(-0.5, 2)
-        self._axes.set_aspect("equal")
-        self._axes.axis("off")
+        self._prepare_axes()
 
         # Visualize based on data structure type
         ds_type = self._current_state["type"]
 
-        # Extract operation info from step
-        operation = step.get("operation", "normal") if step else "normal"
-        current_index = step.get("current_index", None) if step else None
-        highlighted_indices = step.get("highlighted_indices", []) if step else []
-
-        if ds_type == "Array":
-            self._visualize_array(data_structure, current_index, highlighted_indices)
-        elif ds_type == "LinkedList":
-            self._visualize_linked_list(
-                data_structure, current_index, highlighted_indices
-            )
-        elif ds_type == "Stack":
-            self._visualize_stack(data_structure, current_index, highlighted_indices)
-        elif ds_type == "Queue":
-            self._visualize_queue(data_structure, current_index, highlighted_indices)
-        elif ds_type in ["BinaryTree", "BinarySearchTree", "AVLTree"]:
+        if ds_type in ["BinaryTree", "BinarySearchTree", "AVLTree"]:
             # Use tree visualizer for better visualization
             from .tree_visualizer import TreeVisualizer
 
@@ -85,6 +67,82 @@ class DataStructureVisualizer(BaseVisualizer):
             ht_viz.visualize(data_structure, step, ax=self._axes, fig=self._figure)
             return
 
+        self._draw_current_state(data_structure, step)
+
+        plt.tight_layout()
+
+    def show_batch(self, snapshots: List[Dict[str, Any]], interval: float = 1.0):
+        """
+        Display a sequence of states in a single, reused figure.
+
+        Only one figure is created for the whole sequence; each snapshot
+        clears and redraws the same axes.
+
+        Args:
+            snapshots: States captured with ``data_structure.get_state()``
+                (Array, LinkedList, Stack or Queue)
+            interval: Seconds to pause between snapshots
+        """
+        try:
+            import matplotlib.pyplot as plt
+        except ImportError:
+            print(
+                "matplotlib is required for visualization. Install it with: pip install matplotlib"
+            )
+            return
+
+        if not snapshots:
+            return
+
+        self._figure, self._axes = plt.subplots(figsize=(10, 6))
+
+        for i, state in enumerate(snapshots):
+            self._axes.clear()
+            self._current_state = state
+            self._prepare_axes()
+            self._draw_current_state(None, {"step_number": i + 1})
+            self._figure.canvas.draw_idle()
+            plt.pause(interval)
+
+        plt.show()
+
+    def _prepare_axes(self):
+        """Set limits and styling of the axes for the current state."""
+        self._axes.set_xlim(-1, max(len(self._current_state.get("data", [])), 10))
+        self._axes.set_ylim(-0.5, 2)
+        self._axes.set_aspect("equal")
+        self._axes.axis("off")
+
+    def _draw_current_state(
+        self,
+        data_structure: Optional[BaseDataStructure],
+        step: Optional[Dict[str, Any]] = None,
+    ):
+        """
+        Draw the current state of a linear data structure on the axes.
+
+        Args:
+            data_structure: The data structure being drawn (may be None when
+                drawing a stored snapshot)
+            step: Optional step information (for algorithm visualization)
+        """
+        ds_type = self._current_state["type"]
+
+        # Extract operation info from step
+        current_index = step.get("current_index", None) if step else None
+        highlighted_indices = step.get("highlighted_indices", []) if step else []
+
+        if ds_type == "Array":
+            self._visualize_array(data_structure, current_index, highlighted_indices)
+        elif ds_type == "LinkedList":
+            self._visualize_linked_list(
+                data_structure, current_index, highlighted_indices
+            )
+        elif ds_type == "Stack":
+            self._visualize_stack(data_structure, current_index, highlighted_indices)
+        elif ds_type == "Queue":
+            self._visualize_queue(data_structure, current_index, highlighted_indices)
+
         # Add title
         title = f"{ds_type} Visualization"
         if step:
@@ -94,10 +152,6 @@ class DataStructureVisualizer(BaseVisualizer):
                 title += f" (Step {step['step_number']})"
         self._axes.set_title(title, fontsize=14, fontweight="bold")
 
-        import matplotlib.pyplot as plt
-
-        plt.tight_layout()
-
     def _visualize_array(
         self,
         data_structure: BaseDataStructure,
@@ -0,0 +1,281 @@
+"""
+Step Views
+Constant-time, read-only snapshots of algorithm state for step dictionaries.
+
+Copying a container into every yielded step costs time proportional to its
+size, so a full traversal spends most of its time copying. The views below
+capture a container's state in O(1) instead. They rely on how it is mutated:
+
+- ``SliceView`` snapshots a range of a list that is only ever appended to.
+- ``ChainView`` snapshots a persistent linked stack built with ``chain_push``.
+- ``ArraySnapshot`` snapshots a list that is rearranged in place through an
+  ``ArrayTimeline``, which logs every write.
+
+The first two behave like read-only lists (``len``, indexing, iteration,
+``in``, ``index`` and equality with lists). ``ArraySnapshot`` is an ``Array``
+whose contents are rebuilt from the log the first time they are read.
+"""
+
+from collections.abc import Sequence
+from itertools import islice
+from typing import Any, List, Optional, Tuple
+
+from ..data_structures.array import Array
+
+# Persistent stack node: (value, parent node, size)
+ChainNode = Optional[Tuple[Any, Any, int]]
+
+
+def chain_push(node: ChainNode, value: Any) -> ChainNode:
+    """
+    Push a value onto a persistent linked stack.
+
+    The existing stack is left untouched, so views of it stay valid.
+
+    Args:
+        node: Top node of the stack (None for an empty stack)
+        value: Value to push
+
+    Returns:
+        New top node
+    """
+    return (value, node, node[2] + 1 if node else 1)
+
+
+class _SnapshotView(Sequence):
+    """Shared list-like behaviour of the snapshot views."""
+
+    __slots__ = ()
+    __hash__ = None
+
+    def __eq__(self, other):
+        """Compare element-wise with lists and other views."""
+        if isinstance(other, (list, _SnapshotView)):
+            return len(self) == len(other) and list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        """Represent the view as the list it stands for."""
+        return repr(list(self))
+
+
+class SliceView(_SnapshotView):
+    """
+    Snapshot of ``items[start:stop]`` for an append-only list.
+    """
+
+    __slots__ = ("_items", "_start", "_stop")
+
+    def __init__(self, items: List[Any], start: int = 0, stop: Optional[int] = None):
+        """
+        Initialize the view.
+
+        Args:
+            items: Shared list that is only appended to while the view is alive
+            start: First index included
+            stop: End index, exclusive (default: the current length)
+        """
+        self._items = items
+        self._start = start
+        self._stop = len(items) if stop is None else stop
+
+    def __len__(self) -> int:
+        """Return the number of elements in the snapshot."""
+        return self._stop - self._start
+
+    def __getitem__(self, index):
+        """Get an element (or a list for a slice) of the snapshot."""
+        if isinstance(index, slice):
+            return [self._items[i] for i in range(self._start, self._stop)[index]]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("view index out of range")
+        return self._items[self._start + index]
+
+    def __iter__(self):
+        """Iterate over the snapshot."""
+        return islice(self._items, self._start, self._stop)
+
+
+class ChainView(_SnapshotView):
+    """
+    Snapshot of a persistent linked stack, listed bottom to top.
+    """
+
+    __slots__ = ("_node",)
+
+    def __init__(self, node: ChainNode):
+        """
+        Initialize the view.
+
+        Args:
+            node: Top node of the stack (None for an empty stack)
+        """
+        self._node = node
+
+    def __len__(self) -> int:
+        """Return the number of elements in the snapshot."""
+        return self._node[2] if self._node else 0
+
+    def __getitem__(self, index):
+        """Get an element (or a list for a slice) of the snapshot."""
+        return self._to_list()[index]
+
+    def __iter__(self):
+        """Iterate over the snapshot from bottom to top."""
+        return iter(self._to_list())
+
+    def __contains__(self, value) -> bool:
+        """Check membership without materializing the list."""
+        node = self._node
+        while node:
+            if node[0] == value:
+                return True
+            node = node[1]
+        return False
+
+    def _to_list(self) -> List[Any]:
+        """Materialize the stack contents, bottom first."""
+        values = []
+        node = self._node
+        while node:
+            values.append(node[0])
+            node = node[1]
+        values.reverse()
+        return values
+
+
+class ArrayTimeline:
+    """
+    A list rearranged in place, with a log of every write made to it.
+
+    Algorithms read ``data`` directly but write through ``set`` and ``swap``,
+    so ``snapshot`` can capture the current contents in O(1).
+    """
+
+    __slots__ = ("data", "_writes", "_cursor", "_cursor_version")
+
+    def __init__(self, data: List[Any]):
+        """
+        Initialize the timeline.
+
+        Args:
+            data: List to track; it is modified in place by ``set``/``swap``
+        """
+        self.data = data
+        # (index, old value, new value) for every write, in order
+        self._writes: List[Tuple[int, Any, Any]] = []
+        # Replay buffer holding the contents after _cursor_version writes
+        self._cursor = list(data)
+        self._cursor_version = 0
+
+    def set(self, index: int, value: Any) -> None:
+        """
+        Write a value into the list.
+
+        Args:
+            index: Index to write
+            value: Value to store
+        """
+        data = self.data
+        self._writes.append((index, data[index], value))
+        data[index] = value
+
+    def swap(self, i: int, j: int) -> None:
+        """
+        Swap two elements of the list.
+
+        Args:
+            i: First index
+            j: Second index
+        """
+        data = self.data
+        first, second = data[i], data[j]
+        self._writes.append((i, first, second))
+        self._writes.append((j, second, first))
+        data[i], data[j] = second, first
+
+    def snapshot(self) -> "ArraySnapshot":
+        """
+        Capture the current contents of the list.
+
+        Returns:
+            Array that reads as the list does now
+        """
+        return ArraySnapshot(self, len(self._writes))
+
+    def contents_at(self, version: int) -> List[Any]:
+        """
+        Rebuild the contents of the list after a number of writes.
+
+        The replay buffer moves forwards or backwards from where the last
+        call left it, so reading snapshots in order costs O(n) per snapshot
+        for the copy plus O(1) amortized for the replay.
+
+        Args:
+            version: Number of writes to apply
+
+        Returns:
+            New list with the contents at that point
+        """
+        cursor = self._cursor
+        writes = self._writes
+        position = self._cursor_version
+
+        while position < version:
+            index, _, new = writes[position]
+            cursor[index] = new
+            position += 1
+        while position > version:
+            position -= 1
+            index, old, _ = writes[position]
+            cursor[index] = old
+
+        self._cursor_version = position
+        return cursor.copy()
+
+
+class ArraySnapshot(Array):
+    """
+    Array holding the contents of an ``ArrayTimeline`` at one point in time.
+
+    The contents are only rebuilt when first read, so steps that are never
+    displayed cost O(1) instead of a copy of the whole array.
+    """
+
+    def __init__(self, timeline: ArrayTimeline, version: int):
+        """
+        Initialize the snapshot.
+
+        Args:
+            timeline: Timeline the snapshot was taken from
+            version: Number of writes made to the timeline at that point
+        """
+        # Skip Array.__init__: it would copy the data and notify visualizers
+        super(Array, self).__init__()
+        self._timeline = timeline
+        self._version = version
+        self._contents: Optional[List[Any]] = None
+
+    @property
+    def _data(self) -> List[Any]:
+        """Contents of the snapshot, rebuilt on first access."""
+        if self._contents is None:
+            self._contents = self._timeline.contents_at(self._version)
+        return self._contents
+
+    @_data.setter
+    def _data(self, value: List[Any]) -> None:
+        self._contents = value
+
+    def get_state(self):
+        """
+        Get the current state, reported as a plain Array.
+
+        Returns:
+            Dictionary containing the current state
+        """
+        state = super().get_state()
+        state["type"] = "Array"
+        return state
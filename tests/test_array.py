@@ -2,6 +2,7 @@
 Unit tests for Array data structure.
 """
 
+import numpy as np
 import pytest
 from src.data_structures.array import Array
 
@@ -21,6 +22,14 @@ class TestArray:
         assert len(arr) == 3
         assert arr.to_list() == [1, 2, 3]
 
+    def test_init_with_numpy_array(self):
+        """Test initialization from a NumPy array copies to native values."""
+        source = np.array([3, 1, 2], dtype=np.int64)
+        arr = Array(source)
+        source[0] = 99
+        assert arr.to_list() == [3, 1, 2]
+        assert type(arr[0]) is int
+
     def test_append(self):
         """Test append operation."""
         arr = Array()
@@ -100,6 +109,14 @@ class TestArray:
         with pytest.raises(IndexError):
             arr.set(5, 10)
 
+    def test_batch_set(self):
+        """Test overwriting every element at once."""
+        arr = Array([1, 2, 3])
+        arr.batch_set([3, 2, 1])
+        assert arr.to_list() == [3, 2, 1]
+        with pytest.raises(ValueError):
+            arr.batch_set([1, 2])
+
     def test_indexing(self):
         """Test indexing with [] operator."""
         arr = Array([1, 2, 3])
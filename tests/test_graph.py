@@ -0,0 +1,260 @@
+"""
+Unit tests for Graph data structure and graph traversals.
+"""
+
+import pytest
+from src.data_structures.graph import Graph
+from src.algorithms.graph.bfs import BFS
+from src.algorithms.graph.dfs import DFS
+from src.algorithms.graph._kernels import bfs_csr, bfs_csr_levels, csr_traversal, dfs_csr
+from src.playground.graph_playground import GraphPlayground
+
+
+def build_graph(directed=False):
+    """Build a small test graph."""
+    graph = Graph(directed=directed)
+    for from_v, to_v in [("A", "B"), ("A", "C"), ("B", "D"), ("C", "D"), ("D", "E")]:
+        graph.add_edge(from_v, to_v)
+    return graph
+
+
+class TestGraphCSR:
+    """Test cases for the CSR view of Graph."""
+
+    def test_to_csr_matches_neighbors(self):
+        """Test CSR rows list the same neighbors as get_neighbors."""
+        graph = build_graph()
+        indptr, indices, labels = graph.to_csr()
+        assert len(indptr) == len(labels) + 1
+        for i, vertex in enumerate(labels):
+            row = [labels[j] for j in indices[indptr[i]:indptr[i + 1]]]
+            assert row == [n for n, _ in graph.get_neighbors(vertex)]
+
+    def test_to_csr_invalidated_on_mutation(self):
+        """Test the cached CSR view is rebuilt after mutations."""
+        graph = build_graph()
+        first = graph.to_csr()
+        assert graph.to_csr() is first
+        graph.add_edge("E", "F")
+        indptr, indices, labels = graph.to_csr()
+        assert "F" in labels
+        assert len(indices) == len(first[1]) + 2
+
+    def test_csr_lookup_matches_to_csr(self):
+        """Test the traversal lookup holds the CSR as lists and maps labels back."""
+        graph = build_graph()
+        indptr, indices, labels, index_of, is_identity = graph.csr_lookup()
+        csr = graph.to_csr()
+        assert indptr == csr[0].tolist()
+        assert indices == csr[1].tolist()
+        assert labels is csr[2]
+        assert all(index_of[vertex] == i for i, vertex in enumerate(labels))
+        assert not is_identity
+        assert graph.csr_lookup()[0] is indptr
+        graph.add_vertex("F")
+        assert graph.csr_lookup()[3]["F"] == len(labels)
+
+
+class TestNeighborsView:
+    """Test cases for the cached neighbor views."""
+
+    def test_matches_get_neighbors(self):
+        """Test the view lists the same neighbors as get_neighbors."""
+        graph = build_graph()
+        for vertex in graph.get_vertices():
+            assert list(graph.neighbors_view(vertex)) == [n for n, _ in graph.get_neighbors(vertex)]
+        assert graph.neighbors_view("Z") == ()
+
+    def test_cached_until_mutation(self):
+        """Test the view is reused until the graph changes."""
+        graph = build_graph()
+        view = graph.neighbors_view("D")
+        assert graph.neighbors_view("D") is view
+        graph.add_edge("D", "F")
+        assert graph.neighbors_view("D") == view + ("F",)
+        graph.remove_edge("D", "F")
+        assert graph.neighbors_view("D") == view
+
+
+class TestIntegerIndexed:
+    """Test cases for integer-indexed graphs."""
+
+    def test_is_integer_indexed(self):
+        """Test detection of graphs numbered 0..V-1."""
+        graph = Graph()
+        graph.add_edge(0, 1)
+        graph.add_edge(1, 2)
+        assert graph.is_integer_indexed()
+        graph.add_vertex(7)
+        assert not graph.is_integer_indexed()
+        assert not build_graph().is_integer_indexed()
+
+    @pytest.mark.parametrize("algorithm", [BFS, DFS])
+    def test_traversal_matches_labeled_graph(self, algorithm):
+        """Test integer graphs traverse like the same graph with string labels."""
+        labeled = build_graph()
+        labels = labeled.get_vertices()
+        numbered = Graph()
+        for from_v, to_v, _ in labeled.get_edges():
+            numbered.add_edge(labels.index(from_v), labels.index(to_v))
+
+        expected = algorithm().execute(labeled, "A", visualize=False)
+        steps = algorithm().execute(numbered, 0, visualize=False)
+        assert len(steps) == len(expected)
+        assert [labels[v] for v in steps[-1]["traversal_order"]] == expected[-1]["traversal_order"]
+
+
+class TestTraversalOrder:
+    """Test cases for the step-free traversal orders."""
+
+    @pytest.mark.parametrize("directed", [False, True])
+    def test_bfs_order_matches_bfs(self, directed):
+        """Test CSR BFS order matches the BFS algorithm."""
+        pg = GraphPlayground(directed=directed)
+        pg.graph = build_graph(directed)
+        steps = BFS().execute(pg.graph, "A", visualize=False)
+        assert pg.bfs_order("A") == steps[-1]["traversal_order"]
+
+    @pytest.mark.parametrize("directed", [False, True])
+    def test_dfs_order_matches_dfs(self, directed):
+        """Test CSR DFS order matches the DFS algorithm."""
+        pg = GraphPlayground(directed=directed)
+        pg.graph = build_graph(directed)
+        steps = DFS().execute(pg.graph, "A", visualize=False)
+        assert pg.dfs_order("A") == steps[-1]["traversal_order"]
+
+    @pytest.mark.parametrize("threshold", [1, 4, 1024])
+    def test_level_bfs_matches_sequential(self, threshold):
+        """Test the level-synchronous BFS kernel keeps the sequential order."""
+        import random
+
+        rng = random.Random(7)
+        graph = Graph()
+        for v in range(200):
+            graph.add_vertex(v)
+        for _ in range(600):
+            graph.add_edge(rng.randrange(200), rng.randrange(200))
+        indptr, indices, _ = graph.to_csr()
+        indptr, indices = indptr.tolist(), indices.tolist()
+        for source in (0, 17, 199):
+            assert bfs_csr_levels(indptr, indices, source, threshold) == bfs_csr(indptr, indices, source)
+
+    def test_integer_labels_out_of_order(self):
+        """Test integer vertices added out of order map back to their labels."""
+        graph = Graph()
+        for v in (2, 0, 1):
+            graph.add_vertex(v)
+        graph.add_edge(0, 1)
+        graph.add_edge(1, 2)
+        assert csr_traversal(graph, 0, bfs_csr) == [0, 1, 2]
+        assert csr_traversal(graph, 0, dfs_csr) == [0, 1, 2]
+        assert not graph.csr_lookup()[4]
+
+    def test_identity_labels_flagged(self):
+        """Test only int vertices 0..V-1 in order are flagged as their own indices."""
+        graph = Graph()
+        for v in range(3):
+            graph.add_vertex(v)
+        assert graph.csr_lookup()[4]
+        graph.add_vertex(3.0)
+        assert not graph.csr_lookup()[4]
+
+    def test_order_recomputed_after_mutation(self):
+        """Test cached traversal orders are dropped when the graph changes."""
+        pg = GraphPlayground()
+        pg.graph = build_graph()
+        version = pg.graph.get_version()
+        assert pg.bfs_order("A") == ["A", "B", "C", "D", "E"]
+        pg.graph.add_edge("A", "F")
+        assert pg.graph.get_version() != version
+        assert pg.bfs_order("A") == ["A", "B", "C", "F", "D", "E"]
+        pg.graph = build_graph()
+        assert pg.bfs_order("A") == ["A", "B", "C", "D", "E"]
+
+    def test_unknown_start_vertex(self):
+        """Test traversal from a missing vertex is empty."""
+        pg = GraphPlayground()
+        pg.graph = build_graph()
+        assert pg.bfs_order("Z") == []
+        assert pg.dfs_order("Z") == []
+
+
+class TestTraversalSteps:
+    """Test cases for the state recorded in BFS/DFS steps."""
+
+    def test_bfs_step_snapshots(self):
+        """Test BFS steps keep the state they were recorded with."""
+        steps = BFS().execute(build_graph(), "A", visualize=False)
+        assert steps[0]["queue"] == ["A"]
+        assert steps[0]["traversal_order"] == []
+        assert steps[1]["queue"] == []
+        assert steps[1]["traversal_order"] == ["A"]
+        assert steps[-1]["traversal_order"] == ["A", "B", "C", "D", "E"]
+        assert set(steps[-1]["visited"]) == {"A", "B", "C", "D", "E"}
+
+    def test_dfs_step_snapshots(self):
+        """Test DFS steps keep the stack and path they were recorded with."""
+        steps = DFS().execute(build_graph(), "A", visualize=False)
+        pushes = [s for s in steps if s["phase"] == "discovery"]
+        assert pushes[0]["stack"] == ["C"]
+        assert pushes[1]["stack"] == ["C", "B"]
+        assert "B" in pushes[1]["stack"]
+        assert pushes[1]["path"] == ["A"]
+        assert steps[-1]["traversal_order"] == ["A", "B", "D", "C", "E"]
+
+    @pytest.mark.parametrize("algorithm", [BFS, DFS])
+    def test_without_step_recording(self, algorithm):
+        """Test record_steps=False returns only the recorded run's final step."""
+        full = algorithm().execute(build_graph(), "A", visualize=False)
+        steps = algorithm().execute(build_graph(), "A", visualize=False, record_steps=False)
+        assert len(steps) == 1
+        assert steps[0]["phase"] == "complete"
+        del steps[0]["data_structure"], full[-1]["data_structure"]
+        assert steps[0] == full[-1]
+
+    @pytest.mark.parametrize("algorithm", [BFS, DFS])
+    def test_without_recording_unknown_start(self, algorithm):
+        """Test record_steps=False from a missing vertex matches the full run."""
+        full = algorithm().execute(build_graph(), "Z", visualize=False)
+        steps = algorithm().execute(build_graph(), "Z", visualize=False, record_steps=False)
+        assert steps[-1]["traversal_order"] == full[-1]["traversal_order"] == ["Z"]
+
+    @pytest.mark.parametrize("algorithm", [BFS, DFS])
+    def test_count_steps(self, algorithm):
+        """Test count_steps takes the start vertex and matches a recorded run."""
+        full = algorithm().execute(build_graph(), "A", visualize=False)
+        assert algorithm().count_steps(build_graph(), "A")["total_steps"] == len(full)
+
+    @pytest.mark.parametrize("algorithm", [BFS, DFS])
+    def test_execute_iter(self, algorithm):
+        """Test streamed steps match execute() and can be stopped early."""
+        full = algorithm().execute(build_graph(), "A", visualize=False)
+        streamed = list(algorithm().execute_iter(build_graph(), "A", visualize=False))
+        assert [s["description"] for s in streamed] == [s["description"] for s in full]
+        first = next(algorithm().execute_iter(build_graph(), "A", visualize=False))
+        assert first["phase"] == "initialization"
+
+    @pytest.mark.parametrize("algorithm", [BFS, DFS])
+    def test_requires_graph(self, algorithm):
+        """Test traversals reject data structures that are not graphs."""
+        with pytest.raises(TypeError):
+            algorithm().execute([1, 2, 3], 1, visualize=False)
+        with pytest.raises(TypeError):
+            algorithm().execute_iter([1, 2, 3], 1, visualize=False)
+
+
+class TestHasEdge:
+    """Test cases for Graph.has_edge."""
+
+    def test_has_edge(self):
+        """Test edge lookups in directed and undirected graphs."""
+        undirected = build_graph()
+        assert undirected.has_edge("A", "B") and undirected.has_edge("B", "A")
+        assert not undirected.has_edge("A", "E")
+        assert not undirected.has_edge("Z", "A")
+
+        directed = build_graph(directed=True)
+        assert directed.has_edge("A", "B")
+        assert not directed.has_edge("B", "A")
+        directed.add_edge("B", "A")
+        assert directed.has_edge("B", "A")
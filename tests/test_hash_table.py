@@ -0,0 +1,90 @@
+"""
+Unit tests for HashTable data structure.
+"""
+
+import pytest
+from src.data_structures.hash_table import HashTable
+
+
+class TestHashTable:
+    """Test cases for HashTable."""
+
+    def test_insert_and_get(self):
+        """Test insert and get operations."""
+        table = HashTable()
+        table.insert("apple", 1)
+        table.insert("banana", 2)
+        assert table.get("apple") == 1
+        assert table.get("banana") == 2
+        assert table.get("cherry") is None
+        assert len(table) == 2
+
+    def test_resize(self):
+        """Test the table doubles when the load factor is exceeded."""
+        table = HashTable(initial_capacity=4, load_factor_threshold=0.75)
+        for i in range(4):
+            table.insert(f"key{i}", i)
+        assert table.get_capacity() == 8
+        assert all(table.get(f"key{i}") == i for i in range(4))
+
+    def test_batch_insert_matches_sequential(self):
+        """Test batch insert ends in the same state as one-by-one inserts."""
+        keys = [f"key{i}" for i in range(20)]
+        values = list(range(20))
+
+        sequential = HashTable(initial_capacity=4)
+        for key, value in zip(keys, values):
+            sequential.insert(key, value)
+
+        batched = HashTable(initial_capacity=4)
+        batched.batch_insert(keys, values)
+
+        assert len(batched) == len(sequential)
+        assert batched.get_capacity() == sequential.get_capacity()
+        assert batched.get_load_factor() <= 0.75
+        assert all(batched.get(k) == v for k, v in zip(keys, values))
+
+    def test_batch_insert_resizes_once(self):
+        """Test batch insert triggers at most one resize."""
+        table = HashTable(initial_capacity=2)
+        table.batch_insert([f"key{i}" for i in range(50)], list(range(50)))
+        resizes = [op for op in table._operation_history if op["event"] == "resize"]
+        assert len(resizes) == 1
+
+    def test_batch_insert_rejects_non_positive_threshold(self):
+        """Test batch insert refuses a threshold no capacity can satisfy."""
+        table = HashTable(initial_capacity=4, load_factor_threshold=0)
+        with pytest.raises(ValueError):
+            table.batch_insert(["a", "b"], [1, 2])
+        assert len(table) == 0
+
+    def test_batch_insert_rejects_length_mismatch(self):
+        """Test batch insert refuses keys without matching values."""
+        table = HashTable()
+        with pytest.raises(ValueError):
+            table.batch_insert(["a", "b", "c"], [1, 2])
+        assert len(table) == 0
+
+    def test_delete(self):
+        """Test delete operation."""
+        table = HashTable()
+        table.insert("apple", 1)
+        assert table.delete("apple")
+        assert not table.delete("apple")
+        assert len(table) == 0
+
+
+class TestHashTablePlayground:
+    """Test cases for the step results of HashTablePlayground."""
+
+    def test_insert_and_get_steps_carry_value(self):
+        """Test the final insert/get steps report the stored value."""
+        from src.playground.hash_table_playground import HashTablePlayground
+
+        pg = HashTablePlayground(initial_capacity=2)
+        for key in ["a", "b", "c"]:
+            steps = pg.insert(key, f"value_{key}")
+            assert steps[-1]["value"] == f"value_{key}"
+
+        assert pg.get("b")[-1]["value"] == "value_b"
+        assert pg.get("missing")[-1]["found"] is False
@@ -0,0 +1,43 @@
+"""
+Unit tests for InputBuilder string parsing.
+"""
+
+import pytest
+from src.playground.input_builder import InputBuilder
+
+
+class TestFromString:
+    """Test cases for InputBuilder.from_string."""
+
+    @pytest.mark.parametrize(
+        "text, expected",
+        [
+            ("5, 2, 8, 1, 9", [5, 2, 8, 1, 9]),
+            ("5,,2,", [5, 2]),
+            ("1.5, 2", [1.5, 2.0]),
+            ("a, b", ["a", "b"]),
+            ("", []),
+            ("99999999999999999999999, 1", [99999999999999999999999, 1]),
+            ("  ,  ", []),
+            ("+", ["+"]),
+            ("1,-", ["1", "-"]),
+            ("- 5, 3", ["- 5", "3"]),
+        ],
+    )
+    def test_parse(self, text, expected):
+        """Test integers, floats, strings and malformed fields."""
+        builder = InputBuilder()
+        builder.from_string(text)
+        assert builder.get_data() == expected
+
+    def test_parsed_integers_are_python_ints(self):
+        """Test parsed integers are stored as plain Python ints."""
+        builder = InputBuilder()
+        builder.from_string("3, 1, 2")
+        assert all(type(x) is int for x in builder.get_data())
+
+    def test_custom_separator(self):
+        """Test parsing with a non-comma separator."""
+        builder = InputBuilder()
+        builder.from_string("1;2;3", separator=";")
+        assert builder.get_data() == [1, 2, 3]
@@ -50,6 +50,22 @@ class TestLinearSearch:
         assert len(steps) > 0
         # Should complete without error even if target not found
 
+    def test_without_recording_steps(self):
+        """Test the final step matches a full run when steps are not recorded."""
+        import numpy as np
+
+        data = [3, 1, 4, 1, 5, 9, 2, 6]
+        searcher = LinearSearch()
+        for container in (Array(data), np.array(data)):
+            for target in (1, 6, 7):
+                full = searcher.execute(container, target, visualize=False)
+                steps = searcher.execute(
+                    container, target, visualize=False, record_steps=False
+                )
+                assert len(steps) == 1
+                for key in ('step_number', 'description', 'current_index', 'found_index'):
+                    assert steps[0][key] == full[-1][key]
+
 
 class TestBinarySearch:
     """Test cases for Binary Search."""
@@ -96,6 +112,49 @@ class TestBinarySearch:
         steps = searcher.execute(arr, 7, visualize=False)
         assert len(steps) > 0
 
+    def test_found_index(self):
+        """Test the search reports the index it found."""
+        arr = Array([1, 3, 5, 7, 9, 11, 13])
+        searcher = BinarySearch()
+        searcher.execute(arr, 11, visualize=False)
+        assert searcher.get_found_index() == 5
+        searcher.execute(arr, 4, visualize=False)
+        assert searcher.get_found_index() == -1
+
+    def test_without_recording_steps(self):
+        """Test only the final step is returned when steps are not recorded."""
+        arr = Array([1, 3, 5, 7, 9, 11, 13])
+        searcher = BinarySearch()
+        full = searcher.execute(arr, 11, visualize=False)
+        steps = searcher.execute(arr, 11, visualize=False, record_steps=False)
+        assert len(steps) == 1
+        assert steps[0] == full[-1]
+        assert searcher.get_found_index() == 5
+
+        steps = searcher.execute(arr, 4, visualize=False, record_steps=False)
+        assert len(steps) == 1
+        assert steps[0]["found_index"] == -1
+
+    def test_count_steps(self):
+        """Test count_steps takes the target and matches a recorded run."""
+        arr = Array([1, 3, 5, 7, 9, 11, 13])
+        for target in (11, 4):
+            steps = BinarySearch().execute(arr, target, visualize=False)
+            stats = BinarySearch().count_steps(arr, target)
+            assert stats["total_steps"] == len(steps)
+            assert stats["comparisons"] == sum(1 for s in steps if s.get("comparing"))
+
+    def test_execute_iter(self):
+        """Test steps can be streamed lazily without being stored."""
+        arr = Array([1, 3, 5, 7, 9, 11, 13])
+        searcher = BinarySearch()
+        expected = list(searcher.execute(arr, 11, visualize=False))
+        stream = searcher.execute_iter(arr, 11, visualize=False)
+        assert searcher.get_steps() == []
+        assert next(stream) == expected[0]
+        assert list(stream) == expected[1:]
+        assert searcher.get_steps() == []
+
 
 class TestTernarySearch:
     """Test cases for Ternary Search."""
@@ -135,6 +194,16 @@ class TestTernarySearch:
         steps = searcher.execute(arr, 7, visualize=False)
         assert len(steps) > 0
 
+    def test_without_recording_steps(self):
+        """Test only the final step is returned when steps are not recorded."""
+        arr = Array(list(range(0, 60, 3)))
+        searcher = TernarySearch()
+        for target in (0, 18, 39, 57, 20, 100):
+            full = searcher.execute(arr, target, visualize=False)
+            steps = searcher.execute(arr, target, visualize=False, record_steps=False)
+            assert len(steps) == 1
+            assert steps[0] == full[-1]
+
 
 class TestExponentialSearch:
     """Test cases for Exponential Search."""
@@ -173,3 +242,13 @@ class TestExponentialSearch:
         searcher = ExponentialSearch()
         steps = searcher.execute(arr, 7, visualize=False)
         assert len(steps) > 0
+
+    def test_without_recording_steps(self):
+        """Test only the final step is returned when steps are not recorded."""
+        arr = Array(list(range(0, 100, 3)))
+        searcher = ExponentialSearch()
+        for target in (0, 48, 51, 50, 200):
+            full = searcher.execute(arr, target, visualize=False)
+            steps = searcher.execute(arr, target, visualize=False, record_steps=False)
+            assert len(steps) == 1
+            assert steps[0] == full[-1]
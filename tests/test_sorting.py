@@ -2,14 +2,26 @@
 Unit tests for sorting algorithms.
 """
 
+from functools import partial
+
 import pytest
 from src.data_structures.array import Array
+from src.visualization.step_views import ArrayTimeline
 from src.algorithms.sorting.bubble_sort import BubbleSort
 from src.algorithms.sorting.insertion_sort import InsertionSort
 from src.algorithms.sorting.selection_sort import SelectionSort
 from src.algorithms.sorting.merge_sort import MergeSort
 from src.algorithms.sorting.quick_sort import QuickSort
 from src.algorithms.sorting.heap_sort import HeapSort
+from src.algorithms.sorting._kernels import (
+    bubble_sort_kernel,
+    heap_sort_kernel,
+    insertion_sort_kernel,
+    merge_sort_kernel,
+    natural_merge_sort_kernel,
+    quick_sort_kernel,
+    selection_sort_kernel,
+)
 
 
 class TestBubbleSort:
@@ -51,6 +63,13 @@ class TestBubbleSort:
         sorter.execute(arr, visualize=False)
         assert arr.to_list() == [5]
 
+    def test_sorted_indices_per_pass(self):
+        """Test each step reports the suffix sorted by the earlier passes."""
+        steps = BubbleSort().execute(Array([4, 3, 2, 1]), visualize=False)
+        assert steps[0]["sorted"] == []
+        assert steps[-2]["sorted"] == [2, 3]
+        assert steps[-1]["sorted"] == [0, 1, 2, 3]
+
 
 class TestInsertionSort:
     """Test cases for Insertion Sort."""
@@ -129,6 +148,15 @@ class TestSelectionSort:
         sorter.execute(arr, visualize=False)
         assert arr.to_list() == [5]
 
+    def test_sorted_indices_per_pass(self):
+        """Test each step reports the prefix sorted by the earlier passes."""
+        steps = SelectionSort().execute(Array([3, 1, 2]), visualize=False)
+        assert steps[0]["sorted"] == []
+        assert [s["sorted"] for s in steps if s["description"].startswith("Element")] == [
+            [0], [0, 1], [0, 1, 2]
+        ]
+        assert steps[-1]["sorted"] == [0, 1, 2]
+
 
 class TestMergeSort:
     """Test cases for Merge Sort."""
@@ -168,6 +196,37 @@ class TestMergeSort:
         sorter.execute(arr, visualize=False)
         assert arr.to_list() == [5]
 
+    def test_natural_runs(self):
+        """Test sorting by natural runs, including descending runs and duplicates."""
+        import random
+
+        rng = random.Random(11)
+        cases = [[3, 1, 4, 1, 5, 9, 2, 6], [5, 4, 3, 2, 1], [1, 2, 2, 1, 0, 7, 8]]
+        cases += [[rng.randrange(6) for _ in range(rng.randrange(40))] for _ in range(30)]
+        for case in cases:
+            arr = Array(case)
+            MergeSort(natural_runs=True).execute(arr, visualize=False)
+            assert arr.to_list() == sorted(case)
+
+    def test_natural_runs_sorted_input(self):
+        """Test already sorted input is a single run with nothing to merge."""
+        steps = MergeSort(natural_runs=True).execute(Array(list(range(50))), visualize=False)
+        assert len(steps) == 2
+        assert steps[0]["description"] == "Found ascending run [0..49]"
+
+    def test_natural_runs_gallop(self):
+        """Test a merge where one run keeps winning moves the rest in one step."""
+        data = list(range(50, 100)) + list(range(50))
+        arr = Array(data)
+        steps = MergeSort(natural_runs=True).execute(arr, visualize=False)
+        assert arr.to_list() == sorted(data)
+        gallops = [s for s in steps if s["description"].startswith("Galloping")]
+        assert [s["description"] for s in gallops] == [
+            "Galloping: moved 43 elements of the right half to [7..49]"
+        ]
+        assert gallops[0]["current"] == list(range(7, 50))
+        assert natural_merge_sort_kernel(list(data)) == len(steps)
+
 
 class TestQuickSort:
     """Test cases for Quick Sort."""
@@ -207,6 +266,38 @@ class TestQuickSort:
         sorter.execute(arr, visualize=False)
         assert arr.to_list() == [5]
 
+    def test_median_of_three_on_sorted_input(self):
+        """Test sorted and reversed input split evenly instead of recursing n deep."""
+        for data in (list(range(1200)), list(range(1200, 0, -1))):
+            arr = Array(data)
+            steps = QuickSort().execute(arr, visualize=False)
+            assert arr.to_list() == sorted(data)
+            assert len(steps) < 40000
+
+    def test_depth_limit_falls_back_to_heap_sort(self):
+        """Test duplicate-heavy input is finished by heap sort instead of deep recursion."""
+        for data in ([7] * 1500, [i % 3 for i in range(1500)]):
+            arr = Array(data)
+            steps = QuickSort().execute(arr, visualize=False)
+            assert arr.to_list() == sorted(data)
+            assert any(s["description"].startswith("Depth limit reached") for s in steps)
+            assert quick_sort_kernel(list(data)) == len(steps)
+
+    def test_quiet_skips_elements_left_in_place(self):
+        """Test verbose=False drops only the steps that change nothing."""
+        data = [3, 1, 4, 1, 5, 9, 2, 6, 5, 3]
+        full = QuickSort().execute(Array(data), visualize=False)
+        arr = Array(data)
+        quiet = QuickSort(verbose=False).execute(arr, visualize=False)
+        assert arr.to_list() == sorted(data)
+        kept = [
+            s["description"] for s in full
+            if s["description"].startswith("Pivot")
+            or not s["description"].endswith("is already in correct position")
+        ]
+        assert len(quiet) < len(full)
+        assert [s["description"] for s in quiet] == kept
+
 
 class TestHeapSort:
     """Test cases for Heap Sort."""
@@ -246,3 +337,148 @@ class TestHeapSort:
         sorter.execute(arr, visualize=False)
         assert arr.to_list() == [5]
 
+
+class TestSortingKernels:
+    """Test cases for the step-free sorting kernels."""
+
+    CASES = [[], [5], [1, 2, 3, 4, 5], [5, 4, 3, 2, 1], [3, 1, 4, 1, 5, 9, 2, 6]]
+
+    @pytest.mark.parametrize(
+        "kernel, algorithm",
+        [
+            (bubble_sort_kernel, BubbleSort),
+            (insertion_sort_kernel, InsertionSort),
+            (selection_sort_kernel, SelectionSort),
+            (heap_sort_kernel, HeapSort),
+            (quick_sort_kernel, QuickSort),
+            (partial(quick_sort_kernel, verbose=False), partial(QuickSort, verbose=False)),
+            (merge_sort_kernel, MergeSort),
+            (natural_merge_sort_kernel, partial(MergeSort, natural_runs=True)),
+        ],
+    )
+    def test_matches_visualized_algorithm(self, kernel, algorithm):
+        """Test kernels sort correctly and report the same step count."""
+        for case in self.CASES:
+            data = case.copy()
+            step_count = kernel(data)
+            steps = algorithm().execute(Array(case), visualize=False)
+            assert data == sorted(case)
+            assert step_count == len(steps)
+
+    def test_insertion_kernel_is_stable(self):
+        """Test equal elements keep their order in the insertion kernel."""
+        class Keyed:
+            def __init__(self, key, tag):
+                self.key, self.tag = key, tag
+
+            def __lt__(self, other):
+                return self.key < other.key
+
+            def __gt__(self, other):
+                return self.key > other.key
+
+        data = [(3, "a"), (1, "b"), (3, "c"), (2, "d"), (1, "e")]
+        keyed = [Keyed(k, tag) for k, tag in data]
+        insertion_sort_kernel(keyed)
+        assert [item.tag for item in keyed] == ["b", "e", "d", "a", "c"]
+
+    def test_merge_kernel_matches_merge_order(self):
+        """Test the kernel keeps equal elements in order and counts the same steps."""
+        class Keyed:
+            def __init__(self, key, tag):
+                self.key, self.tag = key, tag
+
+            def __lt__(self, other):
+                return self.key < other.key
+
+            def __le__(self, other):
+                return self.key <= other.key
+
+        keyed = [Keyed(key, tag) for tag, key in enumerate([2, 0, 1, 2, 0, 1, 1, 2, 0, 0, 2])]
+        arr = Array(keyed)
+        steps = MergeSort().execute(arr, visualize=False)
+        data = keyed.copy()
+        assert merge_sort_kernel(data) == len(steps)
+        assert [item.tag for item in data] == [item.tag for item in arr.to_list()]
+        assert [item.tag for item in data] == [1, 4, 8, 9, 2, 5, 6, 0, 3, 7, 10]
+
+    @pytest.mark.parametrize(
+        "algorithm",
+        [BubbleSort, InsertionSort, SelectionSort, HeapSort, QuickSort, MergeSort],
+    )
+    def test_without_recording_steps(self, algorithm):
+        """Test record_steps=False sorts and returns the same final step."""
+        for case in self.CASES:
+            full = algorithm().execute(Array(case), visualize=False)
+            arr = Array(case)
+            steps = algorithm().execute(arr, visualize=False, record_steps=False)
+            assert arr.to_list() == sorted(case)
+            assert len(steps) == 1
+            final = steps[0]
+            assert final["data_structure"].to_list() == sorted(case)
+            assert final["step_number"] == full[-1]["step_number"]
+            assert final["description"] == full[-1]["description"]
+
+
+class TestCountSteps:
+    """Test cases for counting steps without recording them."""
+
+    @pytest.mark.parametrize(
+        "algorithm",
+        [BubbleSort, InsertionSort, SelectionSort, MergeSort, QuickSort, HeapSort],
+    )
+    def test_matches_recorded_steps(self, algorithm):
+        """Test count_steps agrees with the recorded step list."""
+        data = [3, 1, 4, 1, 5, 9, 2, 6]
+        steps = algorithm().execute(Array(data), visualize=False)
+
+        arr = Array(data)
+        stats = algorithm().count_steps(arr)
+
+        assert arr.to_list() == sorted(data)
+        assert stats["total_steps"] == len(steps)
+        assert stats["comparisons"] == sum(1 for s in steps if s.get("comparing"))
+        assert stats["swaps"] == sum(1 for s in steps if s.get("swapping"))
+
+
+class TestArraySnapshots:
+    """Test cases for the array snapshots recorded in sorting steps."""
+
+    def test_timeline_snapshots(self):
+        """Test snapshots read back the contents they were taken at, in any order."""
+        timeline = ArrayTimeline([3, 1, 2])
+        first = timeline.snapshot()
+        timeline.swap(0, 1)
+        second = timeline.snapshot()
+        timeline.set(2, 9)
+        third = timeline.snapshot()
+
+        assert timeline.data == [1, 3, 9]
+        assert third.to_list() == [1, 3, 9]
+        assert first.to_list() == [3, 1, 2]
+        assert second.to_list() == [1, 3, 2]
+        assert len(first) == 3 and first[1] == 1
+
+    def test_snapshot_is_independent(self):
+        """Test writing to a snapshot leaves the timeline and other snapshots alone."""
+        timeline = ArrayTimeline([1, 2])
+        first = timeline.snapshot()
+        second = timeline.snapshot()
+        first.set(0, 5)
+        assert first.to_list() == [5, 2]
+        assert second.to_list() == [1, 2]
+        assert timeline.data == [1, 2]
+        assert first.get_state()["type"] == "Array"
+
+    @pytest.mark.parametrize(
+        "algorithm",
+        [BubbleSort, InsertionSort, SelectionSort, MergeSort, QuickSort, HeapSort],
+    )
+    def test_steps_show_progress(self, algorithm):
+        """Test step snapshots start unsorted and end sorted."""
+        data = [3, 1, 4, 1, 5, 9, 2, 6]
+        steps = algorithm().execute(Array(data), visualize=False)
+        assert steps[-1]["data_structure"].to_list() == sorted(data)
+        # Quick sort may move its first pivot before the first step
+        first = steps[0]["data_structure"].to_list()
+        assert first != sorted(data) and sorted(first) == sorted(data)